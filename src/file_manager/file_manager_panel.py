@@ -1,13 +1,927 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTreeView, QFileSystemModel, QLineEdit, QLabel, QMenu, \
-    QAbstractItemView, QStyle, QDialog, QTreeWidget, QTreeWidgetItem, QMessageBox, QInputDialog, QShortcut, QFileDialog, QAction
-from PyQt5.QtCore import QDir, Qt, pyqtSignal, QStandardPaths, QSortFilterProxyModel, QModelIndex, QObject, QFileInfo, QFileSystemWatcher
+    QAbstractItemView, QStyle, QDialog, QMessageBox, QInputDialog, QShortcut, QFileDialog, QAction
+from PyQt5.QtCore import QDir, Qt, pyqtSignal, QStandardPaths, QSortFilterProxyModel, QModelIndex, QObject, QFileInfo, QFileSystemWatcher, \
+    QTimer, QPersistentModelIndex, QThread, QAbstractTableModel, QCoreApplication
 from PyQt5.QtGui import QContextMenuEvent, QDragEnterEvent, QDropEvent, QKeySequence, QStandardItemModel, QStandardItem, QIcon
 import os
+import errno
+import mmap
+import bisect
+import itertools
 import shutil
+import stat
 import json
-import traceback
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from functools import lru_cache, partial
+from pathlib import PurePath
+from concurrent.futures import ThreadPoolExecutor
 from ..logging_config import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+# 元数据文件超过该大小时使用 mmap 读取
+METADATA_MMAP_THRESHOLD = 64 * 1024
+# 回收站列表每次插入的条目数量
+RECYCLE_BIN_LOAD_CHUNK_SIZE = 500
+# 批量操作失败时提示框中最多列出的条目数
+ERROR_SUMMARY_LIMIT = 50
+# 回收站中不显示的元数据文件：固定名称和后缀
+_SKIP_NAMES = frozenset({'.meta.json', '.meta.json.tmp'})
+# 界面线程、移入回收站和清理过期条目的工作线程都会改写 .meta.json，读取-合并-写回在该锁内完成
+_METADATA_LOCK = threading.Lock()
+_SKIP_SUFFIX = '.metadata'
+# 回收站列表中大小和删除时间的显示格式
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB')
+DISPLAY_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+# 回收站条目数超过该值时按块批量格式化大小和删除时间
+RECYCLE_BIN_BULK_FORMAT_THRESHOLD = 5000
+# 移入回收站的条目以删除时间为前缀命名；用户在回收站中启用自动清理后，超过保留天数的条目由定时任务彻底删除
+RECYCLE_NAME_TIME_FORMAT = '%Y%m%d%H%M%S'
+RECYCLE_NAME_TIME_RE = re.compile(r'^(\d{14})_')
+# 自动清理默认关闭（保留天数为0），启用时建议的保留天数
+RECYCLE_BIN_RETENTION_DAYS = 30
+RECYCLE_BIN_PURGE_INTERVAL_MS = 30 * 60 * 1000
+# 回收站对话框监听到回收站变化后等待该时间（毫秒）再刷新，连续的变化合并为一次
+RECYCLE_BIN_WATCH_DELAY_MS = 200
+# 路径存在性检查结果的有效期（秒）
+EXISTS_CACHE_TTL = 5.0
+# 回收站判断结果缓存的最大条目数，超出时淘汰最久未使用的条目
+RECYCLE_CHECK_CACHE_SIZE = 4096
+# 并行检查路径是否存在的线程池，stat 期间释放 GIL，网络磁盘上的多个检查可以同时等待
+_STAT_POOL = ThreadPoolExecutor(max_workers=8)
+# 文件或文件夹名称中不允许出现的字符
+ILLEGAL_NAME_RE = re.compile(r'[\\/:*?"<>|]')
+ILLEGAL_NAME_CHARS_TEXT = "非法字符包括: / \\ : * ? \" < > |"
+# 沿可见行查找相邻文件时最多检查的行数，超过后改用完整的文件索引
+ADJACENT_VISIBLE_SCAN_LIMIT = 256
+# 拖放移动时查找不重名目标名称的最大尝试次数
+RESERVE_NAME_ATTEMPTS = 1000
+# 恢复展开状态时，展开项超过该数量则改用 expandAll() 后折叠多余项
+EXPAND_ALL_THRESHOLD = 32
+# 支持预览的文件扩展名（小写）
+SUPPORTED_EXTS = frozenset({
+    '.jpg', '.jpeg', '.png', '.bmp', '.gif',  # 图片格式
+    '.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv'  # 视频格式
+})
+# 文件树中记录项类型（'file' 或 'dir'）的数据角色，创建项时写入，遍历时无需再查询文件系统
+ITEM_TYPE_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+def _load_metadata_file(metadata_file):
+    """
+    读取回收站元数据文件，大文件在安装了 orjson 时通过 mmap 直接解析，省去中间的 bytes 拷贝
+
+    Args:
+        metadata_file (str): 元数据文件路径
+
+    Returns:
+        dict: 元数据内容
+    """
+    if orjson is not None and os.path.getsize(metadata_file) > METADATA_MMAP_THRESHOLD:
+        try:
+            with open(metadata_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        except ValueError:
+            # 非 UTF-8 编码写入的旧文件，回退到标准库解析
+            pass
+
+    with open(metadata_file, 'r') as f:
+        return json.load(f)
+
+
+def _write_metadata_file(metadata_file, metadata):
+    """
+    写入回收站元数据文件：先写临时文件再原子替换，写入中断时不会留下不完整的文件；
+    安装了 orjson 时用其序列化，文件编码与标准库写入的一致
+
+    Args:
+        metadata_file (str): 元数据文件路径
+        metadata (dict): 元数据内容
+    """
+    if orjson is not None:
+        content = orjson.dumps(metadata, option=orjson.OPT_INDENT_2).decode('utf-8')
+    else:
+        content = json.dumps(metadata, indent=2, ensure_ascii=False)
+
+    temp_file = metadata_file + '.tmp'
+    try:
+        with open(temp_file, 'w') as f:
+            f.write(content)
+        os.replace(temp_file, metadata_file)
+    except BaseException:
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+        raise
+
+
+def _update_metadata_file(metadata_file, added=None, removed=()):
+    """
+    在锁内重新读取元数据文件，合并新增记录、移除指定记录后原子写回，其他线程在此期间写入的记录不会被覆盖；
+    没有剩余记录时删除元数据文件，内容没有变化时不改写
+
+    Args:
+        metadata_file (str): 元数据文件路径
+        added (dict): 要添加的 文件名 -> 原始路径 记录
+        removed (iterable): 要移除的文件名
+
+    Returns:
+        dict: 更新后的元数据内容
+    """
+    with _METADATA_LOCK:
+        try:
+            metadata = _load_metadata_file(metadata_file)
+        except FileNotFoundError:
+            metadata = {}
+
+        changed = bool(added)
+        if added:
+            metadata.update(added)
+        for name in removed:
+            if metadata.pop(name, None) is not None:
+                changed = True
+
+        if changed:
+            if metadata:
+                _write_metadata_file(metadata_file, metadata)
+            else:
+                try:
+                    os.remove(metadata_file)
+                    logger.debug("删除空的元数据文件: %s", metadata_file)
+                except FileNotFoundError:
+                    pass
+        return metadata
+
+
+def _remove_bin_if_empty(recycle_bin_path):
+    """
+    回收站中只剩元数据文件（或为空）时删除元数据文件和回收站目录，在元数据锁内完成，
+    不会删除其他线程刚写入的元数据
+
+    Args:
+        recycle_bin_path (str): 回收站路径
+
+    Returns:
+        bool: 回收站目录已被删除返回True，目录不存在时抛出 FileNotFoundError
+    """
+    with _METADATA_LOCK:
+        items = os.listdir(recycle_bin_path)
+        if any(item not in _SKIP_NAMES for item in items):
+            return False
+
+        # 目录为空，删除元数据文件（包括写入中断遗留的临时文件）和该目录
+        for item in items:
+            os.remove(os.path.join(recycle_bin_path, item))
+            logger.debug("删除空回收站的元数据文件: %s", item)
+        os.rmdir(recycle_bin_path)
+        return True
+
+
+def _scan_directory(dir_path, skip_name):
+    """
+    扫描单层目录，直接使用 os.scandir 目录条目缓存的类型和 stat 信息
+
+    Args:
+        dir_path (str): 目录路径
+        skip_name (str): 需要跳过的子目录名（回收站）
+
+    Returns:
+        tuple: (该层文件总字节数, 子目录路径列表)
+    """
+    size = 0
+    subdirs = []
+    try:
+        it = os.scandir(dir_path)
+    except OSError as e:
+        logger.debug("无法访问目录: %s, 错误: %s", dir_path, e)
+        return size, subdirs
+
+    with it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != skip_name:
+                        subdirs.append(entry.path)
+                else:
+                    size += entry.stat(follow_symlinks=False).st_size
+            except OSError as e:
+                logger.debug("无法访问文件: %s, 错误: %s", entry.path, e)
+    return size, subdirs
+
+
+def _list_subdirs(dir_path, skip_name):
+    """
+    列出单层目录下的子目录（不跟随符号链接）
+
+    Args:
+        dir_path (str): 目录路径
+        skip_name (str): 需要跳过的子目录名（回收站）
+
+    Returns:
+        list: 子目录路径列表
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            return [entry.path for entry in it
+                    if entry.name != skip_name and entry.is_dir(follow_symlinks=False)]
+    except OSError as e:
+        logger.debug("无法访问目录: %s, 错误: %s", dir_path, e)
+        return []
+
+
+def _walk_folder_size(folder_path, skip_name):
+    """
+    以显式栈迭代遍历目录，统计总字节数
+
+    Args:
+        folder_path (str): 文件夹路径
+        skip_name (str): 需要跳过的子目录名（回收站）
+
+    Returns:
+        int: 文件夹总字节数
+    """
+    total_size = 0
+    stack = [folder_path]
+    while stack:
+        size, subdirs = _scan_directory(stack.pop(), skip_name)
+        total_size += size
+        stack.extend(subdirs)
+    return total_size
+
+
+def _folder_size_bytes(folder_path, skip_name):
+    """
+    计算文件夹总字节数：顶层文件直接累加，各子目录作为独立任务并行遍历，线程在 scandir/stat 系统调用期间释放 GIL
+
+    Args:
+        folder_path (str): 文件夹路径
+        skip_name (str): 需要跳过的子目录名（回收站）
+
+    Returns:
+        int: 文件夹总字节数
+    """
+    total_size, subdirs = _scan_directory(folder_path, skip_name)
+    if subdirs:
+        with ThreadPoolExecutor(max_workers=min(32, len(subdirs))) as executor:
+            total_size += sum(executor.map(_walk_folder_size, subdirs, itertools.repeat(skip_name)))
+    return total_size
+
+
+def _filter_existing_paths(paths, stat_cache=None):
+    """
+    过滤出仍然存在的路径：按父目录分组，每个父目录只列一次目录项，代替逐个 stat
+
+    Args:
+        paths (list): 路径列表
+        stat_cache (dict): 不为None时写入 路径 -> os.stat_result，供后续使用同一路径的元数据时复用
+
+    Returns:
+        list: 存在的路径列表，保持原有顺序
+    """
+    groups = {}
+    existing = {}
+    for path in paths:
+        if os.path.basename(path):
+            groups.setdefault(os.path.dirname(path), []).append(path)
+        else:
+            # 以分隔符结尾的路径没有文件名部分，直接检查
+            path_stat = _stat_or_none(path)
+            if path_stat is not None:
+                existing[path] = path_stat
+
+    # 各父目录可能位于不同的（网络）磁盘上，并行列目录，总耗时取决于最慢的一个
+    group_items = list(groups.items())
+    if len(group_items) > 1:
+        results = _STAT_POOL.map(_existing_in_group, group_items)
+    else:
+        results = map(_existing_in_group, group_items)
+    for group_existing in results:
+        existing.update(group_existing)
+    if stat_cache is not None:
+        stat_cache.update(existing)
+    return [path for path in paths if path in existing]
+
+
+def _existing_in_group(group_item):
+    """
+    列一次父目录，返回同一父目录下仍然存在的路径及其 stat 信息，可以在工作线程中调用
+
+    stat 信息取自目录项（Windows 上列目录时已经带回，不需要额外的系统调用）
+
+    Args:
+        group_item (tuple): (父目录, 该目录下的路径列表)
+
+    Returns:
+        list: (路径, os.stat_result) 列表
+    """
+    parent, group = group_item
+    try:
+        with os.scandir(parent or '.') as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        found = [(path, _stat_or_none(path)) for path in group]
+        return [(path, path_stat) for path, path_stat in found if path_stat is not None]
+
+    found = []
+    for path in group:
+        entry = entries.get(os.path.basename(path))
+        if entry is None:
+            # 目录项按名称精确匹配；大小写不敏感的文件系统（Windows、默认的 macOS）上保存的路径
+            # 大小写可能与实际不同，没有精确匹配时再 stat 确认
+            path_stat = _stat_or_none(path)
+            if path_stat is not None:
+                found.append((path, path_stat))
+            continue
+        try:
+            found.append((path, entry.stat()))
+        except OSError:
+            # 失效的符号链接等无法访问的条目视为不存在
+            continue
+    return found
+
+
+@lru_cache(maxsize=4096)
+def _norm(path):
+    """
+    标准化路径（normpath + normcase），纯字符串运算，结果只取决于输入，可以安全缓存
+
+    Args:
+        path (str): 文件或文件夹路径
+
+    Returns:
+        str: 标准化后的路径
+    """
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _fast_ext(path):
+    """
+    获取小写扩展名，用 str.rfind 代替 os.path.splitext，文件名以点开头（如 .png）时视为没有扩展名
+
+    Args:
+        path (str): 文件路径或文件名
+
+    Returns:
+        str: 带点的小写扩展名，没有扩展名时返回空字符串
+    """
+    dot = path.rfind('.')
+    sep = path.rfind(os.sep)
+    if os.altsep:
+        sep = max(sep, path.rfind(os.altsep))
+    return path[dot:].lower() if dot > sep + 1 else ''
+
+
+def _is_supported_ext(path):
+    """
+    只根据扩展名判断文件是否支持预览，不访问文件系统
+
+    Args:
+        path (str): 文件路径
+
+    Returns:
+        bool: 扩展名受支持返回True
+    """
+    return _fast_ext(path) in SUPPORTED_EXTS
+
+
+@lru_cache(maxsize=4096)
+def _path_parts(path):
+    """
+    将路径转换为标准化的分段元组，用于按路径层级比较，大小写不敏感的系统上同时统一大小写
+
+    同一批根路径和选中文件会被反复查询，缓存后重复调用不再构造 PurePath
+
+    Args:
+        path (str): 文件或文件夹路径
+
+    Returns:
+        tuple: 路径分段元组
+    """
+    return PurePath(_norm(path)).parts
+
+
+def _index_is_dir(index, file_path):
+    """
+    判断索引对应的项是否为文件夹，优先使用建项时记录的项类型，避免点击、拖拽时访问文件系统
+
+    Args:
+        index (QModelIndex): 项目索引（任意列）
+        file_path (str): 项目对应的路径
+
+    Returns:
+        bool: 是文件夹返回True
+    """
+    item_type = index.sibling(index.row(), 0).data(ITEM_TYPE_ROLE)
+    if item_type is not None:
+        return item_type == 'dir'
+    return QFileInfo(file_path).isDir()
+
+
+def _stat_or_none(path):
+    """
+    获取路径的 stat 信息，一次系统调用同时得到是否存在和文件类型
+
+    Args:
+        path (str): 路径
+
+    Returns:
+        os.stat_result or None: 路径不存在或无法访问时返回None
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _reserve_destination(target_dir, name, is_dir):
+    """
+    在目标目录中原子地占用一个不重名的路径：文件用 O_CREAT|O_EXCL 创建空占位文件，文件夹用 mkdir 创建空文件夹，
+    重名时依次尝试 名称_1、名称_2 ...，第一次重名后读取一次目录，跳过已知存在的名称
+
+    Args:
+        target_dir (str): 目标目录
+        name (str): 期望的名称
+        is_dir (bool): 要占用的是否为文件夹
+
+    Returns:
+        str: 已占用的路径，调用方随后用源文件替换它
+
+    Raises:
+        FileExistsError: 尝试次数超过上限时抛出
+    """
+    base_name, ext = os.path.splitext(name)
+    existing_names = None
+    for counter in range(RESERVE_NAME_ATTEMPTS):
+        candidate = name if counter == 0 else f"{base_name}_{counter}{ext}"
+        if existing_names is not None and os.path.normcase(candidate) in existing_names:
+            continue
+        path = os.path.join(target_dir, candidate)
+        try:
+            if is_dir:
+                os.mkdir(path)
+            else:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600))
+            return path
+        except FileExistsError:
+            if existing_names is None:
+                with os.scandir(target_dir) as it:
+                    existing_names = {os.path.normcase(entry.name) for entry in it}
+    raise FileExistsError(errno.EEXIST, "没有可用的目标名称", os.path.join(target_dir, name))
+
+
+def _move_into_dir(source_path, target_dir, is_dir, name=None):
+    """
+    将文件或文件夹移动到目标目录中，重名时自动编号
+
+    Args:
+        source_path (str): 源路径
+        target_dir (str): 目标目录
+        is_dir (bool): 源是否为文件夹
+        name (str): 目标名称，为None时使用源的名称
+
+    Returns:
+        str: 移动后的路径
+    """
+    # 先原子地占用一个不重名的目标路径，再用源替换占位项
+    destination = _reserve_destination(target_dir, name or os.path.basename(source_path), is_dir)
+    try:
+        os.replace(source_path, destination)
+    except OSError:
+        # 跨文件系统，或 Windows 上不能用文件夹替换文件夹：移除占位项后再移动
+        if is_dir:
+            os.rmdir(destination)
+        else:
+            os.remove(destination)
+        shutil.move(source_path, destination)
+    return destination
+
+
+def _stat_or_warn(path, message):
+    """
+    获取路径的 stat 信息，路径不存在时记录警告，代替先 exists 再 isdir 的多次 stat
+
+    Args:
+        path (str): 路径
+        message (str): 路径不存在时的警告信息
+
+    Returns:
+        os.stat_result or None: 路径不存在时返回None
+    """
+    st = _stat_or_none(path)
+    if st is None:
+        logger.warning("%s: %s", message, path)
+    return st
+
+
+def _iter_bin_entries(root_path):
+    """
+    一次深度优先遍历同时查找回收站目录并产出其中的条目：根路径和名为 delete 的目录视为回收站，
+    访问到回收站时直接产出其中的文件和文件夹（跳过元数据文件），每个目录只列一次
+
+    只进入名为 delete 的目录和回收站中直接包含的文件夹（被删除的文件夹，用于查找其中的 delete 目录），
+    不遍历被删除文件夹的全部内容；更深层的回收站会随其所在的文件夹一起还原或删除
+
+    同一回收站的条目连续产出；不跟随符号链接目录，无法读取的目录与 os.walk 一样跳过
+
+    Args:
+        root_path (str): 回收站根路径
+
+    Yields:
+        tuple: (回收站路径, os.DirEntry)
+    """
+    skip_names = _SKIP_NAMES
+    stack = [(root_path, True)]
+    while stack:
+        dir_path, is_bin = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name == "delete":
+                            subdirs.append((entry.path, True))
+                        elif is_bin:
+                            subdirs.append((entry.path, False))
+                    if not is_bin or name in skip_names or name.endswith(_SKIP_SUFFIX):
+                        continue
+                    if entry.is_file() or entry.is_dir():
+                        yield dir_path, entry
+        except OSError:
+            continue
+
+        # 逆序入栈，保持与 os.walk 相同的自上而下的访问顺序
+        stack.extend(reversed(subdirs))
+
+
+def _ask_yes_no(parent, title, text):
+    """
+    弹出“是/否”确认对话框，回车对应“是”、ESC 对应“否”，由 Qt 直接处理按键
+
+    Args:
+        parent (QWidget): 父窗口
+        title (str): 对话框标题
+        text (str): 提示内容
+
+    Returns:
+        int: 用户点击的按钮（QMessageBox.Yes 或 QMessageBox.No）
+    """
+    box = QMessageBox(QMessageBox.Question, title, text, QMessageBox.Yes | QMessageBox.No, parent)
+    box.setDefaultButton(QMessageBox.Yes)
+    box.setEscapeButton(QMessageBox.No)
+    return box.exec_()
+
+
+def _format_error_summary(title, errors):
+    """
+    生成批量操作失败的提示文本，最多列出前 ERROR_SUMMARY_LIMIT 条
+
+    Args:
+        title (str): 提示标题
+        errors (list): 失败信息列表
+
+    Returns:
+        str: 提示文本
+    """
+    lines = errors[:ERROR_SUMMARY_LIMIT]
+    if len(errors) > ERROR_SUMMARY_LIMIT:
+        lines.append(f"... 另有 {len(errors) - ERROR_SUMMARY_LIMIT} 项失败")
+    return f"{title}（{len(errors)} 项）:\n" + "\n".join(lines)
+
+
+def _scan_recycle_bin(root_path):
+    """
+    扫描回收站根路径下的所有回收站（含嵌套的 delete 目录）并获取条目的大小和修改时间，
+    只访问文件系统、不创建 Qt 对象，可以在工作线程中调用
+
+    Args:
+        root_path (str): 回收站根路径
+
+    Returns:
+        list: (回收站路径, 名称, 完整路径, 大小, 修改时间) 列表，同一回收站的条目相邻
+    """
+    rows = []
+    for recycle_bin_path, entry in _iter_bin_entries(root_path):
+        try:
+            # Windows 上列目录时已经带回大小和时间，不需要额外的系统调用
+            item_stat = entry.stat(follow_symlinks=False)
+        except OSError:
+            # 扫描期间被删除的条目直接跳过
+            continue
+        rows.append((recycle_bin_path, entry.name, entry.path, item_stat.st_size, item_stat.st_mtime))
+    return rows
+
+
+def _scan_bin_entries(recycle_bin_path):
+    """
+    只列出单个回收站中直接包含的条目（跳过元数据文件），用于监听到回收站变化后增量刷新
+
+    Args:
+        recycle_bin_path (str): 回收站路径
+
+    Returns:
+        dict: 完整路径 -> (名称, 大小, 修改时间)，回收站目录不存在时抛出 FileNotFoundError
+    """
+    entries = {}
+    with os.scandir(recycle_bin_path) as it:
+        for entry in it:
+            name = entry.name
+            if name in _SKIP_NAMES or name.endswith(_SKIP_SUFFIX):
+                continue
+            try:
+                item_stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            entries[entry.path] = (name, item_stat.st_size, item_stat.st_mtime)
+    return entries
+
+
+def _list_supported_files(root_paths, skip_name):
+    """
+    按文件树的显示顺序列出各根路径下支持预览的文件：不进入隐藏目录和回收站目录，
+    只访问文件系统、不创建 Qt 对象，可以在工作线程中调用
+
+    Args:
+        root_paths (list): 导入的根路径列表
+        skip_name (str): 回收站目录名称
+
+    Returns:
+        list: 支持预览的文件路径列表
+    """
+    supported_files = []
+    for root_path in root_paths:
+        root_files = []
+        stack = [(root_path, ())]
+        while stack:
+            dir_path, rel_parts = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        name = entry.name
+                        # 与文件树一致：跳过隐藏项和回收站
+                        if name.startswith('.') or name == skip_name:
+                            continue
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append((entry.path, rel_parts + (name,)))
+                            elif _is_supported_ext(name) and entry.is_file():
+                                root_files.append((rel_parts + (name,), os.path.normpath(entry.path)))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+        # 按路径分段排序，得到与文件树相同的前序、按名称排列的顺序
+        root_files.sort()
+        supported_files.extend(file_path for _, file_path in root_files)
+    return supported_files
+
+
+class SupportedFilesWorker(QThread):
+    """
+    支持预览的文件列表工作线程，遍历大数据集时不阻塞界面
+    """
+
+    files_ready = pyqtSignal(int, object)  # 开始遍历时的文件索引版本, 支持预览的文件路径列表
+
+    def __init__(self, root_paths, skip_name, generation):
+        super().__init__()
+        self.root_paths = list(root_paths)
+        self.skip_name = skip_name
+        self.generation = generation
+
+    def run(self):
+        """
+        遍历根路径并发送结果
+        """
+        try:
+            self.files_ready.emit(self.generation, _list_supported_files(self.root_paths, self.skip_name))
+        except Exception as e:
+            logger.error("获取支持的文件列表时发生异常: %s", e, exc_info=True)
+
+
+class FolderSizeWorker(QThread):
+    """
+    文件夹大小计算工作线程，避免导入大文件夹或网络目录时阻塞界面
+    """
+
+    size_calculated = pyqtSignal(str, object, float)  # 文件夹路径, 计算前的目录 mtime_ns（失败时为None）, 大小MB
+
+    def __init__(self, folder_path, skip_name):
+        super().__init__()
+        self.folder_path = folder_path
+        self.skip_name = skip_name
+
+    def run(self):
+        """
+        执行文件夹大小计算
+        """
+        try:
+            mtime_ns = os.stat(self.folder_path).st_mtime_ns
+            size_mb = _folder_size_bytes(self.folder_path, self.skip_name) / (1024 * 1024)
+            self.size_calculated.emit(self.folder_path, mtime_ns, size_mb)
+        except Exception as e:
+            logger.error("计算文件夹大小时发生异常: %s", e)
+            self.size_calculated.emit(self.folder_path, None, 0.0)
+
+
+class RecycleMoveWorker(QThread):
+    """
+    回收站移动工作线程，避免在网络驱动器或大文件夹上移动时阻塞界面
+    """
+
+    moves_finished = pyqtSignal(list)  # 移动失败的 (文件路径, 错误信息) 列表
+
+    def __init__(self, events, moves):
+        super().__init__()
+        self.events = events
+        self.moves = moves
+
+    def run(self):
+        """
+        执行移动到回收站操作
+        """
+        try:
+            failures = self.events.on_files_delete(self.moves)
+        except Exception as e:
+            logger.error("移动文件到回收站时发生异常: %s", e)
+            failures = [(file_path, str(e)) for file_path, _ in self.moves]
+        self.moves_finished.emit(failures)
+
+
+class DropMoveWorker(QThread):
+    """
+    拖放移动工作线程，跨文件系统移动时需要复制，避免阻塞界面
+    """
+
+    moves_finished = pyqtSignal(list, list)  # 成功的 (源路径, 目标路径) 列表, 失败的 (源路径, 错误信息) 列表
+
+    def __init__(self, moves):
+        super().__init__()
+        self.moves = moves
+
+    def run(self):
+        """
+        依次执行移动，单个失败不影响其余项
+        """
+        completed = []
+        failures = []
+        for source_path, target_dir, is_dir in self.moves:
+            try:
+                destination = _move_into_dir(source_path, target_dir, is_dir)
+                completed.append((source_path, destination))
+                logger.info("移动文件: %s -> %s", source_path, destination)
+            except Exception as e:
+                logger.error("移动文件失败: %s, %s", source_path, e, exc_info=True)
+                failures.append((source_path, str(e)))
+        self.moves_finished.emit(completed, failures)
+
+
+class RecyclePurgeWorker(QThread):
+    """
+    回收站过期条目清理工作线程，彻底删除大文件夹可能耗时较长
+    """
+
+    def __init__(self, events, recycle_bin_paths, retention_days):
+        super().__init__()
+        self.events = events
+        self.recycle_bin_paths = recycle_bin_paths
+        self.retention_days = retention_days
+
+    def run(self):
+        """
+        依次清理各回收站中的过期条目
+        """
+        for recycle_bin_path in self.recycle_bin_paths:
+            try:
+                self.events.purge_expired_items(recycle_bin_path, self.retention_days)
+            except Exception as e:
+                logger.error("清理回收站时发生异常: %s, %s", recycle_bin_path, e)
+
+
+class RecycleScanWorker(QThread):
+    """
+    回收站扫描工作线程，列目录和获取 stat 不阻塞界面，扫描结果分批发送到界面线程
+    """
+
+    rows_ready = pyqtSignal(str, list)  # 回收站根路径, 一批扫描得到的条目（见 _scan_recycle_bin）
+    scan_failed = pyqtSignal(str, str)  # 回收站根路径, 错误信息
+
+    def __init__(self, recycle_bin_paths):
+        super().__init__()
+        self.recycle_bin_paths = recycle_bin_paths
+
+    def run(self):
+        """
+        扫描各回收站，按传入顺序分批发送结果
+        """
+        # 各回收站可能位于不同的（网络）磁盘上，在线程池中并行扫描
+        if len(self.recycle_bin_paths) > 1:
+            futures = [_STAT_POOL.submit(_scan_recycle_bin, path) for path in self.recycle_bin_paths]
+        else:
+            futures = [None] * len(self.recycle_bin_paths)
+
+        for recycle_bin_path, future in zip(self.recycle_bin_paths, futures):
+            if self.isInterruptionRequested():
+                return
+            try:
+                rows = future.result() if future is not None else _scan_recycle_bin(recycle_bin_path)
+            except Exception as e:
+                logger.error("扫描回收站失败: %s, %s", recycle_bin_path, e, exc_info=True)
+                self.scan_failed.emit(recycle_bin_path, str(e))
+                continue
+
+            for start in range(0, len(rows), RECYCLE_BIN_LOAD_CHUNK_SIZE):
+                if self.isInterruptionRequested():
+                    return
+                self.rows_ready.emit(recycle_bin_path, rows[start:start + RECYCLE_BIN_LOAD_CHUNK_SIZE])
+
+
+class RecycleBinClearWorker(QThread):
+    """
+    清空回收站工作线程，彻底删除大文件夹可能耗时较长
+    """
+
+    clear_finished = pyqtSignal(list)  # 删除失败的 (回收站路径, 错误信息) 列表
+
+    def __init__(self, recycle_bin_paths):
+        super().__init__()
+        self.recycle_bin_paths = recycle_bin_paths
+
+    def run(self):
+        """
+        删除各回收站目录，按路径长度排序先删除上级回收站，嵌套在其中的回收站随之删除
+        """
+        failures = []
+        for recycle_bin_path in sorted(self.recycle_bin_paths, key=len):
+            try:
+                shutil.rmtree(recycle_bin_path)
+                logger.info("删除回收站目录: %s", recycle_bin_path)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.error("清空回收站失败: %s, %s", recycle_bin_path, e, exc_info=True)
+                failures.append((recycle_bin_path, str(e)))
+        self.clear_finished.emit(failures)
+
+
+class WatchdogEventBridge(QObject):
+    """
+    将 watchdog 观察线程中的文件系统事件转发到界面线程
+    """
+
+    path_changed = pyqtSignal(str)  # 发生变化的路径
+
+
+class RecursiveWatchHandler(FileSystemEventHandler):
+    """
+    watchdog 事件处理器，只关心目录项的增删和移动，与 QFileSystemWatcher 的目录监听保持一致；
+    回收站目录不在文件树中显示，其中的变化（包括移入回收站的目标路径）不转发
+    """
+
+    def __init__(self, bridge, root_path, skip_name):
+        super().__init__()
+        self.bridge = bridge
+        self.root_path = root_path
+        # 相对根路径的部分包含该片段时位于回收站中
+        self.skip_segment = os.sep + skip_name + os.sep
+
+    def _emit(self, path):
+        if path.startswith(self.root_path) and (path[len(self.root_path):] + os.sep).find(self.skip_segment) >= 0:
+            return
+        self.bridge.path_changed.emit(path)
+
+    def on_created(self, event):
+        self._emit(event.src_path)
+
+    def on_deleted(self, event):
+        self._emit(event.src_path)
+
+    def on_moved(self, event):
+        self._emit(event.src_path)
+        self._emit(event.dest_path)
+
 
 class CustomFileSystemModel(QStandardItemModel):
     """
@@ -32,8 +946,7 @@ class CustomFileSystemModel(QStandardItemModel):
             self.root_paths = list(paths)
             self.rebuild_tree()
         except Exception as e:
-            logger.error(f"设置根路径时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("设置根路径时发生异常: %s", e, exc_info=True)
 
     def rebuild_tree(self):
         """
@@ -49,8 +962,7 @@ class CustomFileSystemModel(QStandardItemModel):
                     self.add_path_as_root(root_path)
 
         except Exception as e:
-            logger.error(f"重建树结构时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("重建树结构时发生异常: %s", e, exc_info=True)
 
     def add_path_as_root(self, path):
         """
@@ -71,8 +983,7 @@ class CustomFileSystemModel(QStandardItemModel):
                 root_item[0].appendRow(placeholder)
 
         except Exception as e:
-            logger.error(f"添加根路径时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("添加根路径时发生异常: %s", e, exc_info=True)
 
     def create_item_for_path(self, path):
         """
@@ -90,6 +1001,7 @@ class CustomFileSystemModel(QStandardItemModel):
             # 名称列
             name_item = QStandardItem(file_info.fileName() or os.path.basename(path))
             name_item.setData(path, Qt.ItemDataRole.UserRole)  # 存储完整路径
+            name_item.setData('dir' if file_info.isDir() else 'file', ITEM_TYPE_ROLE)  # 存储项类型
 
             # 设置图标
             if file_info.isDir():
@@ -121,8 +1033,7 @@ class CustomFileSystemModel(QStandardItemModel):
             return [name_item, size_item, type_item, date_item]
 
         except Exception as e:
-            logger.error(f"创建项时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("创建项时发生异常: %s", e, exc_info=True)
             return [QStandardItem("错误"), QStandardItem(""), QStandardItem(""), QStandardItem("")]
 
     def format_size(self, size):
@@ -154,40 +1065,120 @@ class CustomFileSystemModel(QStandardItemModel):
             if not parent_path or not os.path.isdir(parent_path):
                 return
 
-            # 移除占位项
-            if parent_item.rowCount() > 0:
-                first_child = parent_item.child(0)
-                if first_child and first_child.text() == "加载中...":
-                    parent_item.removeRow(0)
+            self._populate_children(parent_item, self._scan_children(parent_path))
 
-            # 加载实际子项
-            try:
-                entries = os.listdir(parent_path)
-                entries.sort()  # 按字母顺序排序
+        except Exception as e:
+            logger.error("加载子项时发生异常: %s", e, exc_info=True)
 
-                for entry in entries:
-                    entry_path = os.path.join(parent_path, entry)
-                    # 跳过隐藏文件和回收站
-                    if entry.startswith('.') or entry == 'delete':
-                        continue
+    def scan_paths(self, paths):
+        """
+        在线程池中并行扫描多个目录，不修改模型，结果可交给 load_children_bulk 使用
 
-                    # 创建子项
-                    child_items = self.create_item_for_path(entry_path)
-                    parent_item.appendRow(child_items)
+        Args:
+            paths (list): 目录路径列表
+
+        Returns:
+            dict: 目录路径 -> 扫描结果（同 _scan_children）
+        """
+        paths = list(paths)
+        if len(paths) <= 1:
+            return {path: self._scan_children(path) for path in paths}
+        with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+            return dict(zip(paths, executor.map(self._scan_children, paths)))
 
-                    # 如果是文件夹，添加占位子项
-                    if os.path.isdir(entry_path):
-                        placeholder = QStandardItem("加载中...")
-                        child_items[0].appendRow(placeholder)
+    def load_children_bulk(self, items, prefetched=None):
+        """
+        批量加载多个项的子内容，目录扫描在线程池中并行执行，模型更新仍在当前线程完成
 
-            except PermissionError:
-                logger.warning(f"无权限访问目录: {parent_path}")
-            except Exception as e:
-                logger.error(f"加载子内容时发生异常: {str(e)}")
+        Args:
+            items (list): QStandardItem 列表，只处理仍带有占位子项的文件夹
+            prefetched (dict, optional): 预先扫描好的 目录路径 -> 扫描结果，命中的目录不再扫描
+        """
+        try:
+            targets = []
+            for item in items:
+                parent_path = item.data(Qt.ItemDataRole.UserRole)
+                if parent_path and self.has_placeholder(item):
+                    targets.append((item, parent_path))
+            if not targets:
+                return
+
+            prefetched = prefetched or {}
+            results = self.scan_paths(parent_path for _, parent_path in targets
+                                      if parent_path not in prefetched)
+            results.update(prefetched)
+
+            for item, parent_path in targets:
+                self._populate_children(item, results[parent_path])
+
+        except Exception as e:
+            logger.error("批量加载子项时发生异常: %s", e, exc_info=True)
+
+    def has_placeholder(self, item):
+        """
+        判断项是否仍带有未加载的占位子项
+
+        Args:
+            item (QStandardItem): 要检查的项
+
+        Returns:
+            bool: 带有占位子项返回True
+        """
+        if item.rowCount() > 0:
+            first_child = item.child(0)
+            return bool(first_child) and first_child.text() == "加载中..."
+        return False
+
+    def _scan_children(self, parent_path):
+        """
+        扫描目录的直接子项，不访问任何 Qt 对象，可以在工作线程中调用
+
+        Args:
+            parent_path (str): 目录路径
 
+        Returns:
+            list: 按名称排序的 (名称, 路径, 是否文件夹) 列表，扫描失败时返回None
+        """
+        try:
+            with os.scandir(parent_path) as it:
+                # 跳过隐藏文件和回收站
+                entries = [(entry.name, entry.path, entry.is_dir()) for entry in it
+                           if not entry.name.startswith('.') and entry.name != 'delete']
+            entries.sort()  # 按字母顺序排序
+            return entries
+        except PermissionError:
+            logger.warning("无权限访问目录: %s", parent_path)
+        except FileNotFoundError:
+            # 预扫描的展开路径可能已被删除或移动
+            logger.debug("目录不存在: %s", parent_path)
         except Exception as e:
-            logger.error(f"加载子项时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("加载子内容时发生异常: %s", e)
+        return None
+
+    def _populate_children(self, parent_item, entries):
+        """
+        用扫描结果替换父项的占位子项
+
+        Args:
+            parent_item (QStandardItem): 父项
+            entries (list): _scan_children 的返回值
+        """
+        # 移除占位项
+        if self.has_placeholder(parent_item):
+            parent_item.removeRow(0)
+
+        if not entries:
+            return
+
+        for _, entry_path, is_dir in entries:
+            # 创建子项
+            child_items = self.create_item_for_path(entry_path)
+            parent_item.appendRow(child_items)
+
+            # 如果是文件夹，添加占位子项
+            if is_dir:
+                placeholder = QStandardItem("加载中...")
+                child_items[0].appendRow(placeholder)
 
     def get_file_path(self, index):
         """
@@ -234,7 +1225,7 @@ class FileManagerEvents(QObject):
         """
         if os.path.exists(file_path):
             self.file_selected.emit(file_path)
-            logger.info(f"文件选中事件: {file_path}")
+            logger.info("文件选中事件: %s", file_path)
 
     def on_file_delete(self, file_path, recycle_bin_path):
         """
@@ -244,34 +1235,55 @@ class FileManagerEvents(QObject):
             file_path (str): 要删除的文件路径
             recycle_bin_path (str): 回收站路径
         """
-        try:
-            if not os.path.exists(recycle_bin_path):
-                os.makedirs(recycle_bin_path)
-                logger.debug(f"创建回收站目录: {recycle_bin_path}")
+        self.on_files_delete([(file_path, recycle_bin_path)])
 
-            filename = os.path.basename(file_path)
-            destination = os.path.join(recycle_bin_path, filename)
-
-            # 处理重名情况
-            counter = 1
-            base_name, ext = os.path.splitext(filename)
-            while os.path.exists(destination):
-                new_filename = f"{base_name}_{counter}{ext}"
-                destination = os.path.join(recycle_bin_path, new_filename)
-                counter += 1
+    def on_files_delete(self, moves):
+        """
+        批量处理文件删除事件（移动到回收站），每个回收站只写一次元数据，全部完成后只发出一次删除信号
 
-            shutil.move(file_path, destination)
-            logger.info(f"文件移动到回收站: {file_path} -> {destination}")
+        Args:
+            moves (list): (要删除的文件路径, 回收站路径) 列表
 
-            # 保存原始路径信息到统一的元数据文件
-            self.update_metadata_file(recycle_bin_path, {os.path.basename(destination): file_path})
+        Returns:
+            list: 移动失败的 (文件路径, 错误信息) 列表
+        """
+        failures = []
+        last_destination = None
+        # 按回收站分组
+        moves_by_bin = {}
+        for file_path, recycle_bin_path in moves:
+            moves_by_bin.setdefault(recycle_bin_path, []).append(file_path)
 
-            # 检查回收站目录是否为空，如果为空则删除
-            self.cleanup_empty_recycle_bin(recycle_bin_path)
+        for recycle_bin_path, file_paths in moves_by_bin.items():
+            metadata = {}
+            try:
+                os.makedirs(recycle_bin_path, exist_ok=True)
+                # 以删除时间为前缀命名，便于定时清理过期条目
+                stamp = time.strftime(RECYCLE_NAME_TIME_FORMAT)
+                for file_path in file_paths:
+                    try:
+                        # 先原子地占用不重名的目标路径再替换，不会覆盖回收站中已有的条目
+                        destination = _move_into_dir(file_path, recycle_bin_path, os.path.isdir(file_path),
+                                                     f"{stamp}_{os.path.basename(file_path)}")
+                        logger.info("文件移动到回收站: %s -> %s", file_path, destination)
+                        metadata[os.path.basename(destination)] = file_path
+                        last_destination = destination
+                    except Exception as e:
+                        logger.error("删除文件时出错: %s, %s", file_path, e, exc_info=True)
+                        failures.append((file_path, str(e)))
+            except Exception as e:
+                logger.error("创建回收站目录时出错: %s, %s", recycle_bin_path, e, exc_info=True)
+                failures.extend((file_path, str(e)) for file_path in file_paths)
+            finally:
+                # 保存原始路径信息到统一的元数据文件
+                if metadata:
+                    self.update_metadata_file(recycle_bin_path, metadata)
+                # 检查回收站目录是否为空，如果为空则删除
+                self.cleanup_empty_recycle_bin(recycle_bin_path)
 
-            self.file_deleted.emit(destination)
-        except Exception as e:
-            logger.error(f"删除文件时出错: {e}", exc_info=True)
+        if last_destination:
+            self.file_deleted.emit(last_destination)
+        return failures
 
     def update_metadata_file(self, recycle_bin_path, metadata):
         """
@@ -283,22 +1295,60 @@ class FileManagerEvents(QObject):
         """
         metadata_file = os.path.join(recycle_bin_path, ".meta.json")
         try:
-            # 如果元数据文件已存在，读取现有数据
-            if os.path.exists(metadata_file):
-                with open(metadata_file, 'r') as f:
-                    existing_metadata = json.load(f)
-                existing_metadata.update(metadata)
-                logger.debug(f"更新现有元数据文件: {metadata_file}")
-            else:
-                existing_metadata = metadata
-                logger.debug(f"创建新的元数据文件: {metadata_file}")
-
-            # 写入更新后的元数据
-            with open(metadata_file, 'w') as f:
-                json.dump(existing_metadata, f, indent=2, ensure_ascii=False)
-            logger.debug(f"元数据文件保存成功: {metadata_file}")
+            # 在锁内重新读取现有数据并合并，原子写回
+            _update_metadata_file(metadata_file, added=metadata)
+            logger.debug("元数据文件保存成功: %s", metadata_file)
         except Exception as e:
-            logger.error(f"更新元数据文件失败: {e}", exc_info=True)
+            logger.error("更新元数据文件失败: %s", e, exc_info=True)
+
+    def purge_expired_items(self, recycle_bin_path, retention_days):
+        """
+        彻底删除回收站中超过保留天数的条目，只处理以删除时间为前缀命名的条目
+
+        Args:
+            recycle_bin_path (str): 回收站路径
+            retention_days (int): 保留天数
+
+        Returns:
+            int: 删除的条目数量
+        """
+        cutoff = time.time() - retention_days * 24 * 3600
+        purged = []
+        try:
+            with os.scandir(recycle_bin_path) as it:
+                entries = list(it)
+        except FileNotFoundError:
+            return 0
+
+        for entry in entries:
+            match = RECYCLE_NAME_TIME_RE.match(entry.name)
+            if not match:
+                continue
+            try:
+                deleted_at = time.mktime(time.strptime(match.group(1), RECYCLE_NAME_TIME_FORMAT))
+            except ValueError:
+                continue
+            if deleted_at >= cutoff:
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.remove(entry.path)
+                purged.append(entry.name)
+                logger.info("清理过期回收站条目: %s", entry.path)
+            except Exception as e:
+                logger.error("清理过期回收站条目失败: %s, %s", entry.path, e)
+
+        if purged:
+            metadata_file = os.path.join(recycle_bin_path, ".meta.json")
+            try:
+                # 与其他写入方共用元数据锁，重新读取后合并写回，没有记录时删除元数据文件
+                _update_metadata_file(metadata_file, removed=purged)
+            except Exception as e:
+                logger.error("更新元数据文件失败: %s", e, exc_info=True)
+            self.cleanup_empty_recycle_bin(recycle_bin_path)
+        return len(purged)
 
     def on_file_restore(self, file_path, original_path):
         """
@@ -313,13 +1363,13 @@ class FileManagerEvents(QObject):
             original_dir = os.path.dirname(original_path)
             if not os.path.exists(original_dir):
                 os.makedirs(original_dir)
-                logger.debug(f"创建目录以恢复文件: {original_dir}")
+                logger.debug("创建目录以恢复文件: %s", original_dir)
 
             shutil.move(file_path, original_path)
-            logger.info(f"文件已恢复: {file_path} -> {original_path}")
+            logger.info("文件已恢复: %s -> %s", file_path, original_path)
             self.file_restored.emit(original_path)
         except Exception as e:
-            logger.error(f"恢复文件时出错: {e}", exc_info=True)
+            logger.error("恢复文件时出错: %s", e, exc_info=True)
 
     def cleanup_empty_recycle_bin(self, recycle_bin_path):
         """
@@ -328,33 +1378,19 @@ class FileManagerEvents(QObject):
         Args:
             recycle_bin_path (str): 回收站路径
         """
-        try:
-            # 检查目录是否存在
-            if not os.path.exists(recycle_bin_path):
-                return
-
-            # 检查是否是delete目录
-            if not os.path.basename(recycle_bin_path) == "delete":
-                return
-
-            # 检查目录是否为空（忽略.meta.json文件）
-            items = os.listdir(recycle_bin_path)
-            # 过滤掉.meta.json文件
-            items = [item for item in items if item != ".meta.json"]
-
-            # 如果目录为空，则删除该目录和元数据文件
-            if not items:
-                # 删除元数据文件（如果存在）
-                metadata_file = os.path.join(recycle_bin_path, ".meta.json")
-                if os.path.exists(metadata_file):
-                    os.remove(metadata_file)
-                    logger.debug(f"删除空回收站的元数据文件: {metadata_file}")
+        # 检查是否是delete目录
+        if not os.path.basename(recycle_bin_path) == "delete":
+            return
 
-                # 删除空的回收站目录
-                os.rmdir(recycle_bin_path)
-                logger.info(f"删除空回收站目录: {recycle_bin_path}")
+        try:
+            # 检查目录是否为空（忽略元数据文件），目录不存在时直接抛出 FileNotFoundError
+            if _remove_bin_if_empty(recycle_bin_path):
+                logger.info("删除空回收站目录: %s", recycle_bin_path)
+        except FileNotFoundError:
+            # 回收站目录已不存在
+            return
         except Exception as e:
-            logger.error(f"清理空回收站目录时出错: {e}", exc_info=True)
+            logger.error("清理空回收站目录时出错: %s", e, exc_info=True)
 
 
 class FileManagerUI(QWidget):
@@ -367,6 +1403,7 @@ class FileManagerUI(QWidget):
     context_menu_requested = pyqtSignal(str, object)  # 文件路径, 位置
     # 定义拖拽操作信号
     file_dropped = pyqtSignal(str, str)  # 源文件路径, 目标文件夹路径
+    drop_finished = pyqtSignal()  # 一次拖拽中的所有文件处理完毕
 
     def __init__(self, width=None, height=None):
         """
@@ -386,13 +1423,14 @@ class FileManagerUI(QWidget):
             self.root_path_label = None  # 显示当前根路径的标签
             self.context_menu = None  # 右键菜单
             self.search_box = None  # 搜索框
+            # 拖拽经过的上一行及其是否可放置，鼠标在同一行内移动时直接复用
+            self._drag_target = None
             self.init_ui()
             self.loaded_files = {}  # 存储已加载的文件信息
             self.batch_size = 100   # 每次加载的文件数量
             self.dataset_manager_dir = self.get_dataset_manager_dir()  # 获取数据管理器目录
         except Exception as e:
-            logger.error(f"FileManagerUI初始化时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("FileManagerUI初始化时发生异常: %s", e, exc_info=True)
             raise
 
     def init_ui(self):
@@ -497,7 +1535,7 @@ class FileManagerUI(QWidget):
                 v_scrollbar.setVisible(True)
                 # 设置范围，确保滚动条激活
                 v_scrollbar.setRange(0, 1000)  # 设置一个足够大的范围
-                logger.info(f"垂直滚动条设置完成: 宽度=15px, 可见={v_scrollbar.isVisible()}")
+                logger.info("垂直滚动条设置完成: 宽度=15px, 可见=%s", v_scrollbar.isVisible())
             else:
                 logger.warning("无法获取垂直滚动条")
 
@@ -508,7 +1546,7 @@ class FileManagerUI(QWidget):
                 h_scrollbar.setMaximumHeight(12)
                 # 设置范围，确保滚动条激活
                 h_scrollbar.setRange(0, 1000)  # 设置一个足够大的范围
-                logger.info(f"水平滚动条设置完成: 高度=12px, 可见={h_scrollbar.isVisible()}")
+                logger.info("水平滚动条设置完成: 高度=12px, 可见=%s", h_scrollbar.isVisible())
             else:
                 logger.warning("无法获取水平滚动条")
 
@@ -562,8 +1600,7 @@ class FileManagerUI(QWidget):
 
             self.setLayout(main_layout)
         except Exception as e:
-            logger.error(f"初始化UI时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("初始化UI时发生异常: %s", e, exc_info=True)
             raise
 
     def on_item_expanded(self, index):
@@ -590,8 +1627,7 @@ class FileManagerUI(QWidget):
                     self.model.load_children(item)
 
         except Exception as e:
-            logger.error(f"处理项目展开事件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("处理项目展开事件时发生异常: %s", e, exc_info=True)
 
     def get_button_style(self):
         """
@@ -618,8 +1654,7 @@ class FileManagerUI(QWidget):
                 }
             """
         except Exception as e:
-            logger.error(f"获取按钮样式时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("获取按钮样式时发生异常: %s", e, exc_info=True)
             return ""
 
     def get_scrollbar_style(self):
@@ -697,8 +1732,7 @@ class FileManagerUI(QWidget):
                 }
             """
         except Exception as e:
-            logger.error(f"获取滚动条样式时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("获取滚动条样式时发生异常: %s", e, exc_info=True)
             return ""
 
     def set_root_paths(self, paths):
@@ -726,12 +1760,10 @@ class FileManagerUI(QWidget):
             # 重置已加载文件记录
             self.loaded_files = {}
 
-            # 保存导入的路径到持久化存储
-            for path in paths:
-                self.save_imported_path(path)
+            # 保存导入的路径到持久化存储，所有路径合并后只读写一次配置文件
+            self._save_imported_paths(paths)
         except Exception as e:
-            logger.error(f"设置根路径列表时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("设置根路径列表时发生异常: %s", e, exc_info=True)
             raise
 
     def clear_view(self):
@@ -747,8 +1779,7 @@ class FileManagerUI(QWidget):
                 self.root_path_label.setText("未选择文件夹")
             logger.debug("清空文件视图")
         except Exception as e:
-            logger.error(f"清空视图时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("清空视图时发生异常: %s", e, exc_info=True)
 
     def get_selected_path(self):
         """
@@ -765,40 +1796,57 @@ class FileManagerUI(QWidget):
                     return self.model.get_file_path(index)
             return None
         except Exception as e:
-            logger.error(f"获取选中路径时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("获取选中路径时发生异常: %s", e, exc_info=True)
             return None
 
+    def get_selected_paths(self):
+        """
+        获取所有选中的路径（按选择顺序，每行只取一次）
+
+        Returns:
+            list: 选中的文件路径列表
+        """
+        try:
+            if not self.tree_view or not self.model:
+                return []
+            selection_model = self.tree_view.selectionModel()
+            if not selection_model:
+                return []
+            paths = []
+            for index in selection_model.selectedRows(0):
+                file_path = self.model.get_file_path(index)
+                if file_path:
+                    paths.append(file_path)
+            return paths
+        except Exception as e:
+            logger.error("获取选中路径时发生异常: %s", e, exc_info=True)
+            return []
+
     def load_files_in_batches(self, folder_path):
         """
         分批加载文件夹中的文件
 
+        子目录由模型在展开时按需加载，这里只统计文件夹直接包含的文件，不递归遍历整个目录树
+
         Args:
             folder_path (str): 文件夹路径
         """
         try:
-            # 获取文件夹中的所有文件
-            all_files = []
-            for root, dirs, files in os.walk(folder_path):
-                for file in files:
-                    all_files.append(os.path.join(root, file))
-                # 限制遍历的目录数量以提高性能
-                if len(all_files) > 10000:  # 如果文件太多，只处理前10000个
-                    break
+            # 只列出直接子项，不为统计数量遍历整个目录树
+            with os.scandir(folder_path) as it:
+                total_files = sum(1 for entry in it if entry.is_file())
 
             # 分批处理文件
-            total_files = len(all_files)
             batches = (total_files + self.batch_size - 1) // self.batch_size  # 计算总批次数
 
-            logger.info(f"总共找到 {total_files} 个文件，分为 {batches} 批处理")
+            logger.info("总共找到 %s 个文件，分为 %s 批处理", total_files, batches)
 
             # 这里可以实现具体的分批加载逻辑
             # 当前实现是简化版本，一次性加载所有文件
             # 在实际应用中，可以实现"加载更多"按钮来分批显示文件
 
         except Exception as e:
-            logger.error(f"加载文件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("加载文件时发生异常: %s", e, exc_info=True)
 
     def show_context_menu(self, position):
         """
@@ -817,10 +1865,9 @@ class FileManagerUI(QWidget):
             # 使用自定义模型的 get_file_path 方法
             file_path = self.model.get_file_path(index) if self.model else ""
             self.context_menu_requested.emit(file_path, position)
-            logger.debug(f"显示上下文菜单: {file_path}")
+            logger.debug("显示上下文菜单: %s", file_path)
         except Exception as e:
-            logger.error(f"显示上下文菜单时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("显示上下文菜单时发生异常: %s", e, exc_info=True)
 
     def handle_drag_enter(self, e):
         """
@@ -830,12 +1877,12 @@ class FileManagerUI(QWidget):
             e: 拖拽事件
         """
         try:
+            self._drag_target = None
             if e.mimeData().hasUrls():
                 e.acceptProposedAction()
                 logger.debug("接受拖拽进入事件")
         except Exception as e:
-            logger.error(f"处理拖拽进入事件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("处理拖拽进入事件时发生异常: %s", e, exc_info=True)
 
     def handle_drag_move(self, event):
         """
@@ -849,18 +1896,24 @@ class FileManagerUI(QWidget):
                 # 获取当前位置的索引
                 index = self.tree_view.indexAt(event.pos()) if self.tree_view else None
                 if index and index.isValid():
-                    # 使用自定义模型的 get_file_path 方法
-                    path = self.model.get_file_path(index) if self.model else ""
-                    # 只允许拖拽到文件夹上
-                    if os.path.isdir(path):
+                    row_index = index.sibling(index.row(), 0)
+                    drag_target = self._drag_target
+                    if drag_target is not None and drag_target[0] == row_index:
+                        accept = drag_target[1]
+                    else:
+                        # 使用自定义模型的 get_file_path 方法
+                        path = self.model.get_file_path(index) if self.model else ""
+                        # 只允许拖拽到文件夹上，项类型在建项时已记录，不需要访问文件系统
+                        accept = bool(path) and _index_is_dir(index, path)
+                        self._drag_target = (QPersistentModelIndex(row_index), accept)
+                        if accept:
+                            logger.debug("接受拖拽移动事件到文件夹: %s", path)
+                    if accept:
                         event.acceptProposedAction()
-                        logger.debug(f"接受拖拽移动事件到文件夹: {path}")
                         return
             event.ignore()
-            logger.debug("忽略拖拽移动事件")
         except Exception as e:
-            logger.error(f"处理拖拽移动事件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("处理拖拽移动事件时发生异常: %s", e, exc_info=True)
 
     def handle_drop(self, e):
         """
@@ -876,11 +1929,12 @@ class FileManagerUI(QWidget):
                 e.ignore()
                 return
 
+            self._drag_target = None
             # 使用自定义模型的 get_file_path 方法
             target_path = self.model.get_file_path(index) if self.model else ""
 
             # 如枟目标不是文件夹，使用其所在的文件夹
-            if target_path and not os.path.isdir(target_path):
+            if target_path and not _index_is_dir(index, target_path):
                 target_path = os.path.dirname(target_path)
 
             if not target_path:
@@ -899,11 +1953,10 @@ class FileManagerUI(QWidget):
                         source_path = self.model.get_file_path(idx) if self.model else ""
                         if source_path:
                             self.file_dropped.emit(source_path, target_path)
-                            logger.debug(f"处理内部拖动: {source_path} -> {target_path}")
+                            logger.debug("处理内部拖动: %s -> %s", source_path, target_path)
 
-                    # 批量移动后统一刷新视图
-                    from PyQt5.QtCore import QTimer
-                    QTimer.singleShot(300, lambda: self.refresh_view_keep_expanded())
+                    # 批量移动后统一刷新视图（300ms 的界面刷新无需高精度定时器）
+                    QTimer.singleShot(300, Qt.TimerType.CoarseTimer, self.drop_finished.emit)
 
                     e.acceptProposedAction()
                     return
@@ -914,19 +1967,17 @@ class FileManagerUI(QWidget):
                 for url in e.mimeData().urls():
                     source_path = url.toLocalFile()
                     self.file_dropped.emit(source_path, target_path)
-                    logger.debug(f"处理外部拖动: {source_path} -> {target_path}")
+                    logger.debug("处理外部拖动: %s -> %s", source_path, target_path)
 
-                # 批量移动后统一刷新视图
-                from PyQt5.QtCore import QTimer
-                QTimer.singleShot(300, lambda: self.refresh_view_keep_expanded())
+                # 批量移动后统一刷新视图（300ms 的界面刷新无需高精度定时器）
+                QTimer.singleShot(300, Qt.TimerType.CoarseTimer, self.drop_finished.emit)
 
                 e.acceptProposedAction()
             else:
                 e.ignore()
 
         except Exception as e:
-            logger.error(f"处理拖拽放置事件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("处理拖拽放置事件时发生异常: %s", e, exc_info=True)
 
     def get_dataset_manager_dir(self):
         """
@@ -944,20 +1995,28 @@ class FileManagerUI(QWidget):
             # 如果目录不存在则创建
             if not os.path.exists(dataset_manager_dir):
                 os.makedirs(dataset_manager_dir)
-                logger.debug(f"创建数据管理器目录: {dataset_manager_dir}")
+                logger.debug("创建数据管理器目录: %s", dataset_manager_dir)
 
             return dataset_manager_dir
         except Exception as e:
-            logger.error(f"获取数据管理器目录时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("获取数据管理器目录时发生异常: %s", e, exc_info=True)
             return "."
 
     def save_imported_path(self, path):
         """
-        保存导入的路径到持久化存储
+        保存导入的路径到持久化存储
+
+        Args:
+            path (str): 导入的路径
+        """
+        self._save_imported_paths([path])
+
+    def _save_imported_paths(self, paths):
+        """
+        批量保存导入的路径到持久化存储：读取一次配置文件，合并新路径后最多写入一次
 
         Args:
-            path (str): 导入的路径
+            paths (list): 导入的路径列表
         """
         try:
             # 获取配置文件路径
@@ -969,17 +2028,23 @@ class FileManagerUI(QWidget):
                 with open(config_file, 'r') as f:
                     imported_paths = json.load(f)
 
-            # 如果路径不在列表中，则添加
-            if path not in imported_paths:
-                imported_paths.append(path)
+            # 按原有顺序追加不在列表中的路径
+            known_paths = set(imported_paths)
+            added_paths = []
+            for path in paths:
+                if path not in known_paths:
+                    known_paths.add(path)
+                    added_paths.append(path)
+            if not added_paths:
+                return
 
-                # 保存到文件
-                with open(config_file, 'w') as f:
-                    json.dump(imported_paths, f, indent=2, ensure_ascii=False)
-                logger.debug(f"保存导入路径到配置文件: {path}")
+            imported_paths.extend(added_paths)
+            # 保存到文件
+            with open(config_file, 'w') as f:
+                json.dump(imported_paths, f, indent=2, ensure_ascii=False)
+            logger.debug("保存导入路径到配置文件: %s", added_paths)
         except Exception as e:
-            logger.error(f"保存导入路径时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("保存导入路径时发生异常: %s", e, exc_info=True)
 
     def load_imported_paths(self):
         """
@@ -996,11 +2061,10 @@ class FileManagerUI(QWidget):
             if os.path.exists(config_file):
                 with open(config_file, 'r') as f:
                     imported_paths = json.load(f)
-                logger.debug(f"从配置文件加载导入路径: {imported_paths}")
+                logger.debug("从配置文件加载导入路径: %s", imported_paths)
                 return imported_paths
         except Exception as e:
-            logger.error(f"加载导入路径时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("加载导入路径时发生异常: %s", e, exc_info=True)
 
         return []
 
@@ -1027,10 +2091,253 @@ class FileManagerUI(QWidget):
                     # 保存更新后的数据
                     with open(config_file, 'w') as f:
                         json.dump(imported_paths, f, indent=2, ensure_ascii=False)
-                    logger.debug(f"从配置文件移除导入路径: {path}")
+                    logger.debug("从配置文件移除导入路径: %s", path)
+        except Exception as e:
+            logger.error("移除导入路径时发生异常: %s", e, exc_info=True)
+
+    def load_recycle_bin_retention_days(self):
+        """
+        从持久化存储加载回收站自动清理的保留天数
+
+        Returns:
+            int: 保留天数，0 表示不自动清理（默认）
+        """
+        try:
+            config_file = os.path.join(self.dataset_manager_dir, "recycle_bin_settings.json")
+            if os.path.exists(config_file):
+                with open(config_file, 'r') as f:
+                    settings = json.load(f)
+                return max(int(settings.get("retention_days", 0)), 0)
+        except Exception as e:
+            logger.error("加载回收站设置时发生异常: %s", e, exc_info=True)
+
+        return 0
+
+    def save_recycle_bin_retention_days(self, retention_days):
+        """
+        保存回收站自动清理的保留天数到持久化存储
+
+        Args:
+            retention_days (int): 保留天数，0 表示不自动清理
+        """
+        try:
+            config_file = os.path.join(self.dataset_manager_dir, "recycle_bin_settings.json")
+            with open(config_file, 'w') as f:
+                json.dump({"retention_days": retention_days}, f, indent=2, ensure_ascii=False)
+            logger.debug("保存回收站自动清理保留天数: %s", retention_days)
         except Exception as e:
-            logger.error(f"移除导入路径时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("保存回收站设置时发生异常: %s", e, exc_info=True)
+
+
+def _format_sizes_and_times(sizes, mtimes):
+    """
+    批量格式化大小和删除时间，安装了 numpy 时按数组计算单位，删除时间按秒去重后再格式化，
+    结果与 RecycleBinDialog.format_size / format_time 一致
+
+    Args:
+        sizes (list): 文件大小列表（字节）
+        mtimes (list): 时间戳列表
+
+    Returns:
+        tuple: (大小字符串列表, 时间字符串列表)
+    """
+    units = SIZE_UNITS + ('TB',)
+    if np is not None:
+        size_array = np.asarray(sizes, dtype=np.float64)
+        unit_idx = np.minimum(np.log2(np.maximum(size_array, 1)) // 10, len(units) - 1).astype(np.int64)
+        scaled = size_array / np.power(1024.0, unit_idx)
+        size_texts = [f"{value:.1f} {units[idx]}" for value, idx in zip(scaled.tolist(), unit_idx.tolist())]
+
+        seconds, inverse = np.unique(np.floor(np.asarray(mtimes, dtype=np.float64)), return_inverse=True)
+        unique_texts = [time.strftime(DISPLAY_TIME_FORMAT, time.localtime(second)) for second in seconds.tolist()]
+        time_texts = [unique_texts[i] for i in inverse.tolist()]
+        return size_texts, time_texts
+
+    size_texts = []
+    for size in sizes:
+        for unit in units:
+            if size < 1024.0 or unit == units[-1]:
+                size_texts.append(f"{size:.1f} {unit}")
+                break
+            size /= 1024.0
+
+    # 同一批删除的条目删除时间大多相同，按秒缓存格式化结果
+    time_cache = {}
+    time_texts = []
+    for mtime in mtimes:
+        second = int(mtime // 1)
+        text = time_cache.get(second)
+        if text is None:
+            text = time_cache[second] = time.strftime(DISPLAY_TIME_FORMAT, time.localtime(second))
+        time_texts.append(text)
+    return size_texts, time_texts
+
+
+class RecycleBinModel(QAbstractTableModel):
+    """
+    回收站列表模型，条目以元组保存在列表中，视图滚动到末尾时再分块插入行，
+    打开大回收站时不需要为每个条目一次性创建视图项
+
+    每个条目为 (名称, 原始路径, 大小, 删除时间, 完整路径, 回收站编号)，回收站编号为回收站路径在对话框
+    回收站列表中的下标
+    """
+
+    HEADERS = ("文件名", "原始路径", "大小", "删除时间")
+
+    def __init__(self, format_size, format_time, parent=None):
+        """
+        初始化回收站列表模型
+
+        Args:
+            format_size (callable): 大小格式化函数
+            format_time (callable): 时间格式化函数
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self._format_size = format_size
+        self._format_time = format_time
+        self._rows = []
+        # 已插入视图的行数，其余条目在 fetchMore 时分块插入
+        self._loaded = 0
+        # 条目较多时按块批量格式化的结果：条目 -> (大小字符串, 时间字符串)
+        self._display_cache = {}
+
+    def set_rows(self, rows):
+        """
+        替换全部条目，视图只插入第一块
+
+        Args:
+            rows (list): 条目列表
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self._display_cache = {}
+        self._loaded = min(len(rows), RECYCLE_BIN_LOAD_CHUNK_SIZE)
+        self._format_range(0, self._loaded)
+        self.endResetModel()
+
+    def _format_range(self, start, end):
+        """
+        条目总数超过 RECYCLE_BIN_BULK_FORMAT_THRESHOLD 时批量格式化指定范围内的大小和删除时间，
+        较少时仍由 data 逐个格式化
+
+        Args:
+            start (int): 起始行号
+            end (int): 结束行号（不包含）
+        """
+        if len(self._rows) < RECYCLE_BIN_BULK_FORMAT_THRESHOLD or start >= end:
+            return
+        chunk = self._rows[start:end]
+        size_texts, time_texts = _format_sizes_and_times([row[2] for row in chunk], [row[3] for row in chunk])
+        self._display_cache.update(zip(chunk, zip(size_texts, time_texts)))
+
+    def rows(self):
+        """
+        获取全部条目（包括尚未插入视图的条目）
+
+        Returns:
+            list: 条目列表
+        """
+        return self._rows
+
+    def row_data(self, row):
+        """
+        获取指定行的条目
+
+        Args:
+            row (int): 行号
+
+        Returns:
+            tuple: 条目
+        """
+        return self._rows[row]
+
+    def append_rows(self, rows):
+        """
+        追加条目，视图中的行数不足一块时直接补足，其余条目等视图滚动到末尾时再插入
+
+        Args:
+            rows (list): 条目列表
+        """
+        if not rows:
+            return
+        self._rows.extend(rows)
+        if self._loaded < RECYCLE_BIN_LOAD_CHUNK_SIZE:
+            self.fetchMore(QModelIndex())
+
+    def remove_rows(self, rows):
+        """
+        按行号移除条目，连续的行合并为一次删除
+
+        Args:
+            rows (iterable): 要移除的行号
+        """
+        ordered = sorted(set(rows), reverse=True)
+        i = 0
+        while i < len(ordered):
+            first = last = ordered[i]
+            i += 1
+            while i < len(ordered) and ordered[i] == first - 1:
+                first = ordered[i]
+                i += 1
+
+            if first < self._loaded:
+                visible_last = min(last, self._loaded - 1)
+                self.beginRemoveRows(QModelIndex(), first, visible_last)
+                del self._rows[first:last + 1]
+                self._loaded -= visible_last - first + 1
+                self.endRemoveRows()
+            else:
+                # 尚未插入视图的条目直接移除
+                del self._rows[first:last + 1]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        name, original_path, size, mtime, path, bin_index = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            column = index.column()
+            if column == 0:
+                return name
+            if column == 1:
+                return original_path if original_path else "未知"
+            texts = self._display_cache.get(self._rows[index.row()])
+            if column == 2:
+                return texts[0] if texts else self._format_size(size)
+            return texts[1] if texts else self._format_time(mtime)
+        if role == Qt.ItemDataRole.UserRole:
+            # 完整路径
+            return path
+        if role == Qt.ItemDataRole.UserRole + 1:
+            # 所在回收站的编号，用于还原操作
+            return bin_index
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole
+                and 0 <= section < len(self.HEADERS)):
+            return self.HEADERS[section]
+        return None
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent):
+        if parent.isValid():
+            return
+        count = min(RECYCLE_BIN_LOAD_CHUNK_SIZE, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self._format_range(self._loaded, self._loaded + count)
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
 
 
 class RecycleBinDialog(QDialog):
@@ -1038,23 +2345,47 @@ class RecycleBinDialog(QDialog):
     回收站对话框类，用于管理和操作回收站中的文件
     """
 
-    def __init__(self, recycle_bin_paths, parent=None):
+    retention_changed = pyqtSignal(int)  # 用户修改了自动清理的保留天数（0 表示关闭）
+
+    def __init__(self, recycle_bin_paths, parent=None, retention_days=0):
         """
         问题3修复：初始化回收站对话框，支持多个回收站路径
 
         Args:
             recycle_bin_paths (list or str): 回收站路径列表或单个路径
             parent: 父级窗口
+            retention_days (int): 当前自动清理的保留天数，0 表示不自动清理
         """
         super().__init__(parent)
+        self.retention_days = retention_days
         # 支持传入列表或单个路径字符串
         if isinstance(recycle_bin_paths, list):
             self.recycle_bin_paths = recycle_bin_paths
         else:
             self.recycle_bin_paths = [recycle_bin_paths]
+        # 回收站路径 -> 已解析的 .meta.json 内容，每个元数据文件只读取一次
+        self._meta_cache = {}
+        # 所有已加载回收站的 文件名 -> 原始路径，文件不在所属回收站的元数据中时使用
+        self._filename_to_original = {}
+        # 加载时发现的所有回收站目录（含嵌套的 delete 目录），清空回收站时直接使用
+        self._known_bins = set()
+        # 回收站路径列表及其反向索引，列表条目只保存回收站编号
+        self._bins = []
+        self._bin_index = {}
+        self._scan_worker = None
+        self._clear_worker = None
+        # 监听已发现的回收站目录及其 .meta.json，外部变化时只刷新发生变化的回收站
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_bin_changed)
+        self._watcher.fileChanged.connect(self._on_meta_changed)
+        self._dirty_bins = set()
+        self._watch_timer = QTimer(self)
+        self._watch_timer.setSingleShot(True)
+        self._watch_timer.setInterval(RECYCLE_BIN_WATCH_DELAY_MS)
+        self._watch_timer.timeout.connect(self._refresh_dirty_bins)
         self.init_ui()
         self.load_recycle_bin_contents()
-        logger.debug(f"初始化回收站对话框: {self.recycle_bin_paths}")
+        logger.debug("初始化回收站对话框: %s", self.recycle_bin_paths)
 
     def init_ui(self):
         """
@@ -1066,11 +2397,14 @@ class RecycleBinDialog(QDialog):
         # 创建主布局
         layout = QVBoxLayout(self)
 
-        # 创建文件树
-        self.file_tree = QTreeWidget()
-        self.file_tree.setHeaderLabels(["文件名", "原始路径", "大小", "删除时间"])
+        # 创建文件列表，条目由模型按需分块插入
+        self.file_tree = QTreeView()
+        self.model = RecycleBinModel(self.format_size, self.format_time, self)
+        self.file_tree.setModel(self.model)
         self.file_tree.setRootIsDecorated(False)
         self.file_tree.setAlternatingRowColors(True)
+        # 所有行高度相同，视图不需要逐行计算高度
+        self.file_tree.setUniformRowHeights(True)
 
         # 创建按钮
         button_layout = QHBoxLayout()
@@ -1079,6 +2413,7 @@ class RecycleBinDialog(QDialog):
         self.restore_all_btn = QPushButton("还原全部文件")
         self.delete_btn = QPushButton("彻底删除选中文件")
         self.delete_all_btn = QPushButton("清空回收站")
+        self.retention_btn = QPushButton("自动清理设置")
         self.close_btn = QPushButton("关闭")
 
         # 连接按钮事件
@@ -1086,6 +2421,7 @@ class RecycleBinDialog(QDialog):
         self.restore_all_btn.clicked.connect(self.restore_all)
         self.delete_btn.clicked.connect(self.delete_selected)
         self.delete_all_btn.clicked.connect(self.delete_all)
+        self.retention_btn.clicked.connect(self.configure_retention)
         self.close_btn.clicked.connect(self.accept)
 
         # 添加按钮到布局
@@ -1093,6 +2429,7 @@ class RecycleBinDialog(QDialog):
         button_layout.addWidget(self.restore_all_btn)
         button_layout.addWidget(self.delete_btn)
         button_layout.addWidget(self.delete_all_btn)
+        button_layout.addWidget(self.retention_btn)
         button_layout.addStretch()
         button_layout.addWidget(self.close_btn)
 
@@ -1105,186 +2442,342 @@ class RecycleBinDialog(QDialog):
     def load_recycle_bin_contents(self):
         """
         问题3修复：加载回收站中的文件列表（支持多个回收站路径）
+
+        扫描在工作线程中进行，结果分批追加到列表
         """
-        self.file_tree.clear()
+        if self._scan_worker is not None and self._scan_worker.isRunning():
+            return
 
-        # 遍历所有回收站路径
+        self._unwatch_all()
+        self._meta_cache.clear()
+        self._filename_to_original.clear()
+        self._known_bins.clear()
+        self._bins.clear()
+        self._bin_index.clear()
+        self.model.set_rows([])
+
+        existing_paths = []
         for recycle_bin_path in self.recycle_bin_paths:
-            if not os.path.exists(recycle_bin_path):
-                logger.debug(f"回收站路径不存在: {recycle_bin_path}")
-                continue
+            if os.path.exists(recycle_bin_path):
+                existing_paths.append(recycle_bin_path)
+                self._known_bins.add(recycle_bin_path)
+                self._load_meta(recycle_bin_path)
+            else:
+                logger.debug("回收站路径不存在: %s", recycle_bin_path)
+        if not existing_paths:
+            return
+
+        # 扫描完成前列表不完整，暂时禁用针对全部文件的操作
+        self._set_bulk_actions_enabled(False)
+        self._scan_worker = RecycleScanWorker(existing_paths)
+        self._scan_worker.rows_ready.connect(self._on_scan_rows_ready)
+        self._scan_worker.scan_failed.connect(self._on_scan_failed)
+        self._scan_worker.finished.connect(self._on_scan_finished)
+        self._scan_worker.start()
+
+    def _on_scan_rows_ready(self, root_path, rows):
+        """
+        将工作线程扫描得到的一批条目追加到列表
+
+        Args:
+            root_path (str): 回收站根路径
+            rows (list): 扫描得到的条目（见 _scan_recycle_bin）
+        """
+        # 递归查找所有delete文件夹
+        self.model.append_rows(self.find_and_load_recycle_bins(root_path, rows))
+
+    def _on_scan_failed(self, root_path, message):
+        """
+        回收站扫描失败
+
+        Args:
+            root_path (str): 回收站根路径
+            message (str): 错误信息
+        """
+        QMessageBox.critical(self, "错误", f"加载回收站内容失败: {message}")
+
+    def _on_scan_finished(self):
+        """
+        回收站扫描结束，恢复针对全部文件的操作
+        """
+        self._set_bulk_actions_enabled(True)
+        self._watch_bins(self._known_bins)
+        logger.debug("加载回收站内容: %s", self.recycle_bin_paths)
+
+    def _watch_bins(self, recycle_bin_paths):
+        """
+        监听回收站目录及其中已存在的 .meta.json 文件
+
+        Args:
+            recycle_bin_paths (iterable): 回收站路径
+        """
+        paths = []
+        for recycle_bin_path in recycle_bin_paths:
+            paths.append(recycle_bin_path)
+            metadata_file = os.path.join(recycle_bin_path, ".meta.json")
+            if os.path.isfile(metadata_file):
+                paths.append(metadata_file)
+        if paths:
+            # 已在监听或不存在的路径由 Qt 忽略
+            self._watcher.addPaths(paths)
+
+    def _unwatch_all(self):
+        """
+        停止监听所有路径并丢弃尚未处理的变化
+        """
+        watched = self._watcher.directories() + self._watcher.files()
+        if watched:
+            self._watcher.removePaths(watched)
+        self._dirty_bins.clear()
+        self._watch_timer.stop()
+
+    def _on_bin_changed(self, recycle_bin_path):
+        """
+        回收站目录发生变化，延迟刷新该回收站
+
+        Args:
+            recycle_bin_path (str): 回收站路径
+        """
+        self._dirty_bins.add(recycle_bin_path)
+        self._watch_timer.start()
+
+    def _on_meta_changed(self, metadata_file):
+        """
+        回收站的 .meta.json 发生变化，延迟刷新其所在的回收站（刷新时重新读取元数据）
+
+        Args:
+            metadata_file (str): 元数据文件路径
+        """
+        self._on_bin_changed(os.path.dirname(metadata_file))
 
+    def _refresh_dirty_bins(self):
+        """
+        重新列出发生变化的回收站，与列表中的条目比较后只增删有变化的行
+        """
+        if self._scan_worker is not None and self._scan_worker.isRunning():
+            # 全量扫描结束后会重新监听，期间的变化已包含在扫描结果中
+            self._dirty_bins.clear()
+            return
+        if self._clear_worker is not None and self._clear_worker.isRunning():
+            self._dirty_bins.clear()
+            return
+
+        dirty_bins = self._dirty_bins
+        self._dirty_bins = set()
+        for recycle_bin_path in dirty_bins:
+            if recycle_bin_path not in self._known_bins:
+                continue
             try:
-                # 递归查找所有delete文件夹
-                self.find_and_load_recycle_bins(recycle_bin_path)
-                logger.debug(f"加载回收站内容: {recycle_bin_path}")
+                self._refresh_bin(recycle_bin_path)
             except Exception as e:
-                QMessageBox.critical(self, "错误", f"加载回收站内容失败: {str(e)}")
-                logger.error(f"加载回收站内容失败: {str(e)}", exc_info=True)
+                logger.error("刷新回收站内容失败: %s, %s", recycle_bin_path, e, exc_info=True)
 
-    def find_and_load_recycle_bins(self, root_path):
+    def _refresh_bin(self, recycle_bin_path):
         """
-        递归查找并加载所有回收站文件
+        增量刷新单个回收站：移除已不存在的行，追加新出现的条目
 
         Args:
-            root_path (str): 根路径
+            recycle_bin_path (str): 回收站路径
         """
         try:
-            # 先加载当前回收站目录的文件
-            for item_name in os.listdir(root_path):
-                item_path = os.path.join(root_path, item_name)
-                if os.path.isfile(item_path) or os.path.isdir(item_path):
-                    # 问题1修复：跳过.meta.json和.metadata文件
-                    if item_name == '.meta.json' or item_name.endswith('.metadata'):
-                        continue
+            current = _scan_bin_entries(recycle_bin_path)
+        except FileNotFoundError:
+            # 回收站目录已被删除
+            current = {}
+            self._known_bins.discard(recycle_bin_path)
+
+        # 元数据可能已被替换（原子替换后旧文件不再被监听），丢弃缓存后按需重新读取并重新监听
+        self._meta_cache.pop(recycle_bin_path, None)
+        if recycle_bin_path in self._known_bins:
+            self._watch_bins((recycle_bin_path,))
+
+        bin_index = self._bin_index.get(recycle_bin_path)
+        removed_rows = []
+        if bin_index is not None:
+            for row, record in enumerate(self.model.rows()):
+                if record[5] != bin_index:
+                    continue
+                if current.pop(record[4], None) is None:
+                    removed_rows.append(row)
+        self.model.remove_rows(removed_rows)
+
+        # current 中剩下的是列表中还没有的条目
+        records = []
+        if current:
+            bin_index = self._intern_bin(recycle_bin_path)
+            for path, (name, size, mtime) in current.items():
+                original_path = self.extract_original_path(name, recycle_bin_path)
+                records.append((name, original_path, size, mtime, path, bin_index))
+        self.model.append_rows(records)
+        if removed_rows or records:
+            logger.debug("刷新回收站 %s: 移除 %s 项, 新增 %s 项", recycle_bin_path, len(removed_rows), len(records))
+
+    def _set_bulk_actions_enabled(self, enabled):
+        """
+        启用或禁用“还原全部文件”和“清空回收站”按钮
+
+        Args:
+            enabled (bool): 是否启用
+        """
+        self.restore_all_btn.setEnabled(enabled)
+        self.delete_all_btn.setEnabled(enabled)
+
+    def done(self, result):
+        """
+        关闭对话框前等待工作线程结束，避免线程对象在运行中被销毁
+
+        Args:
+            result (int): 对话框结果
+        """
+        if self._scan_worker is not None and self._scan_worker.isRunning():
+            self._scan_worker.requestInterruption()
+            self._scan_worker.wait()
+        if self._clear_worker is not None and self._clear_worker.isRunning():
+            self._clear_worker.wait()
+        super().done(result)
 
-                    # 创建树形项目
-                    tree_item = QTreeWidgetItem(self.file_tree)
-                    tree_item.setText(0, item_name)
+    def find_and_load_recycle_bins(self, root_path, rows=None):
+        """
+        递归查找并加载所有回收站文件
 
-                    # 获取文件信息
-                    stat = os.stat(item_path)
-                    size = stat.st_size
-                    mtime = stat.st_mtime
+        Args:
+            root_path (str): 根路径
+            rows (list): 已在工作线程中扫描得到的条目（见 _scan_recycle_bin），为None时在当前线程扫描
 
+        Returns:
+            list: 回收站列表条目（见 RecycleBinModel）
+        """
+        records = []
+        try:
+            if rows is None:
+                rows = _scan_recycle_bin(root_path)
+
+            # 查找回收站和读取其中的条目在同一次遍历中完成，条目按所在回收站连续排列
+            for recycle_bin_path, bin_rows in itertools.groupby(rows, key=lambda row: row[0]):
+                self._known_bins.add(recycle_bin_path)
+                self._load_meta(recycle_bin_path)
+                bin_index = self._intern_bin(recycle_bin_path)
+                for _, name, path, size, mtime in bin_rows:
                     # 尝试从文件名中提取原始路径信息
-                    original_path = self.extract_original_path(item_name)
-                    tree_item.setText(1, original_path if original_path else "未知")
-                    tree_item.setText(2, self.format_size(size))
-                    tree_item.setText(3, self.format_time(mtime))
-
-                    # 保存完整路径作为数据
-                    tree_item.setData(0, Qt.ItemDataRole.UserRole, item_path)
-
-                    # 保存所在回收站路径，用于还原操作
-                    tree_item.setData(0, Qt.ItemDataRole.UserRole + 1, root_path)
-
-            # 递归查找子目录中的delete文件夹
-            for root, dirs, files in os.walk(root_path):
-                for dir_name in dirs:
-                    if dir_name == "delete":
-                        delete_path = os.path.join(root, dir_name)
-                        # 确保不是当前根目录下的delete文件夹（已经处理过了）
-                        if delete_path != self.recycle_bin_path:
-                            # 为子回收站创建一个分组项
-                            group_item = QTreeWidgetItem(self.file_tree)
-                            group_item.setText(0, f"回收站 ({delete_path})")
-                            group_item.setExpanded(True)
-
-                            # 加载该回收站中的文件
-                            for item_name in os.listdir(delete_path):
-                                item_path = os.path.join(delete_path, item_name)
-                                if os.path.isfile(item_path) or os.path.isdir(item_path):
-                                    # 问题1修复：跳过.meta.json和.metadata文件
-                                    if item_name == '.meta.json' or item_name.endswith('.metadata'):
-                                        continue
-
-                                    # 创建树形项目作为分组项的子项
-                                    tree_item = QTreeWidgetItem(group_item)
-                                    tree_item.setText(0, item_name)
-
-                                    # 获取文件信息
-                                    stat = os.stat(item_path)
-                                    size = stat.st_size
-                                    mtime = stat.st_mtime
-
-                                    # 尝试从文件名中提取原始路径信息
-                                    original_path = self.extract_original_path(item_name)
-                                    tree_item.setText(1, original_path if original_path else "未知")
-                                    tree_item.setText(2, self.format_size(size))
-                                    tree_item.setText(3, self.format_time(mtime))
-
-                                    # 保存完整路径作为数据
-                                    tree_item.setData(0, Qt.ItemDataRole.UserRole, item_path)
-
-                                    # 保存所在回收站路径，用于还原操作
-                                    tree_item.setData(0, Qt.ItemDataRole.UserRole + 1, delete_path)
+                    original_path = self.extract_original_path(name, recycle_bin_path)
+                    records.append((name, original_path, size, mtime, path, bin_index))
         except Exception as e:
             QMessageBox.critical(self, "错误", f"查找回收站内容失败: {str(e)}")
-            logger.error(f"查找回收站内容失败: {str(e)}", exc_info=True)
+            logger.error("查找回收站内容失败: %s", e, exc_info=True)
+        return records
 
-    def extract_original_path(self, filename):
+    def _intern_bin(self, recycle_bin_path):
         """
-        从文件名中提取原始路径信息
+        获取回收站路径的编号，首次出现时加入回收站列表
 
         Args:
-            filename (str): 回收站中的文件名
+            recycle_bin_path (str): 回收站路径
 
         Returns:
-            str: 原始路径，如果无法提取则返回None
+            int: 回收站编号
         """
-        # 问题3修复：在所有回收站路径中查找元数据
-        for recycle_bin_path in self.recycle_bin_paths:
-            # 检查统一的元数据文件
-            metadata_file = os.path.join(recycle_bin_path, ".meta.json")
+        bin_index = self._bin_index.get(recycle_bin_path)
+        if bin_index is None:
+            bin_index = self._bin_index[recycle_bin_path] = len(self._bins)
+            self._bins.append(recycle_bin_path)
+        return bin_index
 
-            # 首先在当前回收站路径查找元数据文件
-            if os.path.exists(metadata_file):
-                try:
-                    with open(metadata_file, 'r') as f:
-                        metadata = json.load(f)
-                        if filename in metadata:
-                            return metadata[filename]
-                except:
-                    pass
+    def _record_paths(self, record):
+        """
+        获取列表条目的完整路径和所在回收站路径
+
+        Args:
+            record (tuple): 列表条目（见 RecycleBinModel）
+
+        Returns:
+            tuple: (完整路径, 回收站路径)
+        """
+        return record[4], self._bins[record[5]]
+
+    def _selected_rows(self):
+        """
+        获取选中的行号
+
+        Returns:
+            list: 升序排列的行号
+        """
+        return sorted({index.row() for index in self.file_tree.selectionModel().selectedRows()})
 
-            # 如果在当前回收站路径找不到，尝试在其他可能的回收站路径查找
-            # 遍历所有可能的回收站路径
+    def _load_meta(self, recycle_bin_path):
+        """
+        获取回收站的元数据（文件名 -> 原始路径），首次访问时读取 .meta.json 并缓存
+
+        Args:
+            recycle_bin_path (str): 回收站路径
+
+        Returns:
+            dict: 元数据，元数据文件不存在或无法解析时为空字典
+        """
+        metadata = self._meta_cache.get(recycle_bin_path)
+        if metadata is None:
             try:
-                for root, dirs, files in os.walk(os.path.dirname(recycle_bin_path)):
-                    for dir_name in dirs:
-                        if dir_name == "delete":
-                            possible_recycle_bin = os.path.join(root, dir_name)
-                            possible_metadata = os.path.join(possible_recycle_bin, ".meta.json")
-                            if os.path.exists(possible_metadata):
-                                try:
-                                    with open(possible_metadata, 'r') as f:
-                                        metadata = json.load(f)
-                                        if filename in metadata:
-                                            return metadata[filename]
-                                except:
-                                    pass
+                metadata = _load_metadata_file(os.path.join(recycle_bin_path, ".meta.json"))
+            except FileNotFoundError:
+                metadata = {}
             except Exception as e:
-                logger.error(f"查找元数据文件时发生异常: {str(e)}")
+                logger.warning("读取回收站元数据失败: %s, %s", recycle_bin_path, e)
+                metadata = {}
+            self._meta_cache[recycle_bin_path] = metadata
+            # 合并到反向索引，直接覆盖，重新加载后不保留过期的原始路径
+            self._filename_to_original.update(metadata)
+        return metadata
 
-        # 如果找不到元数据，尝试从文件名中提取（假设文件名包含路径信息）
-        return None
+    def extract_original_path(self, filename, recycle_bin_path=None):
+        """
+        从文件名中提取原始路径信息
+
+        Args:
+            filename (str): 回收站中的文件名
+            recycle_bin_path (str): 文件所在的回收站路径，提供时先在该回收站的元数据中查找
+
+        Returns:
+            str: 原始路径，如果无法提取则返回None
+        """
+        if recycle_bin_path is not None:
+            original_path = self._load_meta(recycle_bin_path).get(filename)
+            if original_path:
+                return original_path
+
+        # 问题3修复：在所有已加载回收站的元数据中查找，不再遍历目录树
+        return self._filename_to_original.get(filename)
 
     def restore_selected(self):
         """
         还原选中的文件
         """
-        selected_items = self.file_tree.selectedItems()
-        if not selected_items:
+        selected_rows = self._selected_rows()
+        if not selected_rows:
             QMessageBox.information(self, "提示", "请先选择要还原的文件!")
             logger.debug("未选择要还原的文件")
             return
 
-        restored_count = 0
-        for item in selected_items:
-            file_path = item.data(0, Qt.ItemDataRole.UserRole)
-            # 获取该文件所在的回收站路径
-            recycle_bin_path = item.data(0, Qt.ItemDataRole.UserRole + 1) or self.recycle_bin_path
-            if self.restore_file(file_path, recycle_bin_path):
-                # 从列表中移除
-                index = self.file_tree.indexOfTopLevelItem(item)
-                if index >= 0:
-                    self.file_tree.takeTopLevelItem(index)
-                else:
-                    # 如果是子项，从父项中移除
-                    parent = item.parent()
-                    if parent:
-                        parent.removeChild(item)
-                restored_count += 1
-
-        logger.info(f"还原 {restored_count} 个文件")
+        restored_rows = []
+        # 按回收站收集待移除的元数据记录，循环结束后每个回收站只重写一次
+        pending_removals = {}
+        errors = []
+        for row in selected_rows:
+            file_path, recycle_bin_path = self._record_paths(self.model.row_data(row))
+            if self.restore_file(file_path, recycle_bin_path, update_metadata=False, cleanup=False, errors=errors):
+                pending_removals.setdefault(recycle_bin_path, set()).add(os.path.basename(file_path))
+                restored_rows.append(row)
+
+        # 从列表中移除
+        self.model.remove_rows(restored_rows)
+        self.flush_metadata_removals(pending_removals)
+        logger.info("还原 %s 个文件", len(restored_rows))
+        self._show_errors("还原文件失败", errors)
 
     def restore_all(self):
         """
         还原所有文件
         """
-        root = self.file_tree.invisibleRootItem() if self.file_tree else None
-        count = root.childCount() if root else 0
+        records = self.model.rows()
+        count = len(records)
 
         if count == 0:
             QMessageBox.information(self, "提示", "回收站是空的!")
@@ -1294,26 +2787,37 @@ class RecycleBinDialog(QDialog):
         reply = QMessageBox.question(self, "确认", f"确定要还原全部 {count} 个文件吗?",
                                      QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            restored_count = 0
-            # 从后往前删除避免索引变化问题
-            for i in range(count - 1, -1, -1):
-                item = root.child(i) if root else None
-                file_path = item.data(0, Qt.ItemDataRole.UserRole) if item else ""
-                # 获取该文件所在的回收站路径
-                recycle_bin_path = (item.data(0, Qt.ItemDataRole.UserRole + 1) if item else "") or self.recycle_bin_path
-                if self.restore_file(file_path, recycle_bin_path):
-                    self.file_tree.takeTopLevelItem(i)
-                    restored_count += 1
-
-            logger.info(f"还原全部 {restored_count} 个文件")
-
-    def restore_file(self, file_path, recycle_bin_path=None):
+            restored_rows = []
+            pending_removals = {}
+            errors = []
+            for row, record in enumerate(records):
+                file_path, recycle_bin_path = self._record_paths(record)
+                if self.restore_file(file_path, recycle_bin_path, update_metadata=False, cleanup=False,
+                                     errors=errors):
+                    pending_removals.setdefault(recycle_bin_path, set()).add(os.path.basename(file_path))
+                    restored_rows.append(row)
+            restored_count = len(restored_rows)
+
+            # 统一更新列表，连续的行合并为一次移除
+            if restored_count == count:
+                self.model.set_rows([])
+            elif restored_rows:
+                self.model.remove_rows(restored_rows)
+
+            self.flush_metadata_removals(pending_removals)
+            logger.info("还原全部 %s 个文件", restored_count)
+            self._show_errors("还原文件失败", errors)
+
+    def restore_file(self, file_path, recycle_bin_path=None, update_metadata=True, cleanup=True, errors=None):
         """
         还原单个文件到原始位置
 
         Args:
             file_path (str): 要还原的文件路径
             recycle_bin_path (str): 文件所在的回收站路径
+            update_metadata (bool): 是否立即从元数据文件中移除记录，批量还原时由调用方统一移除
+            cleanup (bool): 是否立即清理空的回收站目录，批量还原时由调用方对每个回收站清理一次
+            errors (list): 不为None时失败信息追加到该列表，由调用方统一提示，否则立即弹窗提示
 
         Returns:
             bool: 是否还原成功
@@ -1323,44 +2827,41 @@ class RecycleBinDialog(QDialog):
 
             # 如果未提供回收站路径，则使用默认路径
             if recycle_bin_path is None:
-                recycle_bin_path = self.recycle_bin_path
+                recycle_bin_path = self.recycle_bin_paths[0]
 
             # 尝试获取原始路径
-            original_path = self.extract_original_path(filename)
+            original_path = self.extract_original_path(filename, recycle_bin_path)
 
-            # 如果没有原始路径信息，则使用默认还原路径（回收站的上级目录）
+            # 如果没有原始路径信息，则使用默认还原路径（回收站的上级目录），并去掉移入回收站时添加的时间前缀
             if not original_path:
                 parent_dir = os.path.dirname(recycle_bin_path)  # 回收站的上级目录
-                original_path = os.path.join(parent_dir, filename)
-
-            # 处理重名情况
-            destination = original_path
-            counter = 1
-            base_name, ext = os.path.splitext(os.path.basename(original_path))
-            dir_name = os.path.dirname(original_path)
-            while os.path.exists(destination):
-                new_filename = f"{base_name}_{counter}{ext}"
-                destination = os.path.join(dir_name, new_filename)
-                counter += 1
+                original_path = os.path.join(parent_dir, RECYCLE_NAME_TIME_RE.sub('', filename, count=1))
 
             # 确保目标路径的目录存在
-            destination_dir = os.path.dirname(destination)
-            if not os.path.exists(destination_dir):
-                os.makedirs(destination_dir)
+            target_dir = os.path.dirname(original_path)
+            os.makedirs(target_dir, exist_ok=True)
 
-            shutil.move(file_path, destination)
-            logger.info(f"还原文件: {file_path} -> {destination}")
+            # 处理重名情况：原子地占用不重名的目标路径（创建失败即说明重名，不再逐个 stat 候选名称），
+            # 同一文件系统内直接重命名替换占位项，跨设备时再回退到 shutil.move
+            destination = _move_into_dir(file_path, target_dir, os.path.isdir(file_path),
+                                         os.path.basename(original_path))
+            logger.info("还原文件: %s -> %s", file_path, destination)
 
             # 从元数据文件中移除该文件的记录
-            self.remove_from_metadata(recycle_bin_path, filename)
+            if update_metadata:
+                self.remove_from_metadata(recycle_bin_path, filename)
 
             # 检查回收站目录是否为空，如果为空则删除
-            self.cleanup_empty_recycle_bin(recycle_bin_path)
+            if cleanup:
+                self.cleanup_empty_recycle_bin(recycle_bin_path)
 
             return True
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"还原文件失败: {str(e)}")
-            logger.error(f"还原文件失败: {str(e)}", exc_info=True)
+            logger.error("还原文件失败: %s", e, exc_info=True)
+            if errors is not None:
+                errors.append(f"{os.path.basename(file_path)}: {e}")
+            else:
+                QMessageBox.critical(self, "错误", f"还原文件失败: {str(e)}")
             return False
 
     def remove_from_metadata(self, recycle_bin_path, filename):
@@ -1371,59 +2872,81 @@ class RecycleBinDialog(QDialog):
             recycle_bin_path (str): 回收站路径
             filename (str): 文件名
         """
+        self.remove_from_metadata_batch(recycle_bin_path, {filename})
+
+    def remove_from_metadata_batch(self, recycle_bin_path, filenames):
+        """
+        从元数据中批量移除文件记录，元数据文件只重新读取并写回一次
+
+        Args:
+            recycle_bin_path (str): 回收站路径
+            filenames (set): 文件名集合
+        """
+        metadata = self._load_meta(recycle_bin_path)
+        for filename in filenames:
+            if metadata.pop(filename, None) is not None:
+                self._filename_to_original.pop(filename, None)
+        self.flush_metadata(recycle_bin_path, filenames)
+
+    def flush_metadata(self, recycle_bin_path, removed=()):
+        """
+        从回收站的元数据文件中移除记录：在锁内重新读取文件后合并写回，不覆盖对话框打开期间
+        其他线程（移入回收站、清理过期条目）新增的记录；没有记录时删除元数据文件
+
+        Args:
+            recycle_bin_path (str): 回收站路径
+            removed (iterable): 要移除的文件名
+        """
         metadata_file = os.path.join(recycle_bin_path, ".meta.json")
         try:
-            # 如果元数据文件存在，读取现有数据
-            if os.path.exists(metadata_file):
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
+            metadata = _update_metadata_file(metadata_file, removed=removed)
+            self._meta_cache[recycle_bin_path] = metadata
+            # 重新读取的记录可能包含其他线程写入的新路径
+            self._filename_to_original.update(metadata)
+            logger.debug("从元数据文件中移除记录: %s", recycle_bin_path)
+        except Exception as e:
+            logger.error("写回元数据文件失败: %s", e, exc_info=True)
 
-                # 移除指定文件的记录
-                if filename in metadata:
-                    del metadata[filename]
+    def flush_metadata_removals(self, pending_removals):
+        """
+        将批量操作中收集的元数据移除记录按回收站写回，然后对每个涉及的回收站检查一次是否已空
 
-                # 如果还有其他记录，写回文件
-                if metadata:
-                    with open(metadata_file, 'w') as f:
-                        json.dump(metadata, f, indent=2, ensure_ascii=False)
-                    logger.debug(f"从元数据文件中移除记录: {filename}")
-                else:
-                    # 如果没有记录了，删除元数据文件
-                    os.remove(metadata_file)
-                    logger.debug(f"删除空的元数据文件: {metadata_file}")
-        except Exception as e:
-            logger.error(f"从元数据文件中移除记录失败: {e}", exc_info=True)
+        Args:
+            pending_removals (dict): 回收站路径 -> 文件名集合
+        """
+        for recycle_bin_path, filenames in pending_removals.items():
+            self.remove_from_metadata_batch(recycle_bin_path, filenames)
+        # 元数据写回后再清理，空回收站的元数据文件已被删除或只剩元数据文件
+        for recycle_bin_path in pending_removals:
+            self.cleanup_empty_recycle_bin(recycle_bin_path)
 
     def delete_selected(self):
         """
         彻底删除选中的文件
         """
-        selected_items = self.file_tree.selectedItems()
-        if not selected_items:
+        selected_rows = self._selected_rows()
+        if not selected_rows:
             QMessageBox.information(self, "提示", "请先选择要删除的文件!")
             logger.debug("未选择要删除的文件")
             return
 
-        reply = QMessageBox.question(self, "确认", f"确定要彻底删除选中的 {len(selected_items)} 个文件吗?\n此操作不可恢复!",
+        reply = QMessageBox.question(self, "确认", f"确定要彻底删除选中的 {len(selected_rows)} 个文件吗?\n此操作不可恢复!",
                                      QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            deleted_count = 0
-            for item in selected_items:
-                file_path = item.data(0, Qt.ItemDataRole.UserRole)
-                recycle_bin_path = item.data(0, Qt.ItemDataRole.UserRole + 1) or self.recycle_bin_path
-                if self.delete_file(file_path):
-                    # 从列表中移除
-                    index = self.file_tree.indexOfTopLevelItem(item)
-                    if index >= 0:
-                        self.file_tree.takeTopLevelItem(index)
-                    else:
-                        # 如果是子项，从父项中移除
-                        parent = item.parent()
-                        if parent:
-                            parent.removeChild(item)
-                    deleted_count += 1
-
-            logger.info(f"彻底删除 {deleted_count} 个文件")
+            deleted_rows = []
+            pending_removals = {}
+            errors = []
+            for row in selected_rows:
+                file_path, recycle_bin_path = self._record_paths(self.model.row_data(row))
+                if self.delete_file(file_path, cleanup=False, errors=errors):
+                    pending_removals.setdefault(recycle_bin_path, set()).add(os.path.basename(file_path))
+                    deleted_rows.append(row)
+
+            # 从列表中移除
+            self.model.remove_rows(deleted_rows)
+            self.flush_metadata_removals(pending_removals)
+            logger.info("彻底删除 %s 个文件", len(deleted_rows))
+            self._show_errors("删除文件失败", errors)
 
     def delete_all(self):
         """
@@ -1432,33 +2955,74 @@ class RecycleBinDialog(QDialog):
         reply = QMessageBox.question(self, "确认", "确定要清空回收站吗?\n此操作不可恢复!",
                                      QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            try:
-                # 删除所有delete文件夹
-                if os.path.exists(self.recycle_bin_path):
-                    shutil.rmtree(self.recycle_bin_path)
-                    logger.info(f"删除回收站目录: {self.recycle_bin_path}")
-
-                # 递归查找并删除所有子目录中的delete文件夹
-                root_dir = os.path.dirname(self.recycle_bin_path)
-                for root, dirs, files in os.walk(root_dir):
-                    for dir_name in dirs:
-                        if dir_name == "delete":
-                            delete_path = os.path.join(root, dir_name)
-                            if os.path.exists(delete_path):
-                                shutil.rmtree(delete_path)
-                                logger.info(f"删除子回收站目录: {delete_path}")
-
-                self.file_tree.clear()
-            except Exception as e:
-                QMessageBox.critical(self, "错误", f"清空回收站失败: {str(e)}")
-                logger.error(f"清空回收站失败: {str(e)}", exc_info=True)
+            if self._clear_worker is not None and self._clear_worker.isRunning():
+                return
 
-    def delete_file(self, file_path):
+            # 在工作线程中删除加载时发现的所有回收站目录，不再重新遍历目录树
+            recycle_bin_paths = list(self._known_bins)
+            self._unwatch_all()
+            self._known_bins.clear()
+            self._meta_cache.clear()
+            self._filename_to_original.clear()
+            self.model.set_rows([])
+
+            self._set_bulk_actions_enabled(False)
+            self._clear_worker = RecycleBinClearWorker(recycle_bin_paths)
+            self._clear_worker.clear_finished.connect(self._on_clear_finished)
+            self._clear_worker.start()
+
+    def configure_retention(self):
+        """
+        设置自动清理：超过保留天数的条目会被定期彻底删除，0 表示关闭，启用前需要用户确认
+        """
+        days, ok = QInputDialog.getInt(
+            self, "自动清理设置", "自动彻底删除回收站中超过以下天数的条目（0 表示不自动清理）:",
+            self.retention_days or RECYCLE_BIN_RETENTION_DAYS, 0, 3650)
+        if not ok or days == self.retention_days:
+            return
+        if days > 0:
+            reply = QMessageBox.question(
+                self, "确认", f"启用后，回收站中删除超过 {days} 天的条目会被定期彻底删除，此操作不可恢复!\n确定要启用吗?",
+                QMessageBox.Yes | QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return
+        self.retention_days = days
+        self.retention_changed.emit(days)
+        logger.info("回收站自动清理保留天数: %s", days)
+
+    def _show_errors(self, title, errors):
+        """
+        批量操作结束后统一提示失败的条目，最多列出前 ERROR_SUMMARY_LIMIT 条
+
+        Args:
+            title (str): 提示标题
+            errors (list): 失败信息列表
+        """
+        if not errors:
+            return
+        QMessageBox.critical(self, "错误", _format_error_summary(title, errors))
+
+    def _on_clear_finished(self, failures):
+        """
+        清空回收站完成，部分删除失败时提示并重新加载剩余内容
+
+        Args:
+            failures (list): 删除失败的 (回收站路径, 错误信息) 列表
+        """
+        self._set_bulk_actions_enabled(True)
+        # 对话框已关闭（关闭时会等待清空完成）则不再提示
+        if failures and self.isVisible():
+            QMessageBox.critical(self, "错误", f"清空回收站失败: {failures[0][1]}")
+            self.load_recycle_bin_contents()
+
+    def delete_file(self, file_path, cleanup=True, errors=None):
         """
         彻底删除单个文件
 
         Args:
             file_path (str): 要删除的文件路径
+            cleanup (bool): 是否立即清理空的回收站目录，批量删除时由调用方对每个回收站清理一次
+            errors (list): 不为None时失败信息追加到该列表，由调用方统一提示，否则立即弹窗提示
 
         Returns:
             bool: 是否删除成功
@@ -1470,49 +3034,40 @@ class RecycleBinDialog(QDialog):
                 shutil.rmtree(file_path)
 
             # 检查文件所在的回收站目录是否为空，如果为空则删除该目录
-            self.cleanup_empty_recycle_bin(os.path.dirname(file_path))
-            logger.info(f"彻底删除文件: {file_path}")
+            if cleanup:
+                self.cleanup_empty_recycle_bin(os.path.dirname(file_path))
+            logger.info("彻底删除文件: %s", file_path)
 
             return True
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"删除文件失败: {str(e)}")
-            logger.error(f"删除文件失败: {str(e)}", exc_info=True)
+            logger.error("删除文件失败: %s", e, exc_info=True)
+            if errors is not None:
+                errors.append(f"{os.path.basename(file_path)}: {e}")
+            else:
+                QMessageBox.critical(self, "错误", f"删除文件失败: {str(e)}")
             return False
 
     def cleanup_empty_recycle_bin(self, recycle_bin_path):
         """
         清理空的回收站目录
 
-        Args:
-            recycle_bin_path (str): 回收站路径
-        """
-        try:
-            # 检查目录是否存在
-            if not os.path.exists(recycle_bin_path):
-                return
-
-            # 检查是否是delete目录
-            if not os.path.basename(recycle_bin_path) == "delete":
-                return
-
-            # 检查目录是否为空（忽略.meta.json文件）
-            items = os.listdir(recycle_bin_path)
-            # 过滤掉.meta.json文件
-            items = [item for item in items if item != ".meta.json"]
-
-            # 如果目录为空，则删除该目录和元数据文件
-            if not items:
-                # 删除元数据文件（如果存在）
-                metadata_file = os.path.join(recycle_bin_path, ".meta.json")
-                if os.path.exists(metadata_file):
-                    os.remove(metadata_file)
-                    logger.debug(f"删除空回收站的元数据文件: {metadata_file}")
+        Args:
+            recycle_bin_path (str): 回收站路径
+        """
+        # 检查是否是delete目录
+        if not os.path.basename(recycle_bin_path) == "delete":
+            return
 
-                # 删除空的回收站目录
-                os.rmdir(recycle_bin_path)
-                logger.info(f"删除空回收站目录: {recycle_bin_path}")
+        try:
+            # 检查目录是否为空（忽略元数据文件），目录不存在时直接抛出 FileNotFoundError
+            if _remove_bin_if_empty(recycle_bin_path):
+                self._meta_cache.pop(recycle_bin_path, None)
+                logger.info("删除空回收站目录: %s", recycle_bin_path)
+        except FileNotFoundError:
+            # 回收站目录已不存在
+            return
         except Exception as e:
-            logger.error(f"清理空回收站目录时出错: {e}", exc_info=True)
+            logger.error("清理空回收站目录时出错: %s", e, exc_info=True)
 
     def format_size(self, size):
         """
@@ -1524,7 +3079,7 @@ class RecycleBinDialog(QDialog):
         Returns:
             str: 格式化后的大小字符串
         """
-        for unit in ['B', 'KB', 'MB', 'GB']:
+        for unit in SIZE_UNITS:
             if size < 1024.0:
                 return f"{size:.1f} {unit}"
             size /= 1024.0
@@ -1540,9 +3095,7 @@ class RecycleBinDialog(QDialog):
         Returns:
             str: 格式化后的时间字符串
         """
-        from datetime import datetime
-        dt = datetime.fromtimestamp(timestamp)
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+        return time.strftime(DISPLAY_TIME_FORMAT, time.localtime(timestamp))
 
 
 class FileManagerPanel(QWidget):
@@ -1550,6 +3103,8 @@ class FileManagerPanel(QWidget):
     文件管理面板类，负责显示文件树和管理文件操作
     """
 
+    supported_files_ready = pyqtSignal()  # 后台重新遍历得到了新的支持预览的文件列表
+
     def __init__(self, width=None, height=None):
         """
         初始化文件管理面板
@@ -1565,19 +3120,121 @@ class FileManagerPanel(QWidget):
 
         self.events = FileManagerEvents()
         self.delete_folder = "delete"  # 回收站文件夹名
+        self._recycle_folder_key = os.path.normcase(self.delete_folder)  # 用于快速排除不含回收站目录名的路径
+        # 在路径字符串中查找回收站目录用的分隔符包围形式
+        self._recycle_needles = tuple(f"{sep}{self.delete_folder}{end}" for sep in '/\\' for end in '/\\')
         self.imported_root_paths = []  # 保存导入的根路径列表
+        self._normalized_roots = {}  # 标准化根路径的路径分段元组 -> 原始根路径，随 imported_root_paths 同步更新
+        self._recycle_sentinels = set()  # 各根路径下回收站目录的路径分段元组
+        self._recycle_sentinel_depths = ()  # 回收站目录路径分段元组的长度，判断时只需检查这些层级
+        self._recycle_check_cache = OrderedDict()  # 路径 -> 是否在回收站中，LRU 淘汰，根路径变化时清空
+        self._exists_cache = {}  # 路径 -> (检查时间, 是否存在)，避免短时间内重复 stat 同一路径
+        self._path_stat_cache = {}  # 启动时检查根路径得到的 路径 -> os.stat_result，添加监听时使用一次后移除
+        self._recycle_bin_paths = {}  # 根路径 -> 回收站路径
+        self._root_ancestors = {}  # 根路径各级上级目录的路径分段元组 -> 位于其下的根路径
         self.drag_source_path = None  # 保存拖拽源路径
         self.is_searching = False  # 标记是否正在搜索，用于阻止搜索时触发预览
+        self._name_index = {}  # 小写文件名 -> QPersistentModelIndex 列表，用于快速搜索
+        self._size_cache = {}  # 文件夹路径 -> (目录 mtime_ns, 大小MB)，避免重复遍历未变化的目录
+        self._size_worker = None  # 正在运行的文件夹大小计算线程
+        self._move_worker = None  # 正在运行的回收站移动线程
+        self._drop_worker = None  # 正在运行的拖放移动线程
+        self._preview_panel_ref = None  # 主窗口预览面板的弱引用，首次使用时查找
+        self._pending_drops = []  # 等待移动的 (源路径, 目标目录, 是否文件夹) 列表
+        self._algo_test_dir_cache = None  # 算法测试当前目录的缓存 (目录, 排序后的支持文件列表, 路径 -> 位置)
+        self._watch_index = None  # 持久化的监听目录索引，首次使用时加载
+        # 连续添加多个监听（如启动时恢复所有根路径）后只在事件循环空闲时保存一次监听目录索引
+        self._watch_index_timer = QTimer(self)
+        self._watch_index_timer.setSingleShot(True)
+        self._watch_index_timer.setInterval(0)
+        self._watch_index_timer.timeout.connect(self._save_watch_index)
+        self._file_index_cache = None  # 按树顺序缓存的文件列表，None 表示需要重新收集
+        self._path_to_pos = {}  # 文件路径 -> 在缓存列表中的下标
+        self._supported_files = []  # 缓存列表中支持预览的文件路径
+        self._supported_rank = [0]  # 第 i 个文件之前的支持文件数量
+        self._path_to_index = {}  # 文件/文件夹路径 -> QPersistentModelIndex，随文件列表一起缓存
+        self._supported_files_cache = None  # get_supported_files_list 的缓存结果
+        self._supported_files_index = None  # 支持预览的文件路径 -> 在缓存列表中的下标
+        # 上一次遍历得到的列表，重新遍历期间继续返回，避免标题中的位置信息闪烁
+        self._stale_supported_files = []
+        # 文件索引版本，每次失效时加一；遍历期间发生变化的结果会被丢弃并重新遍历
+        self._file_index_generation = 0
+        self._supported_files_worker = None
+
+        # 搜索防抖定时器，连续输入时只触发一次搜索
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._run_pending_search)
+
+        # 唯一的刷新防抖定时器：文件监听事件、文件操作和刷新按钮的请求都经 _schedule_refresh 合并为一次刷新
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(150)
+        self._refresh_timer.timeout.connect(self.refresh_view_keep_expanded)
+        # 合并的请求中是否有需要重新检查根路径存在性的（刷新按钮）
+        self._refresh_recheck_roots = False
+        # 等待加入视图的导入文件夹，连续导入在事件循环空闲时合并为一次根路径更新
+        self._pending_imports = []
+
+        # 用户启用自动清理后，定期彻底删除回收站中超过保留天数的条目（默认关闭）
+        self._purge_worker = None
+        self._retention_days = 0
+        self._purge_timer = QTimer(self)
+        self._purge_timer.setInterval(RECYCLE_BIN_PURGE_INTERVAL_MS)
+        self._purge_timer.timeout.connect(self.purge_recycle_bins)
 
         # 问题4修复：初始化文件系统监听器
         self.file_watcher = QFileSystemWatcher()
         self.file_watcher.directoryChanged.connect(self.on_directory_changed)
         self.file_watcher.fileChanged.connect(self.on_file_changed)
 
+        # 安装了 watchdog 时每个根路径只注册一个递归监听，不受 inotify 监听数量限制；
+        # 事件在观察线程中产生，通过信号排队回到界面线程处理
+        self._observer = None
+        self._observed_watches = {}  # 根路径 -> watchdog 监听句柄
+        if Observer is not None:
+            self._watch_bridge = WatchdogEventBridge()
+            self._watch_bridge.path_changed.connect(self.on_directory_changed, Qt.ConnectionType.QueuedConnection)
+            self._observer = Observer()
+            self._observer.start()
+            # 退出时停止观察线程并等待其结束
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self._stop_observer)
+
         self.init_ui()
 
         # 自动加载持久化路径，确保用户重启后能看到上次导入的文件夹内容
         self.load_persistent_paths()
+        # 恢复用户设置的回收站自动清理（默认关闭）
+        self.set_recycle_bin_retention(self.ui.load_recycle_bin_retention_days(), save=False)
+
+    def _stop_observer(self):
+        """
+        停止 watchdog 观察线程并等待其结束
+        """
+        observer = self._observer
+        if observer is None:
+            return
+        self._observer = None
+        self._observed_watches.clear()
+        try:
+            observer.stop()
+            observer.join()
+            logger.debug("已停止 watchdog 观察线程")
+        except Exception as e:
+            logger.error("停止 watchdog 观察线程时发生异常: %s", e)
+
+    def closeEvent(self, event):
+        """
+        面板关闭时停止 watchdog 观察线程
+
+        Args:
+            event: 关闭事件
+        """
+        self._stop_observer()
+        super().closeEvent(event)
 
     def init_ui(self):
         """
@@ -1599,6 +3256,11 @@ class FileManagerPanel(QWidget):
             if self.ui.search_box:
                 self.ui.search_box.textChanged.connect(self.on_search_text_changed)
 
+            # 维护文件名索引，模型插入或重建时同步更新
+            if self.ui.model:
+                self.ui.model.rowsInserted.connect(self._on_model_rows_inserted)
+                self.ui.model.rowsRemoved.connect(self._on_model_rows_removed)
+
             # 连接树形视图的点击事件，用于处理文件和文件夹点击
             if self.ui and self.ui.tree_view:
                 self.ui.tree_view.clicked.connect(self.on_item_clicked)
@@ -1612,10 +3274,12 @@ class FileManagerPanel(QWidget):
 
             # 连接拖拽事件
             self.ui.file_dropped.connect(self.handle_file_drop)
+            self.ui.drop_finished.connect(self._start_drop_moves)
 
             # 连接事件处理器
             self.events.file_selected.connect(self.on_file_selected)
-            self.events.file_deleted.connect(self.on_file_deleted)
+            # 排队调用：同步删除时让当前的模型通知先处理完，再开始刷新
+            self.events.file_deleted.connect(self.on_file_deleted, Qt.ConnectionType.QueuedConnection)
 
             # 添加控件到布局
             layout.addWidget(self.ui)
@@ -1626,8 +3290,7 @@ class FileManagerPanel(QWidget):
             self.delete_shortcut.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)  # 只在当前widget或其子widget有焦点时激活
             self.delete_shortcut.activated.connect(self.delete_selected_file)
         except Exception as e:
-            logger.error(f"FileManagerPanel初始化UI时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("FileManagerPanel初始化UI时发生异常: %s", e, exc_info=True)
             raise
 
     def on_search_text_changed(self, text):
@@ -1640,13 +3303,21 @@ class FileManagerPanel(QWidget):
         try:
             # 如果搜索文本为空，则不做特殊处理，保持原有显示
             if not text:
+                self._search_timer.stop()
                 return
 
-            # 在文件树中查找匹配的文件
-            self.find_and_select_file(text)
+            # 重新开始计时，输入停顿后再在文件树中查找匹配的文件
+            self._search_timer.start()
         except Exception as e:
-            logger.error(f"处理搜索文本变化时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("处理搜索文本变化时发生异常: %s", e, exc_info=True)
+
+    def _run_pending_search(self):
+        """
+        搜索防抖定时器到期后执行搜索
+        """
+        text = self.ui.search_box.text() if self.ui and self.ui.search_box else ""
+        if text:
+            self.find_and_select_file(text)
 
     def find_and_select_file(self, search_text):
         """
@@ -1662,8 +3333,8 @@ class FileManagerPanel(QWidget):
             # 设置搜索标志，阻止预览
             self.is_searching = True
 
-            # 从模型根节点开始递归查找
-            matched_index = self._find_file_in_model(self.ui.model.invisibleRootItem(), search_text.lower())
+            # 在文件名索引中查找
+            matched_index = self._find_file_in_index(search_text.lower())
 
             if matched_index and matched_index.isValid():
                 # 选中找到的文件（不触发预览）
@@ -1679,100 +3350,155 @@ class FileManagerPanel(QWidget):
             # 重置搜索标志
             self.is_searching = False
         except Exception as e:
-            logger.error(f"查找并选中文件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("查找并选中文件时发生异常: %s", e, exc_info=True)
             # 确保重置搜索标志
             self.is_searching = False
 
-    def _find_file_in_model(self, parent_item, search_text):
+    def _on_model_rows_inserted(self, parent, first, last):
+        """
+        模型插入行时将新项加入文件名索引
+
+        Args:
+            parent (QModelIndex): 父索引
+            first (int): 插入的第一行
+            last (int): 插入的最后一行
+        """
+        model = self.ui.model
+        for row in range(first, last + 1):
+            index = model.index(row, 0, parent)
+            name = model.data(index)
+            if not name or name == "加载中...":
+                continue
+            self._name_index.setdefault(name.lower(), []).append(QPersistentModelIndex(index))
+
+    def _on_model_rows_removed(self, parent, first, last):
+        """
+        模型移除行时维护文件名索引：根节点被移除（重建树）时清空索引，
+        其余情况下失效的索引在搜索时跳过
+
+        Args:
+            parent (QModelIndex): 父索引
+            first (int): 移除的第一行
+            last (int): 移除的最后一行
+        """
+        if not parent.isValid():
+            self._name_index.clear()
+
+    def _find_file_in_index(self, search_text):
         """
         问题2修复：只在已展开的文件夹中查找匹配的文件，不触发延迟加载
 
         Args:
-            parent_item (QStandardItem): 父项
             search_text (str): 要搜索的文本（小写）
 
         Returns:
             QModelIndex: 匹配的索引，如果未找到则返回None
         """
         try:
-            if not parent_item:
-                return None
-
-            # 遍历所有子项
-            for row in range(parent_item.rowCount()):
-                child_item = parent_item.child(row, 0)
-                if not child_item:
+            for name, persistent_indexes in self._name_index.items():
+                if search_text not in name:
                     continue
-
-                # 检查文件名是否匹配
-                file_name = child_item.text()
-                if search_text in file_name.lower():
-                    # 检查是否是文件
-                    file_path = child_item.data(Qt.ItemDataRole.UserRole)
-                    if file_path and os.path.isfile(file_path):
-                        return child_item.index()
-
-                # 问题2修复：只在已展开的文件夹中递归搜索
-                # 检查该项是否已展开
-                if child_item.rowCount() > 0:
-                    child_index = child_item.index()
-                    if self.ui.tree_view.isExpanded(child_index):
-                        # 只有在文件夹已展开的情况下才继续搜索
-                        # 检查是否是占位项，如果是则跳过（说明还未真正展开）
-                        first_grandchild = child_item.child(0)
-                        if first_grandchild and first_grandchild.text() == "加载中...":
-                            # 跳过未加载的文件夹
-                            continue
-
-                        result = self._find_file_in_model(child_item, search_text)
-                        if result and result.isValid():
-                            return result
+                for persistent_index in persistent_indexes:
+                    if not persistent_index.isValid():
+                        continue
+                    index = QModelIndex(persistent_index)
+                    # 只匹配所有上级文件夹均已展开的文件
+                    if not self._is_index_visible(index):
+                        continue
+                    if index.data(ITEM_TYPE_ROLE) == 'file':
+                        return index
 
             return None
         except Exception as e:
-            logger.error(f"在模型中递归查找文件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("在文件名索引中查找文件时发生异常: %s", e, exc_info=True)
             return None
 
+    def _is_index_visible(self, index):
+        """
+        判断索引的所有上级节点是否都已展开
+
+        Args:
+            index (QModelIndex): 模型索引
+
+        Returns:
+            bool: 是否可见
+        """
+        parent = index.parent()
+        while parent.isValid():
+            if not self.ui.tree_view.isExpanded(parent):
+                return False
+            parent = parent.parent()
+        return True
+
     def import_folders(self):
         """
         导入多个文件夹功能，使用文件系统选择对话框，显示文件夹大小
         """
         try:
+            if self._size_worker and self._size_worker.isRunning():
+                QMessageBox.information(self, "提示", "正在计算文件夹大小，请稍候")
+                return
+
             # 打开文件夹选择对话框，允许选择多个文件夹
             folder_path = QFileDialog.getExistingDirectory(self, "选择文件夹")
             if folder_path and os.path.exists(folder_path):
-                # 计算文件夹大小
-                folder_size_mb = self._calculate_folder_size(folder_path)
-
-                # 显示确认对话框，显示文件夹大小
-                folder_name = os.path.basename(folder_path)
-                reply = QMessageBox.question(
-                    self,
-                    "确认导入",
-                    f"文件夹: {folder_name}\n大小: {folder_size_mb:.2f} MB\n\n确定要导入此文件夹吗？",
-                    QMessageBox.Yes | QMessageBox.No
-                )
-
-                if reply == QMessageBox.StandardButton.Yes:
-                    if folder_path not in self.imported_root_paths:
-                        self.imported_root_paths.append(folder_path)
-                        self.ui.set_root_paths(self.imported_root_paths)
-
-                        # 问题4修复：添加文件监听
-                        self.add_path_to_watcher(folder_path)
+                # 目录未变化时直接使用缓存的大小
+                cached_size_mb = self._get_cached_folder_size(folder_path)
+                if cached_size_mb is not None:
+                    self._confirm_import_folder(folder_path, cached_size_mb)
+                    return
 
-                        logger.info(f"导入文件夹: {folder_path}, 大小: {folder_size_mb:.2f} MB")
-                        QMessageBox.information(self, "成功", f"文件夹已导入\n大小: {folder_size_mb:.2f} MB")
-                    else:
-                        QMessageBox.information(self, "提示", "此文件夹已经导入！")
+                # 在工作线程中计算文件夹大小，完成后再弹出确认对话框
+                self._size_worker = FolderSizeWorker(folder_path, self.delete_folder)
+                self._size_worker.size_calculated.connect(self.on_folder_size_calculated)
+                self._size_worker.start()
             elif folder_path:
                 QMessageBox.warning(self, "错误", "文件夹路径不存在!")
-                logger.warning(f"尝试导入不存在的文件夹: {folder_path}")
+                logger.warning("尝试导入不存在的文件夹: %s", folder_path)
+        except Exception as e:
+            logger.error("导入文件夹时发生异常: %s", e, exc_info=True)
+            QMessageBox.critical(self, "错误", f"导入文件夹时发生异常: {str(e)}")
+
+    def on_folder_size_calculated(self, folder_path, mtime_ns, folder_size_mb):
+        """
+        文件夹大小计算完成，写入缓存并弹出导入确认对话框
+
+        Args:
+            folder_path (str): 文件夹路径
+            mtime_ns (int): 计算前的目录修改时间，计算失败时为None
+            folder_size_mb (float): 文件夹大小（MB）
+        """
+        if mtime_ns is not None:
+            self._size_cache[folder_path] = (mtime_ns, folder_size_mb)
+        self._confirm_import_folder(folder_path, folder_size_mb)
+
+    def _confirm_import_folder(self, folder_path, folder_size_mb):
+        """
+        显示确认对话框，确认后导入文件夹
+
+        Args:
+            folder_path (str): 文件夹路径
+            folder_size_mb (float): 文件夹大小（MB）
+        """
+        try:
+            # 显示确认对话框，显示文件夹大小
+            folder_name = os.path.basename(folder_path)
+            reply = _ask_yes_no(
+                self,
+                "确认导入",
+                f"文件夹: {folder_name}\n大小: {folder_size_mb:.2f} MB\n\n确定要导入此文件夹吗？"
+            )
+
+            if reply == QMessageBox.StandardButton.Yes:
+                if not self._is_imported_root(folder_path):
+                    self._queue_import(folder_path)
+
+                    logger.info("导入文件夹: %s, 大小: %.2f MB", folder_path, folder_size_mb)
+                    QMessageBox.information(self, "成功", f"文件夹已导入\n大小: {folder_size_mb:.2f} MB")
+                else:
+                    QMessageBox.information(self, "提示", "此文件夹已经导入！")
         except Exception as e:
-            logger.error(f"导入文件夹时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("导入文件夹时发生异常: %s", e, exc_info=True)
             QMessageBox.critical(self, "错误", f"导入文件夹时发生异常: {str(e)}")
     
     def import_folder(self, folder_path):
@@ -1784,52 +3510,91 @@ class FileManagerPanel(QWidget):
         """
         try:
             if not folder_path or not os.path.exists(folder_path):
-                logger.warning(f"导入文件夹失败，路径不存在: {folder_path}")
+                logger.warning("导入文件夹失败，路径不存在: %s", folder_path)
                 return
             
             # 检查是否已经导入
-            if folder_path not in self.imported_root_paths:
-                self.imported_root_paths.append(folder_path)
-                self.ui.set_root_paths(self.imported_root_paths)
-                
-                # 添加文件监听
-                self.add_path_to_watcher(folder_path)
+            if not self._is_imported_root(folder_path):
+                self._queue_import(folder_path)
                 
-                logger.info(f"自动导入文件夹: {folder_path}")
+                logger.info("自动导入文件夹: %s", folder_path)
             else:
-                logger.info(f"文件夹已存在于导入列表: {folder_path}")
+                logger.info("文件夹已存在于导入列表: %s", folder_path)
         except Exception as e:
-            logger.error(f"自动导入文件夹时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("自动导入文件夹时发生异常: %s", e, exc_info=True)
 
-    def _calculate_folder_size(self, folder_path):
+    def _queue_import(self, folder_path):
         """
-        计算文件夹大小，以MB为单位
+        记录新导入的文件夹，视图更新和文件监听推迟到事件循环空闲时统一处理，
+        连续导入多个文件夹时只重建一次根节点
 
         Args:
-            folder_path (str): 文件夹路径
+            folder_path (str): 要导入的文件夹路径
+        """
+        # 导入列表立即更新，保证随后的重复导入检查能看到这个路径
+        self.imported_root_paths.append(folder_path)
+        self._update_root_map()
+        self._invalidate_file_index()
+        if not self._pending_imports:
+            QTimer.singleShot(0, self._flush_imports)
+        self._pending_imports.append(folder_path)
 
-        Returns:
-            float: 文件夹大小（MB）
+    def _flush_imports(self):
+        """
+        将缓冲的导入文件夹一次性加入视图并添加文件监听
         """
         try:
-            total_size = 0
-            for dirpath, dirnames, filenames in os.walk(folder_path):
-                for filename in filenames:
-                    file_path = os.path.join(dirpath, filename)
-                    try:
-                        if os.path.exists(file_path):
-                            total_size += os.path.getsize(file_path)
-                    except (OSError, PermissionError) as e:
-                        logger.debug(f"无法访问文件: {file_path}, 错误: {e}")
-                        continue
+            pending, self._pending_imports = self._pending_imports, []
+            if not pending:
+                return
+            self.ui.set_root_paths(self.imported_root_paths)
 
-            # 转换为MB
-            size_mb = total_size / (1024 * 1024)
-            return size_mb
+            # 问题4修复：添加文件监听
+            for folder_path in pending:
+                # 刷新前已被移除的文件夹不再监听
+                if self._is_imported_root(folder_path):
+                    self.add_path_to_watcher(folder_path)
         except Exception as e:
-            logger.error(f"计算文件夹大小时发生异常: {str(e)}")
-            return 0.0
+            logger.error("更新导入的文件夹时发生异常: %s", e, exc_info=True)
+
+    def _get_cached_folder_size(self, folder_path):
+        """
+        获取缓存的文件夹大小，目录修改时间变化后缓存视为失效
+
+        Args:
+            folder_path (str): 文件夹路径
+
+        Returns:
+            float: 文件夹大小（MB），没有有效缓存时返回None
+        """
+        cached = self._size_cache.get(folder_path)
+        if cached:
+            try:
+                if cached[0] == os.stat(folder_path).st_mtime_ns:
+                    return cached[1]
+            except OSError:
+                pass
+        return None
+
+    def _invalidate_size_cache(self, changed_path):
+        """
+        使包含变化路径的文件夹大小缓存失效
+
+        沿变化路径的各级上级目录逐个按哈希移除缓存，复杂度与路径深度相关，与缓存的文件夹数量无关
+
+        Args:
+            changed_path (str): 发生变化的路径
+        """
+        size_cache = self._size_cache
+        if not size_cache:
+            return
+        path = changed_path
+        while True:
+            size_cache.pop(path, None)
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
 
     def load_persistent_paths(self):
         """
@@ -1838,19 +3603,21 @@ class FileManagerPanel(QWidget):
         try:
             # 从持久化存储加载导入的路径
             imported_paths = self.ui.load_imported_paths()
-            valid_paths = [path for path in imported_paths if os.path.exists(path)]
+            # 检查存在性时一并保存各根路径的 stat 信息，添加监听时不再重复 stat
+            valid_paths = _filter_existing_paths(imported_paths, self._path_stat_cache)
             if valid_paths:
                 self.imported_root_paths = valid_paths
+                self._update_root_map()
+                self._invalidate_file_index()
                 self.ui.set_root_paths(valid_paths)
 
                 # 问题4修复：为所有导入的路径添加监听
                 for path in valid_paths:
                     self.add_path_to_watcher(path)
 
-                logger.info(f"自动加载持久化路径: {valid_paths}")
+                logger.info("自动加载持久化路径: %s", valid_paths)
         except Exception as e:
-            logger.error(f"加载持久化路径时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("加载持久化路径时发生异常: %s", e, exc_info=True)
 
     def remove_folder(self):
         """
@@ -1858,47 +3625,40 @@ class FileManagerPanel(QWidget):
         """
         try:
             file_path = self.ui.get_selected_path()
-            if not file_path or not os.path.exists(file_path):
+            if not file_path or not self._cached_exists(file_path):
                 QMessageBox.warning(self, "警告", "请选择一个有效的文件或文件夹!")
                 logger.warning("尝试移除无效的文件或文件夹")
                 return
 
-            # 修复bug2: 简化并改进路径匹配逻辑
-            root_to_remove = None
-            for root_path in self.imported_root_paths:
-                # 标准化路径以便比较
-                normalized_file_path = os.path.normpath(file_path)
-                normalized_root_path = os.path.normpath(root_path)
-
-                # 完全匹配
-                if normalized_file_path == normalized_root_path:
-                    root_to_remove = root_path
-                    break
-
-                # 检查file_path是否是root_path的子目录或者root_path是否是file_path的子目录
-                # 这样可以处理用户选中文件夹内部的任何节点时，仍然能够正确识别根路径
-                if (normalized_file_path.startswith(normalized_root_path + os.sep) or
-                        normalized_root_path.startswith(normalized_file_path + os.sep)):
-                    root_to_remove = root_path
-                    break
+            # 修复bug2: 先沿父目录向上查找所属根路径，这样用户选中文件夹内部的任何节点时，仍然能够正确识别根路径
+            root_to_remove = self._match_root_path(file_path)
+            if not root_to_remove:
+                # 选中的路径是某个根路径的上级目录
+                root_to_remove = self._root_ancestors.get(_path_parts(file_path))
 
             if not root_to_remove:
                 QMessageBox.warning(self, "警告", "请选择一个已导入的文件夹!")
-                logger.warning(f"选中的路径不是已导入的文件夹: {file_path}")
-                logger.warning(f"当前导入的路径列表: {self.imported_root_paths}")
+                logger.warning("选中的路径不是已导入的文件夹: %s", file_path)
+                logger.warning("当前导入的路径列表: %s", self.imported_root_paths)
                 return
 
             # 确认操作
-            reply = QMessageBox.question(self, "确认",
-                                         f"确定要从管理中移除 '{root_to_remove}' 吗?\n(注意：这只是从软件中移除管理，不会删除文件系统中的文件)",
-                                         QMessageBox.Yes | QMessageBox.No)
+            reply = _ask_yes_no(self, "确认",
+                                f"确定要从管理中移除 '{root_to_remove}' 吗?\n(注意：这只是从软件中移除管理，不会删除文件系统中的文件)")
             if reply == QMessageBox.Yes:
                 # 从持久化存储中移除该路径
                 self.ui.remove_imported_path(root_to_remove)
 
+                # 取消该根路径的递归监听
+                watch = self._observed_watches.pop(root_to_remove, None)
+                if watch is not None:
+                    self._observer.unschedule(watch)
+
                 # 从导入的路径列表中移除
                 if root_to_remove in self.imported_root_paths:
                     self.imported_root_paths.remove(root_to_remove)
+                    self._update_root_map()
+                self._invalidate_file_index()
 
                 # 更新UI显示
                 if not self.imported_root_paths:
@@ -1908,17 +3668,68 @@ class FileManagerPanel(QWidget):
                     # 还有其他管理的文件夹，更新显示
                     self.ui.set_root_paths(self.imported_root_paths)
 
-                # 通过信号通知主窗口清空预览面板
-                # 查找主窗口中的预览面板并清空
-                main_window = self.window()
-                if main_window and hasattr(main_window, 'preview_panel'):
-                    main_window.preview_panel.show_message("请选择文件进行预览")
-                logger.info(f"从管理中移除文件夹: {root_to_remove}")
+                # 清空主窗口的预览面板
+                self._clear_preview()
+                logger.info("从管理中移除文件夹: %s", root_to_remove)
         except Exception as e:
-            logger.error(f"移除文件夹时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("移除文件夹时发生异常: %s", e, exc_info=True)
             QMessageBox.critical(self, "错误", f"移除文件夹时发生异常: {str(e)}")
 
+    def _preview_panel(self):
+        """
+        获取主窗口的预览面板，首次查找后以弱引用缓存，不阻止面板被回收
+
+        Returns:
+            QWidget or None: 预览面板，找不到时返回None
+        """
+        panel = self._preview_panel_ref() if self._preview_panel_ref else None
+        if panel is None:
+            panel = getattr(self.window(), 'preview_panel', None)
+            self._preview_panel_ref = weakref.ref(panel) if panel is not None else None
+        return panel
+
+    def _clear_preview(self):
+        """
+        清空主窗口预览面板的显示内容
+        """
+        panel = self._preview_panel()
+        if panel is None:
+            return
+        try:
+            panel.show_message("请选择文件进行预览")
+        except RuntimeError as e:
+            # 底层 C++ 对象已被删除，下次重新查找
+            self._preview_panel_ref = None
+            logger.error("预览面板已被删除: %s", e)
+
+    def set_recycle_bin_retention(self, retention_days, save=True):
+        """
+        设置回收站自动清理的保留天数，大于0时启动定期清理，0 时停止
+
+        Args:
+            retention_days (int): 保留天数，0 表示不自动清理
+            save (bool): 是否保存到持久化存储
+        """
+        self._retention_days = retention_days
+        if save:
+            self.ui.save_recycle_bin_retention_days(retention_days)
+        if retention_days > 0:
+            self._purge_timer.start()
+        else:
+            self._purge_timer.stop()
+
+    def purge_recycle_bins(self):
+        """
+        在工作线程中清理所有导入路径下回收站的过期条目，未启用自动清理时不执行
+        """
+        if self._retention_days <= 0:
+            return
+        if self._purge_worker and self._purge_worker.isRunning():
+            return
+        recycle_bin_paths = [self._get_recycle_bin_path(root_path) for root_path in self.imported_root_paths]
+        self._purge_worker = RecyclePurgeWorker(self.events, recycle_bin_paths, self._retention_days)
+        self._purge_worker.start()
+
     def open_recycle_bin(self):
         """
         问题5修复：打开回收站对话框，显示所有导入文件夹下的delete目录
@@ -1927,159 +3738,220 @@ class FileManagerPanel(QWidget):
             # 收集所有导入路径下的delete目录
             all_recycle_bins = []
             for root_path in self.imported_root_paths:
-                recycle_bin_path = os.path.join(root_path, self.delete_folder)
-                if os.path.exists(recycle_bin_path):
-                    all_recycle_bins.append(recycle_bin_path)
-                else:
-                    # 如果回收站不存在则创建
-                    os.makedirs(recycle_bin_path)
-                    all_recycle_bins.append(recycle_bin_path)
-                    logger.debug(f"创建回收站目录: {recycle_bin_path}")
+                recycle_bin_path = self._get_recycle_bin_path(root_path)
+                # 如果回收站不存在则创建（已存在时不报错，无需先检查）
+                os.makedirs(recycle_bin_path, exist_ok=True)
+                all_recycle_bins.append(recycle_bin_path)
 
             if not all_recycle_bins:
                 QMessageBox.information(self, "提示", "没有找到回收站目录")
                 return
 
             # 打开统一的回收站对话框，传递所有回收站路径
-            dialog = RecycleBinDialog(all_recycle_bins, self)
+            dialog = RecycleBinDialog(all_recycle_bins, self, retention_days=self._retention_days)
+            dialog.retention_changed.connect(self.set_recycle_bin_retention)
             dialog.exec_()
 
+            # 回收站中的还原、删除可能涉及任意路径，清空存在性缓存
+            self._exists_cache.clear()
+
             # 回收站关闭后，刷新视图并保持展开状态
-            self.refresh_view_keep_expanded()
+            self._schedule_refresh()
 
             logger.debug("打开回收站对话框")
         except Exception as e:
-            logger.error(f"打开回收站时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("打开回收站时发生异常: %s", e, exc_info=True)
             QMessageBox.critical(self, "错误", f"打开回收站时发生异常: {str(e)}")
 
     def select_previous_file(self):
         """
         选择前一个文件
         """
+        logger.info("选择前一个文件")
+        self._select_adjacent_file(forward=False)
+
+    def select_next_file(self):
+        """
+        选择后一个文件
+        """
+        logger.info("选择后一个文件")
+        self._select_adjacent_file(forward=True)
+
+    def _select_adjacent_file(self, forward):
+        """
+        选中并预览当前文件前一个或后一个支持预览的文件
+
+        Args:
+            forward (bool): True 为后一个，False 为前一个
+        """
         try:
-            logger.info("选择前一个文件")
+            ui = self.ui
+            if not ui:
+                return
+            tree = ui.tree_view
+            model = ui.model
+
             # 获取当前选中的索引
-            current_index = self.ui.tree_view.currentIndex() if self.ui and self.ui.tree_view else None
+            current_index = tree.currentIndex() if tree else None
             if not current_index or not current_index.isValid():
                 return
 
             # 获取当前文件路径
-            current_path = self.ui.model.get_file_path(current_index) if self.ui and self.ui.model else ""
+            current_path = model.get_file_path(current_index) if model else ""
             if not current_path:
                 return
 
-            # 收集所有文件
-            all_files = self._collect_all_files()
-            if not all_files:
+            # 先沿可见行查找，遇到折叠且有内容的文件夹时无法确定，再使用完整的文件索引
+            target_path, conclusive = self._find_adjacent_visible_file(current_index, forward)
+            if not conclusive:
+                target_path = self._find_adjacent_indexed_file(current_path, forward)
+            if not target_path:
                 return
 
-            # 查找当前文件在列表中的位置
-            current_pos = -1
-            for i, file_info in enumerate(all_files):
-                if file_info['path'] == current_path:
-                    current_pos = i
-                    break
-
-            if current_pos == -1:
-                return
+            # 找到了相邻文件，选中它
+            self._select_file_by_path(target_path)
+            # 触发预览
+            self.events.file_selected.emit(target_path)
 
-            # 查找前一个支持的文件
-            prev_pos = current_pos - 1
-            while prev_pos >= 0:
-                prev_file_info = all_files[prev_pos]
-                if self.is_supported_file(prev_file_info['path']):
-                    # 找到了前一个文件，选中它
-                    self._select_file_by_path(prev_file_info['path'])
-                    # 触发预览
-                    self.events.file_selected.emit(prev_file_info['path'])
-
-                    # 如果算法测试对话框打开，更新其中的图片
-                    if hasattr(self, 'algorithm_test_dialog') and self.algorithm_test_dialog and self.algorithm_test_dialog.isVisible():
-                        self.algorithm_test_dialog.set_current_file(prev_file_info['path'])
-                    return
-                prev_pos -= 1
+            # 如果算法测试对话框打开，更新其中的图片
+            if hasattr(self, 'algorithm_test_dialog') and self.algorithm_test_dialog and self.algorithm_test_dialog.isVisible():
+                self.algorithm_test_dialog.set_current_file(target_path)
 
         except Exception as e:
-            logger.error(f"选择前一个文件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("选择%s一个文件时发生异常: %s", '后' if forward else '前', e, exc_info=True)
 
-    def select_next_file(self):
-        """
-        选择后一个文件
+    def _find_adjacent_visible_file(self, current_index, forward):
         """
-        try:
-            logger.info("选择后一个文件")
-            # 获取当前选中的索引
-            current_index = self.ui.tree_view.currentIndex() if self.ui and self.ui.tree_view else None
-            if not current_index or not current_index.isValid():
-                return
+        用 QTreeView.indexBelow/indexAbove 沿可见行查找相邻的支持预览的文件
 
-            # 获取当前文件路径
-            current_path = self.ui.model.get_file_path(current_index) if self.ui and self.ui.model else ""
-            if not current_path:
-                return
+        可见行的顺序与文件索引的前序遍历一致，只有折叠且带有子项的文件夹中可能藏有更近的文件，
+        遇到这种文件夹或查找步数超过上限时返回不确定，由调用方改用完整的文件索引
 
-            # 收集所有文件
-            all_files = self._collect_all_files()
-            if not all_files:
-                return
+        Args:
+            current_index (QModelIndex): 当前项索引
+            forward (bool): True 向下查找，False 向上查找
 
-            # 查找当前文件在列表中的位置
-            current_pos = -1
-            for i, file_info in enumerate(all_files):
-                if file_info['path'] == current_path:
-                    current_pos = i
-                    break
+        Returns:
+            tuple: (文件路径或None, 结果是否确定)
+        """
+        # 只有当前项是文件时才与文件索引的语义一致
+        index = current_index.sibling(current_index.row(), 0)
+        if index.data(ITEM_TYPE_ROLE) != 'file':
+            return None, False
+
+        tree_view = self.ui.tree_view
+        model = self.ui.model
+        # 循环内用到的方法和角色绑定为局部变量
+        step = tree_view.indexBelow if forward else tree_view.indexAbove
+        is_expanded = tree_view.isExpanded
+        has_children = model.hasChildren
+        data = model.data
+        path_role = Qt.ItemDataRole.UserRole
+        for _ in range(ADJACENT_VISIBLE_SCAN_LIMIT):
+            index = step(index)
+            if not index.isValid():
+                # 已到达可见行的首尾，其间没有折叠的文件夹，不存在相邻文件
+                return None, True
+            if data(index, ITEM_TYPE_ROLE) == 'dir':
+                if not is_expanded(index) and has_children(index):
+                    return None, False
+                continue
+            path = data(index, path_role)
+            if path and _is_supported_ext(path):
+                return path, True
+        return None, False
 
-            if current_pos == -1:
-                return
+    def _find_adjacent_indexed_file(self, current_path, forward):
+        """
+        从缓存的文件索引中定位当前文件的相邻支持预览的文件，会加载整棵树
 
-            # 查找下一个支持的文件
-            next_pos = current_pos + 1
-            while next_pos < len(all_files):
-                next_file_info = all_files[next_pos]
-                if self.is_supported_file(next_file_info['path']):
-                    # 找到了下一个文件，选中它
-                    self._select_file_by_path(next_file_info['path'])
-                    # 触发预览
-                    self.events.file_selected.emit(next_file_info['path'])
-
-                    # 如果算法测试对话框打开，更新其中的图片
-                    if hasattr(self, 'algorithm_test_dialog') and self.algorithm_test_dialog and self.algorithm_test_dialog.isVisible():
-                        self.algorithm_test_dialog.set_current_file(next_file_info['path'])
-                    return
-                next_pos += 1
+        Args:
+            current_path (str): 当前文件路径
+            forward (bool): True 为后一个，False 为前一个
 
-        except Exception as e:
-            logger.error(f"选择后一个文件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+        Returns:
+            str or None: 相邻文件路径，没有则返回None
+        """
+        all_files = self._collect_all_files()
+        if not all_files:
+            return None
+
+        current_pos = self._path_to_pos.get(current_path)
+        if current_pos is None:
+            return None
+
+        if forward:
+            # 当前文件及之前的支持文件数量即为下一个支持文件在列表中的下标
+            next_rank = self._supported_rank[current_pos + 1]
+            if next_rank < len(self._supported_files):
+                return self._supported_files[next_rank]
+        else:
+            # 当前文件之前的支持文件数量即为前一个支持文件在列表中的下标加一
+            prev_rank = self._supported_rank[current_pos]
+            if prev_rank > 0:
+                return self._supported_files[prev_rank - 1]
+        return None
 
     def _collect_all_files(self):
         """
-        收集模型中所有的文件（递归）
+        收集模型中所有的文件（递归），结果缓存到文件或目录发生变化为止
+
+        同时维护 _path_to_pos（路径 -> 列表下标）、_supported_files（支持预览的文件路径）
+        和 _supported_rank（第 i 个文件之前的支持文件数量），用于前后切换时的常数时间定位；
+        遍历过程中记录的 _path_to_index 用于按路径查找模型索引
 
         Returns:
             list: 文件信息列表，每项包含 {'path': 文件路径, 'name': 文件名}
         """
         try:
+            if self._file_index_cache is not None:
+                return self._file_index_cache
+
             all_files = []
             if not self.ui or not self.ui.model:
                 return all_files
 
             # 从根节点开始递归收集
+            self._path_to_index = {}
             root_item = self.ui.model.invisibleRootItem()
             self._collect_files_from_item(root_item, all_files)
 
+            path_to_pos = {}
+            supported_files = []
+            supported_rank = [0]
+            for pos, file_info in enumerate(all_files):
+                path_to_pos[file_info['path']] = pos
+                # 列表中都是已知的文件，只需判断扩展名
+                if _is_supported_ext(file_info['path']):
+                    supported_files.append(file_info['path'])
+                supported_rank.append(len(supported_files))
+
+            self._file_index_cache = all_files
+            self._path_to_pos = path_to_pos
+            self._supported_files = supported_files
+            self._supported_rank = supported_rank
             return all_files
         except Exception as e:
-            logger.error(f"收集所有文件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("收集所有文件时发生异常: %s", e, exc_info=True)
             return []
 
+    def _invalidate_file_index(self):
+        """
+        清除缓存的文件列表和支持预览的文件列表，文件系统发生变化后调用
+        """
+        self._file_index_cache = None
+        self._path_to_pos = {}
+        self._supported_files = []
+        self._supported_rank = [0]
+        self._path_to_index = {}
+        # 保留旧列表和下标映射，直到后台重新遍历完成
+        self._supported_files_cache = None
+        self._file_index_generation += 1
+        self._algo_test_dir_cache = None
+
     def _collect_files_from_item(self, parent_item, files_list):
         """
-        从指定项递归收集文件
+        从指定项前序遍历收集文件
 
         Args:
             parent_item: 父项
@@ -2089,37 +3961,49 @@ class FileManagerPanel(QWidget):
             if not parent_item:
                 return
 
-            # 遍历所有子项
-            for row in range(parent_item.rowCount()):
-                child_item = parent_item.child(row, 0)
-                if not child_item:
-                    continue
-
+            for child_item in self._iter_items(parent_item, load=True):
                 file_path = child_item.data(Qt.ItemDataRole.UserRole)
                 if not file_path:
                     continue
 
+                self._path_to_index[file_path] = QPersistentModelIndex(child_item.index())
+
                 # 如果是文件，添加到列表
-                if os.path.isfile(file_path):
+                if child_item.data(ITEM_TYPE_ROLE) == 'file':
                     files_list.append({
                         'path': file_path,
                         'name': os.path.basename(file_path)
                     })
 
-                # 如果是文件夹，检查是否需要加载子内容
-                if os.path.isdir(file_path):
-                    # 如果有占位项，先加载实际内容
-                    if child_item.rowCount() > 0:
-                        first_grandchild = child_item.child(0)
-                        if first_grandchild and first_grandchild.text() == "加载中...":
-                            self.ui.model.load_children(child_item)
+        except Exception as e:
+            logger.error("从项收集文件时发生异常: %s", e, exc_info=True)
+
+    def _iter_items(self, root, descend=None, load=False):
+        """
+        以显式栈前序遍历模型项（不包含 root 本身），代替递归，避免宽树的函数调用开销和深树的递归深度限制
 
-                    # 递归收集子项
-                    self._collect_files_from_item(child_item, files_list)
+        Args:
+            root (QStandardItem): 起始项
+            descend (callable, optional): 对已产出的项返回False时不再遍历其子项
+            load (bool): 为True时在遍历子项前，批量加载其中仍带有占位项的文件夹
+
+        Yields:
+            QStandardItem: 第0列的项
+        """
+        stack = [root]
+        while stack:
+            item = stack.pop()
+            if item is not root:
+                yield item
+                if descend is not None and not descend(item):
+                    continue
 
-        except Exception as e:
-            logger.error(f"从项收集文件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            children = [item.child(row, 0) for row in range(item.rowCount())]
+            children = [child for child in children if child]
+            if load:
+                self.ui.model.load_children_bulk([child for child in children if self.ui.model.has_placeholder(child)])
+            # 逆序入栈，保证按行顺序出栈
+            stack.extend(reversed(children))
 
     def _select_file_by_path(self, file_path):
         """
@@ -2149,82 +4033,139 @@ class FileManagerPanel(QWidget):
                 self.ui.tree_view.setCurrentIndex(index)
                 # 滚动到可见
                 self.ui.tree_view.scrollTo(index)
-                logger.debug(f"成功选中文件: {file_path}")
+                logger.debug("成功选中文件: %s", file_path)
                 return True
             else:
-                logger.warning(f"在模型中未找到文件: {file_path}")
+                logger.warning("在模型中未找到文件: %s", file_path)
                 return False
 
         except Exception as e:
-            logger.error(f"根据路径选中文件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("根据路径选中文件时发生异常: %s", e, exc_info=True)
             return False
 
     def _find_index_by_path(self, parent_item, target_path):
         """
-        在模型中递归查找指定路径的索引
+        通过缓存的路径索引映射查找指定路径的索引
 
         Args:
-            parent_item: 父项
+            parent_item: 父项（保留参数以兼容原有调用）
             target_path: 目标文件路径
 
         Returns:
             QModelIndex: 找到的索引，未找到则返回None
         """
         try:
-            if not parent_item:
-                return None
-
-            # 遍历所有子项
-            for row in range(parent_item.rowCount()):
-                child_item = parent_item.child(row, 0)
-                if not child_item:
-                    continue
-
-                file_path = child_item.data(Qt.ItemDataRole.UserRole)
-                if file_path == target_path:
-                    return child_item.index()
-
-                # 如果是文件夹，递归查找
-                if file_path and os.path.isdir(file_path):
-                    # 如果有占位项，先加载实际内容
-                    if child_item.rowCount() > 0:
-                        first_grandchild = child_item.child(0)
-                        if first_grandchild and first_grandchild.text() == "加载中...":
-                            self.ui.model.load_children(child_item)
-
-                    result = self._find_index_by_path(child_item, target_path)
-                    if result and result.isValid():
-                        return result
-
+            self._collect_all_files()
+            persistent_index = self._path_to_index.get(target_path)
+            if persistent_index is not None and not persistent_index.isValid():
+                # 模型已在缓存失效前被重建，重新收集一次
+                self._invalidate_file_index()
+                self._collect_all_files()
+                persistent_index = self._path_to_index.get(target_path)
+
+            if persistent_index is not None and persistent_index.isValid():
+                return QModelIndex(persistent_index)
             return None
         except Exception as e:
-            logger.error(f"查找路径索引时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("查找路径索引时发生异常: %s", e, exc_info=True)
             return None
 
     def add_path_to_watcher(self, path):
         """
         问题4修复：添加路径到文件监听器
 
+        安装了 watchdog 时直接为根路径注册一个递归监听；否则使用 QFileSystemWatcher 逐个目录监听，
+        遍历时对比持久化的目录索引：目录的修改时间未变化说明其直接子项未变化，
+        直接使用索引中记录的子目录列表，不再列出该目录（数据集目录中通常有大量文件）
+
         Args:
             path (str): 要监听的路径
         """
         try:
-            if os.path.isdir(path) and path not in self.file_watcher.directories():
-                self.file_watcher.addPath(path)
-                # 递归添加子目录
-                for root, dirs, files in os.walk(path):
-                    # 跳过回收站目录
-                    if 'delete' in dirs:
-                        dirs.remove('delete')
-                    for d in dirs:
-                        dir_path = os.path.join(root, d)
-                        if dir_path not in self.file_watcher.directories():
-                            self.file_watcher.addPath(dir_path)
-                logger.debug(f"已添加监听: {path}")
+            # 优先使用加载持久化路径时保存的 stat 信息
+            root_stat = self._path_stat_cache.pop(path, None)
+            if root_stat is not None:
+                is_dir = stat.S_ISDIR(root_stat.st_mode)
+            else:
+                is_dir = os.path.isdir(path)
+
+            if self._observer is not None:
+                if is_dir and path not in self._observed_watches:
+                    self._observed_watches[path] = self._observer.schedule(
+                        RecursiveWatchHandler(self._watch_bridge, path, self.delete_folder), path, recursive=True)
+                    logger.debug("已添加监听: %s", path)
+                return
+
+            # 已监听的目录只取一次，避免在循环内反复扫描 Qt 的目录列表
+            known = set(self.file_watcher.directories())
+            if is_dir and path not in known:
+                watch_index = self._load_watch_index()
+                cached_dirs = watch_index.get(path, {})
+                cached_children = {}
+                for dir_path in cached_dirs:
+                    cached_children.setdefault(os.path.dirname(dir_path), []).append(dir_path)
+
+                new_index = {}
+                new_paths = []
+                stack = [path]
+                while stack:
+                    dir_path = stack.pop()
+                    if dir_path == path and root_stat is not None:
+                        mtime_ns = root_stat.st_mtime_ns
+                    else:
+                        try:
+                            mtime_ns = os.stat(dir_path).st_mtime_ns
+                        except OSError:
+                            continue
+                    new_index[dir_path] = mtime_ns
+                    if dir_path not in known:
+                        new_paths.append(dir_path)
+
+                    if cached_dirs.get(dir_path) == mtime_ns:
+                        stack.extend(cached_children.get(dir_path, ()))
+                    else:
+                        stack.extend(_list_subdirs(dir_path, self.delete_folder))
+
+                # 一次性批量添加监听
+                self.file_watcher.addPaths(new_paths)
+                watch_index[path] = new_index
+                self._watch_index_timer.start()
+                logger.debug("已添加监听: %s", path)
+        except Exception as e:
+            logger.error("添加路径监听时发生异常: %s", e)
+
+    def _load_watch_index(self):
+        """
+        加载持久化的监听目录索引，格式为 {根路径: {目录路径: mtime_ns}}
+
+        Returns:
+            dict: 监听目录索引
+        """
+        if self._watch_index is None:
+            try:
+                index_file = os.path.join(self.ui.dataset_manager_dir, "watch_index.json")
+                with open(index_file, 'r', encoding='utf-8') as f:
+                    self._watch_index = json.load(f)
+            except FileNotFoundError:
+                self._watch_index = {}
+            except Exception as e:
+                logger.warning("读取监听目录索引失败: %s", e)
+                self._watch_index = {}
+        return self._watch_index
+
+    def _save_watch_index(self):
+        """
+        保存监听目录索引，只保留仍在导入列表中的根路径
+        """
+        try:
+            watch_index = {root_path: dirs for root_path, dirs in self._load_watch_index().items()
+                           if root_path in self.imported_root_paths}
+            self._watch_index = watch_index
+            index_file = os.path.join(self.ui.dataset_manager_dir, "watch_index.json")
+            with open(index_file, 'w', encoding='utf-8') as f:
+                json.dump(watch_index, f, ensure_ascii=False)
         except Exception as e:
-            logger.error(f"添加路径监听时发生异常: {str(e)}")
+            logger.error("保存监听目录索引失败: %s", e)
 
     def on_directory_changed(self, path):
         """
@@ -2234,11 +4175,15 @@ class FileManagerPanel(QWidget):
             path (str): 变化的目录路径
         """
         try:
-            logger.debug(f"目录变化: {path}")
-            # 刷新视图，保持展开状态
-            self.refresh_view_keep_expanded()
+            logger.debug("目录变化: %s", path)
+            self._invalidate_size_cache(path)
+            # 目录本身或其中的项被删除、重建时需要重新检查存在性
+            self._invalidate_exists(path)
+            self._invalidate_file_index()
+            # 重新开始计时，窗口期内的事件只触发一次刷新
+            self._schedule_refresh()
         except Exception as e:
-            logger.error(f"处理目录变化时发生异常: {str(e)}")
+            logger.error("处理目录变化时发生异常: %s", e)
 
     def on_file_changed(self, path):
         """
@@ -2248,67 +4193,97 @@ class FileManagerPanel(QWidget):
             path (str): 变化的文件路径
         """
         try:
-            logger.debug(f"文件变化: {path}")
-            # 刷新视图，保持展开状态
-            self.refresh_view_keep_expanded()
+            logger.debug("文件变化: %s", path)
+            self._invalidate_size_cache(path)
+            self._invalidate_exists(path)
+            self._invalidate_file_index()
+            # 重新开始计时，窗口期内的事件只触发一次刷新
+            self._schedule_refresh()
         except Exception as e:
-            logger.error(f"处理文件变化时发生异常: {str(e)}")
+            logger.error("处理文件变化时发生异常: %s", e)
+
+    def _schedule_refresh(self, recheck_roots=False):
+        """
+        请求刷新视图并保持展开状态；文件监听事件、文件操作和刷新按钮的请求共用一个定时器，
+        每次请求重新开始计时，窗口期内的所有请求只触发一次刷新
+
+        Args:
+            recheck_roots (bool): 刷新前是否清空根路径存在性缓存，重新检查根路径是否存在
+        """
+        if recheck_roots:
+            self._refresh_recheck_roots = True
+        self._refresh_timer.start()
+
+    def _cancel_pending_refresh(self):
+        """
+        刷新开始时取消尚未执行的合并刷新请求，请求中需要的根路径存在性检查在本次刷新中完成
+        """
+        self._refresh_timer.stop()
+        if self._refresh_recheck_roots:
+            self._refresh_recheck_roots = False
+            self._exists_cache.clear()
 
     def refresh_view_keep_expanded(self):
         """
         【重构】刷新视图并保持已展开的状态
         """
         try:
+            # 本次刷新已包含尚未执行的合并刷新请求
+            self._cancel_pending_refresh()
             if not self.ui or not self.ui.tree_view or not self.ui.model:
                 return
 
+            self._invalidate_file_index()
+
             # 1. 保存当前展开的路径
             expanded_paths = self._get_expanded_paths()
-            logger.debug(f"保存了 {len(expanded_paths)} 个展开路径")
+            logger.debug("保存了 %s 个展开路径", len(expanded_paths))
 
-            # 2. 刷新视图
-            if self.imported_root_paths:
-                valid_paths = [path for path in self.imported_root_paths if os.path.exists(path)]
-                self.ui.set_root_paths(valid_paths)
-            else:
-                self.ui.clear_view()
+            # 重建和逐个展开期间暂停视图重绘，全部完成后只重绘一次
+            self.ui.tree_view.setUpdatesEnabled(False)
+            try:
+                # 2. 刷新视图
+                if self.imported_root_paths:
+                    valid_paths = self._valid_root_paths()
+                    self.ui.set_root_paths(valid_paths)
+                else:
+                    self.ui.clear_view()
 
-            # 3. 恢复展开状态
-            self._restore_expanded_paths(expanded_paths)
+                # 3. 恢复展开状态
+                self._restore_expanded_paths(expanded_paths)
+            finally:
+                self.ui.tree_view.setUpdatesEnabled(True)
 
         except Exception as e:
-            logger.error(f"刷新视图时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("刷新视图时发生异常: %s", e, exc_info=True)
 
     def _get_expanded_paths(self):
         """
         获取当前所有展开的路径
 
         Returns:
-            set: 展开的路径集合
+            frozenset: 展开的路径集合，保存后只用于查找和集合运算
         """
         expanded_paths = set()
         try:
             if not self.ui or not self.ui.model or not self.ui.tree_view:
-                return expanded_paths
+                return frozenset()
 
-            def collect_expanded(parent_item):
-                for row in range(parent_item.rowCount()):
-                    child_item = parent_item.child(row, 0)
-                    if child_item:
-                        index = child_item.index()
-                        if self.ui.tree_view.isExpanded(index):
-                            file_path = child_item.data(Qt.ItemDataRole.UserRole)
-                            if file_path:
-                                expanded_paths.add(file_path)
-                        # 递归收集
-                        collect_expanded(child_item)
+            tree_view = self.ui.tree_view
 
-            collect_expanded(self.ui.model.invisibleRootItem())
+            def is_expanded(item):
+                return tree_view.isExpanded(item.index())
+
+            # 折叠的子树中不可能有展开项，不再向下遍历
+            for child_item in self._iter_items(self.ui.model.invisibleRootItem(), descend=is_expanded):
+                if is_expanded(child_item):
+                    file_path = child_item.data(Qt.ItemDataRole.UserRole)
+                    if file_path:
+                        expanded_paths.add(file_path)
         except Exception as e:
-            logger.error(f"获取展开路径时发生异常: {str(e)}")
+            logger.error("获取展开路径时发生异常: %s", e)
 
-        return expanded_paths
+        return frozenset(expanded_paths)
 
     def _restore_expanded_paths(self, expanded_paths):
         """
@@ -2321,30 +4296,67 @@ class FileManagerPanel(QWidget):
             if not self.ui or not self.ui.model or not self.ui.tree_view:
                 return
 
-            def expand_items(parent_item):
+            def register_children(parent_item):
                 for row in range(parent_item.rowCount()):
                     child_item = parent_item.child(row, 0)
                     if child_item:
                         file_path = child_item.data(Qt.ItemDataRole.UserRole)
-                        if file_path in expanded_paths:
-                            # 先加载子内容
-                            if child_item.rowCount() > 0:
-                                first_grandchild = child_item.child(0)
-                                if first_grandchild and first_grandchild.text() == "加载中...":
-                                    self.ui.model.load_children(child_item)
+                        if file_path:
+                            loaded_items[file_path] = child_item
+
+            # 展开项较多时，逐个 expand() 每次都会触发树视图重新布局，改为一次 expandAll() 后折叠多余的文件夹
+            expand_all = len(expanded_paths) > EXPAND_ALL_THRESHOLD
+            tree_view = self.ui.tree_view
+
+            # 展开路径在保存时已知，先一次性并行扫描所有层级的目录，后面逐层填充模型时不再等待磁盘
+            pending_paths = sorted(expanded_paths)
+            prefetched = self.ui.model.scan_paths(pending_paths)
+
+            # 只记录已加载的项，逐层处理：每一层先批量加载子内容，再展开并登记其子项供下一层查找
+            loaded_items = {}
+            register_children(self.ui.model.invisibleRootItem())
+            tree_view.setUpdatesEnabled(False)
+            try:
+                while pending_paths:
+                    level_items = [loaded_items[path] for path in pending_paths if path in loaded_items]
+                    if not level_items:
+                        break
+                    pending_paths = [path for path in pending_paths if path not in loaded_items]
+
+                    # 先批量加载子内容
+                    self.ui.model.load_children_bulk(level_items, prefetched)
+                    for child_item in level_items:
+                        if not expand_all:
                             # 展开
-                            self.ui.tree_view.expand(child_item.index())
-                            # 递归展开子项
-                            expand_items(child_item)
+                            tree_view.expand(child_item.index())
+                        register_children(child_item)
 
-            expand_items(self.ui.model.invisibleRootItem())
+                if expand_all:
+                    # 子内容已在上面加载完毕，屏蔽信号避免 expanded 触发逐项懒加载
+                    tree_view.blockSignals(True)
+                    try:
+                        tree_view.expandAll()
+                        # 折叠所有不在展开集合中的文件夹（包括仍带占位项的文件夹），用集合差一次算出需要折叠的路径
+                        folder_items = {item.data(Qt.ItemDataRole.UserRole): item
+                                        for item in self._iter_items(self.ui.model.invisibleRootItem())
+                                        if item.rowCount()}
+                        for path in folder_items.keys() - expanded_paths:
+                            tree_view.collapse(folder_items[path].index())
+                    finally:
+                        tree_view.blockSignals(False)
+            finally:
+                tree_view.setUpdatesEnabled(True)
         except Exception as e:
-            logger.error(f"恢复展开状态时发生异常: {str(e)}")
+            logger.error("恢复展开状态时发生异常: %s", e)
 
     def _find_next_file(self, current_file_path):
         """
         【重构】查找当前文件的下一个支持预览的文件
 
+        按文件树的顺序（同一层文件和文件夹按名称排列、前序遍历）查找：直接列出当前文件所在目录，
+        当前文件之后的文件夹即使尚未在模型中加载或处于折叠状态也会进入查找；
+        所在目录中没有时再回到上级目录继续，直到所属的导入根路径
+
         Args:
             current_file_path (str): 当前文件路径
 
@@ -2352,30 +4364,50 @@ class FileManagerPanel(QWidget):
             str or None: 下一个文件路径，如果没有则返回None
         """
         try:
-            all_files = self._collect_all_files()
-            if not all_files:
-                return None
-
-            # 查找当前文件位置
-            current_pos = -1
-            for i, file_info in enumerate(all_files):
-                if file_info['path'] == current_file_path:
-                    current_pos = i
-                    break
+            scan_children = self.ui.model._scan_children
+            # 不属于任何导入根路径时只在所在目录中查找
+            root_path = self._match_root_path(current_file_path)
+            stop_parts = _path_parts(root_path) if root_path else None
+
+            path = current_file_path
+            while True:
+                parent_path = os.path.dirname(path)
+                entries = scan_children(parent_path) or []
+                # 条目按名称排序，从当前项之后开始查找
+                pos = bisect.bisect_right(entries, (os.path.basename(path), chr(0x10FFFF)))
+                next_file = self._first_supported_file(entries[pos:])
+                if next_file:
+                    return next_file
+                if stop_parts is None or parent_path == path or _path_parts(parent_path) == stop_parts:
+                    return None
+                path = parent_path
 
-            if current_pos == -1:
-                return None
+        except Exception as e:
+            logger.error("查找下一个文件时发生异常: %s", e)
+            return None
 
-            # 查找下一个支持的文件
-            for i in range(current_pos + 1, len(all_files)):
-                if self.is_supported_file(all_files[i]['path']):
-                    return all_files[i]['path']
+    def _first_supported_file(self, entries):
+        """
+        按前序遍历在条目列表中查找第一个支持预览的文件，遇到文件夹时先进入其中查找
 
-            return None
+        Args:
+            entries (list): 按名称排序的 (名称, 路径, 是否文件夹) 列表（见 CustomFileSystemModel._scan_children）
 
-        except Exception as e:
-            logger.error(f"查找下一个文件时发生异常: {str(e)}")
-            return None
+        Returns:
+            str or None: 文件路径，没有时返回None
+        """
+        scan_children = self.ui.model._scan_children
+        stack = [iter(entries)]
+        while stack:
+            for name, path, is_dir in stack[-1]:
+                if is_dir:
+                    stack.append(iter(scan_children(path) or []))
+                    break
+                if _is_supported_ext(name):
+                    return path
+            else:
+                stack.pop()
+        return None
 
     def _select_and_preview_file(self, file_path):
         """
@@ -2386,7 +4418,7 @@ class FileManagerPanel(QWidget):
         """
         try:
             if not os.path.exists(file_path):
-                logger.warning(f"文件不存在，无法选中: {file_path}")
+                logger.warning("文件不存在，无法选中: %s", file_path)
                 return
 
             # 选中文件
@@ -2394,13 +4426,12 @@ class FileManagerPanel(QWidget):
             if success:
                 # 发送预览信号
                 self.events.file_selected.emit(file_path)
-                logger.info(f"已选中并预览文件: {file_path}")
+                logger.info("已选中并预览文件: %s", file_path)
             else:
-                logger.warning(f"无法选中文件: {file_path}")
+                logger.warning("无法选中文件: %s", file_path)
 
         except Exception as e:
-            logger.error(f"选中并预览文件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("选中并预览文件时发生异常: %s", e, exc_info=True)
 
     def move_to_recycle_bin(self, file_path):
         """
@@ -2414,15 +4445,124 @@ class FileManagerPanel(QWidget):
             root_path = self.get_root_path_for_file(file_path)
 
             # 构造回收站路径
-            recycle_bin_path = os.path.join(root_path, self.delete_folder)
+            recycle_bin_path = self._get_recycle_bin_path(root_path)
 
             # 移动文件到回收站
             self.events.on_file_delete(file_path, recycle_bin_path)
         except Exception as e:
-            logger.error(f"移动文件到回收站时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("移动文件到回收站时发生异常: %s", e, exc_info=True)
             QMessageBox.critical(self, "错误", f"移动文件到回收站时发生异常: {str(e)}")
 
+    def _update_root_map(self):
+        """
+        根据 imported_root_paths 重建标准化根路径映射、上级目录映射和回收站目录集合
+        """
+        self._normalized_roots = {_path_parts(root_path): root_path for root_path in self.imported_root_paths}
+        self._recycle_sentinels = {root_parts + (os.path.normcase(self.delete_folder),)
+                                   for root_parts in self._normalized_roots}
+        self._recycle_sentinel_depths = tuple(sorted({len(parts) for parts in self._recycle_sentinels}))
+        self._recycle_check_cache.clear()
+        self._exists_cache.clear()
+        self._recycle_bin_paths.clear()
+        # 每个根路径的各级上级目录 -> 按导入顺序第一个位于其下的根路径
+        self._root_ancestors = {}
+        for root_parts, root_path in self._normalized_roots.items():
+            for depth in range(1, len(root_parts)):
+                self._root_ancestors.setdefault(root_parts[:depth], root_path)
+
+    def _is_imported_root(self, path):
+        """
+        判断路径是否为已导入的根路径，按标准化路径哈希查找，大小写不敏感的系统上忽略大小写和分隔符差异
+
+        Args:
+            path (str): 路径
+
+        Returns:
+            bool: 是已导入的根路径返回True
+        """
+        return _path_parts(path) in self._normalized_roots
+
+    def _get_recycle_bin_path(self, root_path):
+        """
+        获取根路径下的回收站路径，按根路径缓存
+
+        回收站清空后会被删除，因此只缓存路径，不缓存其是否存在；移入回收站时会按需创建
+
+        Args:
+            root_path (str): 根路径
+
+        Returns:
+            str: 回收站路径
+        """
+        recycle_bin_path = self._recycle_bin_paths.get(root_path)
+        if recycle_bin_path is None:
+            recycle_bin_path = os.path.join(root_path, self.delete_folder)
+            self._recycle_bin_paths[root_path] = recycle_bin_path
+        return recycle_bin_path
+
+    def _valid_root_paths(self):
+        """
+        获取仍然存在的导入根路径，检查结果在有效期内复用
+
+        Returns:
+            list: 存在的根路径列表
+        """
+        now = time.monotonic()
+        root_paths = self.imported_root_paths
+        # 过期或未检查过的根路径一起并行检查
+        stale = [root_path for root_path in root_paths
+                 if root_path not in self._exists_cache or now - self._exists_cache[root_path][0] >= EXISTS_CACHE_TTL]
+        if len(stale) > 1:
+            for root_path, exists in zip(stale, _STAT_POOL.map(os.path.exists, stale)):
+                self._exists_cache[root_path] = (now, exists)
+        return list(itertools.compress(root_paths, map(self._cached_exists, root_paths)))
+
+    def _cached_exists(self, path):
+        """
+        检查路径是否存在，检查结果在有效期内复用
+
+        Args:
+            path (str): 路径
+
+        Returns:
+            bool: 路径存在返回True
+        """
+        now = time.monotonic()
+        cached = self._exists_cache.get(path)
+        if cached is None or now - cached[0] >= EXISTS_CACHE_TTL:
+            cached = (now, os.path.exists(path))
+            self._exists_cache[path] = cached
+        return cached[1]
+
+    def _invalidate_exists(self, *paths):
+        """
+        清除路径及其下所有路径的存在性缓存，文件操作或目录变化后调用
+
+        Args:
+            *paths (str): 发生变化的路径
+        """
+        for path in paths:
+            prefix = os.path.join(path, '')
+            for cached_path in [p for p in self._exists_cache if p == path or p.startswith(prefix)]:
+                del self._exists_cache[cached_path]
+
+    def _match_root_path(self, file_path):
+        """
+        沿父目录向上查找路径所属的导入根路径，复杂度与路径深度相关，与根路径数量无关
+
+        Args:
+            file_path (str): 文件或文件夹路径
+
+        Returns:
+            str: 匹配的原始根路径，未找到时返回None
+        """
+        parts = _path_parts(file_path)
+        for depth in range(len(parts), 0, -1):
+            root_path = self._normalized_roots.get(parts[:depth])
+            if root_path is not None:
+                return root_path
+        return None
+
     def get_root_path_for_file(self, file_path):
         """
         根据文件路径确定其所属的根路径
@@ -2438,44 +4578,24 @@ class FileManagerPanel(QWidget):
             if not self.imported_root_paths:
                 return QDir.currentPath()
 
-            # 标准化文件路径
-            normalized_file_path = os.path.normpath(file_path)
-
-            # 查找文件路径匹配的根路径
-            for root_path in self.imported_root_paths:
-                normalized_root_path = os.path.normpath(root_path)
-                # 检查文件是否在该根路径下
-                if (normalized_file_path == normalized_root_path or
-                        normalized_file_path.startswith(normalized_root_path + os.sep) or
-                        normalized_file_path.startswith(normalized_root_path + os.path.sep)):
-                    return root_path
+            # 沿父目录向上查找匹配的根路径
+            root_path = self._match_root_path(file_path)
+            if root_path:
+                return root_path
 
             # 如果没有找到匹配的根路径，使用第一个导入的路径作为默认值
             # 这是为了保持向后兼容性
             return self.imported_root_paths[0]
         except Exception as e:
-            logger.error(f"确定文件所属根路径时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("确定文件所属根路径时发生异常: %s", e, exc_info=True)
             # 出现异常时使用第一个导入的路径
             return self.imported_root_paths[0] if self.imported_root_paths else QDir.currentPath()
 
     def refresh_view(self):
         """
-        刷新视图
+        刷新视图并保持展开状态，与其他刷新请求合并为一次；用户主动刷新时重新检查根路径是否存在
         """
-        try:
-            if self.imported_root_paths:
-                valid_paths = [path for path in self.imported_root_paths if os.path.exists(path)]
-                self.ui.set_root_paths(valid_paths)
-                logger.debug(f"刷新视图，根路径: {valid_paths}")
-            else:
-                # 如果没有导入的根路径，则清空视图
-                self.ui.clear_view()
-                logger.debug("清空视图")
-        except Exception as e:
-            logger.error(f"刷新视图时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
-            QMessageBox.critical(self, "错误", f"刷新视图时发生异常: {str(e)}")
+        self._schedule_refresh(recheck_roots=True)
 
     def on_item_clicked(self, index):
         """
@@ -2486,31 +4606,31 @@ class FileManagerPanel(QWidget):
         """
         try:
             if index.isValid():
+                ui = self.ui
+                model = ui.model if ui else None
                 # 使用自定义模型的 get_file_path 方法
-                file_path = self.ui.model.get_file_path(index) if self.ui and self.ui.model else ""
+                file_path = model.get_file_path(index) if model else ""
                 if not file_path:
                     return
 
-                file_info = QFileInfo(file_path)
-
                 # 检查是否是文件夹
-                if file_info.isDir():
+                if _index_is_dir(index, file_path):
                     # 问题1修复：点击文件夹时只展开，不折叠
                     # 用户需要一直展开文件夹列表，除非再次点击才收起
-                    if self.ui and self.ui.tree_view:
+                    tree = ui.tree_view
+                    if tree:
                         # 无论当前是否展开，都展开文件夹
                         # 如果已经展开，再次点击则折叠
-                        if self.ui.tree_view.isExpanded(index):
-                            self.ui.tree_view.collapse(index)
+                        if tree.isExpanded(index):
+                            tree.collapse(index)
                         else:
-                            self.ui.tree_view.expand(index)
-                    logger.debug(f"文件夹点击: {file_path}")
+                            tree.expand(index)
+                    logger.debug("文件夹点击: %s", file_path)
                 else:
                     # 如果是文件，发送信号在预览面板中显示
                     self.events.file_selected.emit(file_path)
         except Exception as e:
-            logger.error(f"处理项目点击事件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("处理项目点击事件时发生异常: %s", e, exc_info=True)
             QMessageBox.critical(self, "错误", f"处理项目点击事件时发生异常: {str(e)}")
 
     def on_selection_changed(self, current, previous):
@@ -2527,20 +4647,19 @@ class FileManagerPanel(QWidget):
                 return
 
             if current.isValid():
+                ui = self.ui
+                model = ui.model if ui else None
                 # 使用自定义模型的 get_file_path 方法
-                file_path = self.ui.model.get_file_path(current) if self.ui and self.ui.model else ""
+                file_path = model.get_file_path(current) if model else ""
                 if not file_path:
                     return
 
-                file_info = QFileInfo(file_path)
-
                 # 只处理文件，不处理文件夹
-                if not file_info.isDir():
+                if not _index_is_dir(current, file_path):
                     # 发送信号在预览面板中显示
                     self.events.file_selected.emit(file_path)
         except Exception as e:
-            logger.error(f"处理选择变化事件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("处理选择变化事件时发生异常: %s", e, exc_info=True)
 
     def on_file_selected(self, file_path):
         """
@@ -2559,39 +4678,29 @@ class FileManagerPanel(QWidget):
             file_path (str): 已删除的文件路径
         """
         try:
-            # 问题2修复：使用refresh_view_keep_expanded保持文件夹展开状态
-            self.refresh_view_keep_expanded()
+            # 问题2修复：刷新视图并保持文件夹展开状态
+            self._schedule_refresh()
 
-            # 通过信号通知主窗口清空预览面板
-            # 查找主窗口中的预览面板并清空
-            main_window = self.window()
-            if main_window and hasattr(main_window, 'preview_panel'):
-                try:
-                    main_window.preview_panel.show_message("请选择文件进行预览")
-                except RuntimeError as e:
-                    logger.error(f"预览面板已被删除: {str(e)}")
-            logger.info(f"处理文件删除事件: {file_path}")
+            # 清空主窗口的预览面板
+            self._clear_preview()
+            logger.info("处理文件删除事件: %s", file_path)
         except Exception as e:
-            logger.error(f"处理文件删除事件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("处理文件删除事件时发生异常: %s", e, exc_info=True)
 
     def delete_selected_file(self):
         """
         【重构】删除选中的文件（通过Delete键），删除后切换到下一个文件并保持展开状态
         """
         try:
-            file_path = self.ui.get_selected_path()
-            if not file_path or not os.path.exists(file_path):
-                QMessageBox.warning(self, "警告", "请选择一个有效的文件或文件夹!")
-                logger.warning("尝试删除无效的文件或文件夹")
+            # 多选时批量删除，只确认和刷新一次
+            selected_paths = self.ui.get_selected_paths()
+            if len(selected_paths) > 1:
+                self.delete_files(selected_paths)
                 return
 
-            # 问题1修复：使用统一的删除方法，保持展开状态
-            self._delete_file_with_navigation(file_path)
-
+            self._confirm_and_delete(self.ui.get_selected_path())
         except Exception as e:
-            logger.error(f"删除文件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("删除文件时发生异常: %s", e, exc_info=True)
             QMessageBox.critical(self, "错误", f"删除文件时发生异常: {str(e)}")
 
     def show_context_menu(self, file_path, position):
@@ -2603,8 +4712,10 @@ class FileManagerPanel(QWidget):
             position (QPoint): 菜单位置
         """
         try:
-            if not file_path or not os.path.exists(file_path):
-                logger.warning(f"尝试对无效文件显示上下文菜单: {file_path}")
+            # 一次 stat 同时判断是否存在、是否为文件夹和是否为普通文件
+            file_stat = _stat_or_none(file_path) if file_path else None
+            if file_stat is None:
+                logger.warning("尝试对无效文件显示上下文菜单: %s", file_path)
                 return
 
             # 创建右键菜单
@@ -2615,57 +4726,62 @@ class FileManagerPanel(QWidget):
 
             if in_recycle_bin:
                 # 在回收站中，添加还原选项
-                restore_action = QAction("还原", self)
-                restore_action.triggered.connect(lambda: self.restore_file(file_path))
-                context_menu.addAction(restore_action)
+                self._add_action(context_menu, "还原", self.restore_file, file_path)
             else:
                 # 不在回收站中，根据选中项类型添加不同操作
-                if os.path.isdir(file_path):
-                    # 选中的是文件夹，添加新建文件夹和删除选项
-                    new_folder_action = QAction("新建文件夹", self)
-                    new_folder_action.triggered.connect(lambda: self.create_new_folder(file_path))
-                    context_menu.addAction(new_folder_action)
-
-                    # 添加重命名文件夹选项
-                    rename_action = QAction("重命名", self)
-                    rename_action.triggered.connect(lambda: self.rename_file_or_folder(file_path))
-                    context_menu.addAction(rename_action)
-
+                if stat.S_ISDIR(file_stat.st_mode):
+                    # 选中的是文件夹，添加新建文件夹、重命名和上传文件选项
+                    self._add_action(context_menu, "新建文件夹", self.create_new_folder, file_path)
+                    self._add_action(context_menu, "重命名", self.rename_file_or_folder, file_path)
                     context_menu.addSeparator()
-
-                    # 添加上传文件选项
-                    upload_action = QAction("上传文件", self)
-                    upload_action.triggered.connect(lambda: self.upload_files(file_path))
-                    context_menu.addAction(upload_action)
+                    self._add_action(context_menu, "上传文件", self.upload_files, file_path)
                 else:
                     # 选中的是文件，添加算法测试选项（仅对支持的文件格式）
-                    if self.is_supported_file(file_path):
-                        algorithm_test_action = QAction("算法测试", self)
-                        algorithm_test_action.triggered.connect(lambda: self.algorithm_test(file_path))
-                        context_menu.addAction(algorithm_test_action)
+                    if stat.S_ISREG(file_stat.st_mode) and _is_supported_ext(file_path):
+                        self._add_action(context_menu, "算法测试", self.algorithm_test, file_path)
                         context_menu.addSeparator()
 
                 # 添加删除选项（适用于文件和文件夹）
-                delete_action = QAction("删除", self)
-                delete_action.triggered.connect(lambda: self.delete_file(file_path))
-                context_menu.addAction(delete_action)
+                selected_paths = self.ui.get_selected_paths()
+                if len(selected_paths) > 1 and file_path in selected_paths:
+                    self._add_action(context_menu, f"删除选中的 {len(selected_paths)} 项",
+                                     self.delete_files, selected_paths)
+                else:
+                    # 菜单创建时已确认路径存在，删除时不再检查
+                    self._add_action(context_menu, "删除", self._confirm_and_delete, file_path, True)
 
             # 在鼠标位置显示菜单
             if self.ui and self.ui.tree_view:
                 viewport = self.ui.tree_view.viewport()
                 if viewport:
                     context_menu.exec_(viewport.mapToGlobal(position))
-            logger.debug(f"显示上下文菜单: {file_path}")
+            logger.debug("显示上下文菜单: %s", file_path)
         except Exception as e:
-            logger.error(f"显示上下文菜单时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("显示上下文菜单时发生异常: %s", e, exc_info=True)
             QMessageBox.critical(self, "错误", f"显示上下文菜单时发生异常: {str(e)}")
 
-    def is_in_recycle_bin(self, file_path):
+    def _add_action(self, menu, text, slot, *args):
         """
-        判断文件是否在回收站中
+        向菜单添加一个动作，触发时以给定参数调用槽函数
+
+        Args:
+            menu (QMenu): 目标菜单
+            text (str): 动作文本
+            slot (callable): 槽函数
+            *args: 传给槽函数的参数
 
+        Returns:
+            QAction: 创建的动作
+        """
+        action = QAction(text, self)
+        # 使用 partial 绑定参数，triggered 携带的 checked 参数由 PyQt 按槽函数可接受的参数数量丢弃
+        action.triggered.connect(partial(slot, *args))
+        menu.addAction(action)
+        return action
 
+    def is_in_recycle_bin(self, file_path):
+        """
+        判断文件是否在回收站中
 
         Args:
             file_path (str): 文件路径
@@ -2673,19 +4789,27 @@ class FileManagerPanel(QWidget):
         Returns:
             bool: 是否在回收站中
         """
-        try:
+        # 纯字符串和字典运算，不访问文件系统，无需异常处理
+        if not self._recycle_sentinels:
+            return False
 
+        # 路径中根本不含回收站目录名时无需拆分路径，直接返回
+        if self._recycle_folder_key not in os.path.normcase(file_path):
+            return False
 
-            if not self.imported_root_paths:
-                return False
+        cached = self._recycle_check_cache.get(file_path)
+        if cached is not None:
+            self._recycle_check_cache.move_to_end(file_path)
+            return cached
 
-            # 检查文件路径是否包含delete文件夹
-            return f"/{self.delete_folder}/" in file_path or file_path.endswith(
-                f"/{self.delete_folder}") or f"\\{self.delete_folder}\\" in file_path or file_path.endswith(f"\\{self.delete_folder}")
-        except Exception as e:
-            logger.error(f"判断文件是否在回收站中时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
-            return False
+        # 检查路径本身或其任一上级目录是否为某个根路径下的回收站目录，只需检查回收站目录所在的层级
+        parts = _path_parts(file_path)
+        result = any(parts[:depth] in self._recycle_sentinels
+                     for depth in self._recycle_sentinel_depths if depth <= len(parts))
+        self._recycle_check_cache[file_path] = result
+        if len(self._recycle_check_cache) > RECYCLE_CHECK_CACHE_SIZE:
+            self._recycle_check_cache.popitem(last=False)
+        return result
 
     def delete_file(self, file_path):
         """
@@ -2694,18 +4818,27 @@ class FileManagerPanel(QWidget):
         Args:
             file_path (str): 要删除的文件路径
         """
+        self._confirm_and_delete(file_path)
+
+    def _confirm_and_delete(self, file_path, already_validated=False):
+        """
+        检查路径后确认并删除单个文件，Delete键和右键菜单共用
+
+        Args:
+            file_path (str): 要删除的文件路径
+            already_validated (bool): 调用方已确认路径存在（如右键菜单创建时）则不再检查
+        """
         try:
-            if not file_path or not os.path.exists(file_path):
+            if not already_validated and (
+                    not file_path or _stat_or_warn(file_path, "尝试删除无效的文件或文件夹") is None):
                 QMessageBox.warning(self, "警告", "请选择一个有效的文件或文件夹!")
-                logger.warning("尝试删除无效的文件或文件夹")
                 return
 
             # 问题1修复：使用统一的删除方法，保持展开状态
             self._delete_file_with_navigation(file_path)
 
         except Exception as e:
-            logger.error(f"删除文件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("删除文件时发生异常: %s", e, exc_info=True)
             QMessageBox.critical(self, "错误", f"删除文件时发生异常: {str(e)}")
 
     def _delete_file_with_navigation(self, file_path):
@@ -2715,6 +4848,9 @@ class FileManagerPanel(QWidget):
         Args:
             file_path (str): 要删除的文件路径
         """
+        if self._is_moving_to_recycle_bin():
+            return
+
         # 1. 保存当前展开状态
         expanded_paths = self._get_expanded_paths()
 
@@ -2722,28 +4858,124 @@ class FileManagerPanel(QWidget):
         next_file_path = self._find_next_file(file_path)
 
         # 3. 确认删除
-        reply = QMessageBox.question(
+        reply = _ask_yes_no(
             self, "确认",
-            f"确定要删除 '{os.path.basename(file_path)}' 吗?\n(文件将被移动到回收站)",
-            QMessageBox.Yes | QMessageBox.No
+            f"确定要删除 '{os.path.basename(file_path)}' 吗?\n(文件将被移动到回收站)"
         )
 
         if reply != QMessageBox.Yes:
             return
 
-        # 4. 执行删除
-        self.move_to_recycle_bin(file_path)
-        logger.info(f"文件已移动到回收站: {file_path}")
+        # 4. 在工作线程中执行删除，完成后刷新视图并选中下一个文件
+        root_path = self.get_root_path_for_file(file_path)
+        moves = [(file_path, self._get_recycle_bin_path(root_path))]
+        self._start_recycle_moves(moves, expanded_paths, next_file_path)
+
+    def _is_moving_to_recycle_bin(self):
+        """
+        检查是否有正在进行的回收站移动，有则提示用户等待
+
+        Returns:
+            bool: 正在移动返回True
+        """
+        if self._move_worker and self._move_worker.isRunning():
+            QMessageBox.information(self, "提示", "正在移动文件到回收站，请稍候")
+            return True
+        return False
+
+    def _start_recycle_moves(self, moves, expanded_paths, next_file_path):
+        """
+        启动回收站移动线程
+
+        Args:
+            moves (list): (要删除的文件路径, 回收站路径) 列表
+            expanded_paths (set): 删除前的展开路径集合
+            next_file_path (str): 删除完成后要选中的文件，没有则为None
+        """
+        self._move_worker = RecycleMoveWorker(self.events, moves)
+        self._move_worker.moves_finished.connect(
+            lambda failures: self._on_recycle_moves_finished(moves, failures, expanded_paths, next_file_path))
+        self._move_worker.start()
+
+    def _on_recycle_moves_finished(self, moves, failures, expanded_paths, next_file_path):
+        """
+        回收站移动完成：刷新视图、恢复展开状态、提示失败项并选中下一个文件
+
+        Args:
+            moves (list): (要删除的文件路径, 回收站路径) 列表
+            failures (list): 移动失败的 (文件路径, 错误信息) 列表
+            expanded_paths (set): 删除前的展开路径集合
+            next_file_path (str): 要选中的文件，没有则为None
+        """
+        try:
+            logger.info("移动到回收站完成: %s 成功, %s 失败", len(moves) - len(failures), len(failures))
+            self._invalidate_exists(*(file_path for file_path, _ in moves))
+
+            # 5. 刷新视图并恢复展开状态
+            self._refresh_and_restore(expanded_paths)
+
+            if failures:
+                errors = [f"{os.path.basename(path)}: {error}" for path, error in failures]
+                QMessageBox.warning(self, "警告", _format_error_summary("以下项目删除失败", errors))
+
+            # 6. 选中并预览下一个文件（延迟执行）
+            if next_file_path:
+                QTimer.singleShot(200, lambda: self._select_and_preview_file(next_file_path))
+        except Exception as e:
+            logger.error("处理删除结果时发生异常: %s", e, exc_info=True)
+
+    def delete_files(self, paths):
+        """
+        批量删除文件（移动到回收站）：只确认一次、只刷新一次，删除后切换到下一个文件并保持展开状态
+
+        Args:
+            paths (list): 要删除的文件或文件夹路径列表
+        """
+        try:
+            # 过滤无效路径；已选中文件夹内的子项会随文件夹一起移动，不再单独处理
+            valid_paths = [path for path in dict.fromkeys(paths) if path and os.path.exists(path)]
+            selected_parts = {_path_parts(path) for path in valid_paths}
+            file_paths = []
+            for path in valid_paths:
+                parts = _path_parts(path)
+                if not any(parts[:depth] in selected_parts for depth in range(1, len(parts))):
+                    file_paths.append(path)
+
+            if not file_paths:
+                QMessageBox.warning(self, "警告", "请选择一个有效的文件或文件夹!")
+                logger.warning("尝试删除无效的文件或文件夹")
+                return
 
-        # 5. 刷新视图并恢复展开状态
-        self._refresh_and_restore(expanded_paths)
+            if len(file_paths) == 1:
+                self._delete_file_with_navigation(file_paths[0])
+                return
+
+            if self._is_moving_to_recycle_bin():
+                return
+
+            # 1. 保存当前展开状态
+            expanded_paths = self._get_expanded_paths()
+
+            # 2. 查找最后一个删除项之后的下一个文件（在删除前）
+            next_file_path = self._find_next_file(file_paths[-1])
+            if next_file_path in valid_paths:
+                next_file_path = None
+
+            # 3. 确认删除
+            reply = _ask_yes_no(
+                self, "确认",
+                f"确定要删除选中的 {len(file_paths)} 个项目吗?\n(文件将被移动到回收站)"
+            )
+            if reply != QMessageBox.Yes:
+                return
 
-        # 6. 选中并预览下一个文件（延迟执行）
-        if next_file_path:
-            from PyQt5.QtCore import QTimer
-            QTimer.singleShot(200, lambda: self._select_and_preview_file(next_file_path))
+            # 4. 在工作线程中批量执行删除，完成后统一刷新一次
+            moves = [(path, self._get_recycle_bin_path(self.get_root_path_for_file(path))) for path in file_paths]
+            self._start_recycle_moves(moves, expanded_paths, next_file_path)
 
-        logger.info(f"删除完成: {file_path}")
+        except Exception as e:
+            logger.error("批量删除文件时发生异常: %s", e, exc_info=True)
+            QMessageBox.critical(self, "错误", f"批量删除文件时发生异常: {str(e)}")
 
     def _refresh_and_restore(self, expanded_paths):
         """
@@ -2752,9 +4984,13 @@ class FileManagerPanel(QWidget):
         Args:
             expanded_paths (set): 需要恢复的展开路径集合
         """
+        # 本次刷新已包含尚未执行的合并刷新请求，避免其在选中下一个文件后再次重建视图
+        self._cancel_pending_refresh()
+        self._invalidate_file_index()
+
         # 刷新视图
         if self.imported_root_paths:
-            valid_paths = [path for path in self.imported_root_paths if os.path.exists(path)]
+            valid_paths = self._valid_root_paths()
             self.ui.set_root_paths(valid_paths)
 
         # 恢复展开状态
@@ -2768,9 +5004,8 @@ class FileManagerPanel(QWidget):
             file_path (str): 回收站中的文件路径
         """
         try:
-            if not file_path or not os.path.exists(file_path):
+            if not file_path or _stat_or_warn(file_path, "尝试还原无效的文件") is None:
                 QMessageBox.warning(self, "警告", "请选择一个有效的文件!")
-                logger.warning("尝试还原无效的文件")
                 return
 
             # 获取回收站根路径
@@ -2785,12 +5020,13 @@ class FileManagerPanel(QWidget):
 
             # 执行还原
             if recycle_bin_dialog.restore_file(file_path, recycle_bin_root):
+                # 还原目标可能是任意路径，清空存在性缓存
+                self._exists_cache.clear()
                 # 问题1修复：刷新视图并保持展开状态
-                self.refresh_view_keep_expanded()
-                logger.info(f"还原文件: {file_path}")
+                self._schedule_refresh()
+                logger.info("还原文件: %s", file_path)
         except Exception as e:
-            logger.error(f"还原文件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("还原文件时发生异常: %s", e, exc_info=True)
             QMessageBox.critical(self, "错误", f"还原文件时发生异常: {str(e)}")
 
     def get_recycle_bin_root(self, file_path):
@@ -2803,26 +5039,15 @@ class FileManagerPanel(QWidget):
         Returns:
             str: 回收站根路径
         """
-        try:
-            # 查找路径中delete文件夹的位置
-            parts = file_path.replace('\\', '/').split('/')
-            delete_index = -1
-            for i, part in enumerate(parts):
-                if part == self.delete_folder:
-                    delete_index = i
-                    break
-
-            if delete_index == -1:
-                return None
-
-            # 构造回收站根路径
-            recycle_bin_root = '/'.join(parts[:delete_index + 1])
-            return recycle_bin_root
-        except Exception as e:
-            logger.error(f"获取回收站根路径时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+        # 直接在原字符串中查找第一个回收站目录，不拆分路径；路径本身就是回收站目录时在末尾补一个分隔符参与匹配
+        path = file_path + '/'
+        positions = [pos for pos in (path.find(needle) for needle in self._recycle_needles) if pos >= 0]
+        if not positions:
             return None
 
+        # 构造回收站根路径（截取到回收站目录名为止）
+        return file_path[:min(positions) + 1 + len(self.delete_folder)]
+
     def handle_file_drop(self, source_path, target_path):
         """
         问题1修复：处理文件拖拽放置事件，支持批量移动
@@ -2833,16 +5058,16 @@ class FileManagerPanel(QWidget):
         """
         try:
             # 检查源和目标是否有效
-            if not os.path.exists(source_path):
-                logger.warning(f"源文件不存在: {source_path}")
+            source_stat = _stat_or_warn(source_path, "源文件不存在")
+            if source_stat is None:
                 return
 
-            if not os.path.exists(target_path):
-                logger.warning(f"目标文件夹不存在: {target_path}")
+            target_stat = _stat_or_warn(target_path, "目标文件夹不存在")
+            if target_stat is None:
                 return
 
-            # 检查目标是否是文件夹
-            if not os.path.isdir(target_path):
+            # 检查目标是否是文件夹（复用上面的 stat 结果）
+            if not stat.S_ISDIR(target_stat.st_mode):
                 target_path = os.path.dirname(target_path)
 
             # 检查是否是同一个位置
@@ -2850,39 +5075,51 @@ class FileManagerPanel(QWidget):
                 logger.debug("源文件和目标位置相同，无需移动")
                 return  # 相同目录，无需移动
 
-            # 检查目标是否是源的子目录（避免移动到自己的子目录中）
-            source_abs = os.path.abspath(source_path)
-            target_abs = os.path.abspath(target_path)
-            try:
-                common_path = os.path.commonpath([source_abs, target_abs])
-                if common_path == source_abs and source_path != target_path:
-                    logger.warning("不能将文件夹移动到自己的子目录中")
-                    return
-            except ValueError:
-                # 在不同的驱动器上，可以继续
-                pass
+            # 检查目标是否是源本身或其子目录（避免移动到自己的子目录中），不同驱动器上的路径前缀必然不同
+            source_abs = os.path.normcase(os.path.abspath(source_path))
+            target_abs = os.path.normcase(os.path.abspath(target_path))
+            if target_abs == source_abs or target_abs.startswith(os.path.join(source_abs, '')):
+                logger.warning("不能将文件夹移动到自己的子目录中")
+                return
 
-            # 执行移动操作（批量移动时不显示确认对话框）
-            try:
-                source_name = os.path.basename(source_path)
-                destination = os.path.join(target_path, source_name)
-
-                # 处理重名情况
-                counter = 1
-                base_name, ext = os.path.splitext(source_name)
-                while os.path.exists(destination):
-                    new_name = f"{base_name}_{counter}{ext}"
-                    destination = os.path.join(target_path, new_name)
-                    counter += 1
-
-                shutil.move(source_path, destination)
-                logger.info(f"移动文件: {source_path} -> {destination}")
-            except Exception as e:
-                QMessageBox.critical(self, "错误", f"移动文件失败: {str(e)}")
-                logger.error(f"移动文件失败: {str(e)}", exc_info=True)
+            # 记录待移动项（批量移动时不显示确认对话框），一次拖放结束后统一在工作线程中移动
+            self._pending_drops.append((source_path, target_path, stat.S_ISDIR(source_stat.st_mode)))
+        except Exception as e:
+            logger.error("处理文件拖拽放置事件时发生异常: %s", e, exc_info=True)
+
+    def _start_drop_moves(self):
+        """
+        一次拖放的所有项记录完毕后，在工作线程中执行移动；上一批仍在移动时等其完成后再开始
+        """
+        if not self._pending_drops or (self._drop_worker and self._drop_worker.isRunning()):
+            return
+        moves, self._pending_drops = self._pending_drops, []
+        self._drop_worker = DropMoveWorker(moves)
+        self._drop_worker.moves_finished.connect(self._on_drop_moves_finished)
+        self._drop_worker.start()
+
+    def _on_drop_moves_finished(self, completed, failures):
+        """
+        拖放移动完成：清除缓存、刷新视图并提示失败项
+
+        Args:
+            completed (list): 成功的 (源路径, 目标路径) 列表
+            failures (list): 失败的 (源路径, 错误信息) 列表
+        """
+        try:
+            self._invalidate_file_index()
+            for source_path, destination in completed:
+                self._invalidate_exists(source_path, destination)
+            self.refresh_view_keep_expanded()
+
+            if failures:
+                errors = [f"{os.path.basename(path)}: {error}" for path, error in failures]
+                QMessageBox.critical(self, "错误", _format_error_summary("移动文件失败", errors))
+
+            # 移动期间又有新的拖放
+            self._start_drop_moves()
         except Exception as e:
-            logger.error(f"处理文件拖拽放置事件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("处理拖放移动结果时发生异常: %s", e, exc_info=True)
 
     def create_new_folder(self, parent_path):
         """
@@ -2906,10 +5143,9 @@ class FileManagerPanel(QWidget):
                 return
 
             # 检查是否包含非法字符
-            illegal_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-            if any(char in folder_name for char in illegal_chars):
-                QMessageBox.warning(self, "警告", "文件夹名称包含非法字符!\n非法字符包括: / \\ : * ? \" < > |")
-                logger.warning(f"文件夹名称包含非法字符: {folder_name}")
+            if ILLEGAL_NAME_RE.search(folder_name):
+                QMessageBox.warning(self, "警告", f"文件夹名称包含非法字符!\n{ILLEGAL_NAME_CHARS_TEXT}")
+                logger.warning("文件夹名称包含非法字符: %s", folder_name)
                 return
 
             # 构造新文件夹路径
@@ -2918,22 +5154,22 @@ class FileManagerPanel(QWidget):
             # 检查文件夹是否已存在
             if os.path.exists(new_folder_path):
                 QMessageBox.warning(self, "警告", f"文件夹 '{folder_name}' 已存在!")
-                logger.warning(f"文件夹已存在: {new_folder_path}")
+                logger.warning("文件夹已存在: %s", new_folder_path)
                 return
 
             try:
                 # 创建新文件夹
                 os.makedirs(new_folder_path)
-                logger.info(f"创建新文件夹: {new_folder_path}")
+                self._invalidate_exists(new_folder_path)
+                logger.info("创建新文件夹: %s", new_folder_path)
 
                 # 问题1修复：刷新视图并保持展开状态
-                self.refresh_view_keep_expanded()
+                self._schedule_refresh()
             except Exception as e:
                 QMessageBox.critical(self, "错误", f"创建文件夹失败: {str(e)}")
-                logger.error(f"创建文件夹失败: {str(e)}", exc_info=True)
+                logger.error("创建文件夹失败: %s", e, exc_info=True)
         except Exception as e:
-            logger.error(f"创建新文件夹时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("创建新文件夹时发生异常: %s", e, exc_info=True)
             QMessageBox.critical(self, "错误", f"创建新文件夹时发生异常: {str(e)}")
 
     def upload_files(self, local_path):
@@ -2996,46 +5232,11 @@ class FileManagerPanel(QWidget):
                         return
                     dialog.exec()
 
-            logger.info(f"上传文件: {local_path}")
+            logger.info("上传文件: %s", local_path)
         except Exception as e:
-            logger.error(f"上传文件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("上传文件时发生异常: %s", e, exc_info=True)
             QMessageBox.critical(self, "错误", f"上传文件时发生异常: {str(e)}")
 
-    def keyPressEvent(self, a0):
-        """
-        处理键盘按键事件
-
-        Args:
-            a0: 键盘事件
-        """
-        try:
-            # 检查是否是回车键
-            if a0 and a0.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
-                # 如果有确认对话框打开，则模拟点击"是"按钮
-                focused_widget = self.focusWidget()
-                if isinstance(focused_widget, QMessageBox):
-                    yes_button = focused_widget.button(QMessageBox.Yes)
-                    if yes_button and yes_button.isEnabled():
-                        yes_button.click()
-                        return
-
-            # 检查是否是ESC键
-            elif a0 and a0.key() == Qt.Key.Key_Escape:
-                # 如果有确认对话框打开，则模拟点击"否"按钮
-                focused_widget = self.focusWidget()
-                if isinstance(focused_widget, QMessageBox):
-                    no_button = focused_widget.button(QMessageBox.No)
-                    if no_button and no_button.isEnabled():
-                        no_button.click()
-                        return
-
-            # 调用父类的处理方法
-            super().keyPressEvent(a0)
-        except Exception as e:
-            logger.error(f"处理键盘按键事件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
-
     def is_supported_file(self, file_path):
         """
         检查文件是否支持预览
@@ -3046,89 +5247,121 @@ class FileManagerPanel(QWidget):
         Returns:
             bool: 如果文件支持预览返回True，否则返回False
         """
-        try:
-            if not os.path.isfile(file_path):
-                return False
-
-            # 获取文件扩展名
-            _, ext = os.path.splitext(file_path)
-            ext = ext.lower()
-
-            # 支持的文件格式列表
-            supported_formats = [
-                '.jpg', '.jpeg', '.png', '.bmp', '.gif',  # 图片格式
-                '.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv'  # 视频格式
-            ]
-
-            return ext in supported_formats
-        except Exception as e:
-            logger.error(f"检查文件是否支持预览时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
-            return False
+        # 先做不需要 I/O 的扩展名判断，只有扩展名受支持时才检查是否为文件（isfile 出错时返回False，不会抛出）
+        return _is_supported_ext(file_path) and os.path.isfile(file_path)
 
     def get_supported_files_list(self):
         """
         获取所有支持预览的文件列表，按照文件树中的显示顺序
 
+        结果会缓存到文件系统发生变化（_invalidate_file_index）为止；缓存失效后在工作线程中重新遍历，
+        遍历完成前返回上一次的结果，完成后发出 supported_files_ready 信号
+
         Returns:
             list: 支持预览的文件路径列表
         """
         try:
-            if not self.ui or not self.ui.model or not self.ui.proxy_model or not self.ui.tree_view:
-                return []
+            if self._supported_files_cache is not None:
+                return self._supported_files_cache
 
-            supported_files = []
+            if not self.ui or not self.ui.model or not self.ui.tree_view:
+                return []
 
-            # 从树视图的根索引开始遍历
-            root_index = self.ui.tree_view.rootIndex()
-            self._collect_supported_files_recursive(self.ui.proxy_model, self.ui.model, root_index, supported_files)
+            if self.ui.proxy_model:
+                # 从树视图的根索引开始遍历
+                supported_files = []
+                root_index = self.ui.tree_view.rootIndex()
+                self._collect_supported_files_recursive(self.ui.proxy_model, self.ui.model, root_index, supported_files)
+                return self._cache_supported_files(supported_files)
 
-            return supported_files
+            self._start_supported_files_worker()
+            return self._stale_supported_files
         except Exception as e:
-            logger.error(f"获取支持的文件列表时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("获取支持的文件列表时发生异常: %s", e, exc_info=True)
             return []
 
+    def _start_supported_files_worker(self):
+        """
+        在工作线程中遍历导入根路径，已有遍历在进行时等其结束后按需重新开始
+        """
+        if self._supported_files_worker is not None and self._supported_files_worker.isRunning():
+            return
+        self._supported_files_worker = SupportedFilesWorker(
+            self.imported_root_paths, self.delete_folder, self._file_index_generation)
+        self._supported_files_worker.files_ready.connect(self._on_supported_files_ready)
+        self._supported_files_worker.finished.connect(self._on_supported_files_worker_finished)
+        self._supported_files_worker.start()
+
+    def _on_supported_files_ready(self, generation, supported_files):
+        """
+        后台遍历完成，遍历期间文件索引已失效时丢弃结果
+
+        Args:
+            generation (int): 开始遍历时的文件索引版本
+            supported_files (list): 支持预览的文件路径列表
+        """
+        if generation != self._file_index_generation:
+            return
+        self._cache_supported_files(supported_files)
+        self.supported_files_ready.emit()
+
+    def _on_supported_files_worker_finished(self):
+        """
+        工作线程结束，遍历期间文件索引已失效时重新遍历
+        """
+        worker = self._supported_files_worker
+        if worker is not None and worker.generation != self._file_index_generation:
+            self._start_supported_files_worker()
+
+    def _cache_supported_files(self, supported_files):
+        """
+        缓存支持预览的文件列表并建立路径到下标的映射
+
+        Args:
+            supported_files (list): 支持预览的文件路径列表
+
+        Returns:
+            list: 传入的文件列表
+        """
+        self._supported_files_cache = supported_files
+        self._stale_supported_files = supported_files
+        self._supported_files_index = {file_path: pos for pos, file_path in enumerate(supported_files)}
+        return supported_files
+
     def _collect_supported_files_recursive(self, proxy_model, source_model, proxy_index, supported_files):
         """
-        递归收集支持预览的文件
+        以显式栈前序遍历代理模型，收集支持预览的文件（不使用递归）
 
         Args:
             proxy_model: 代理模型
             source_model: 源文件系统模型
-            proxy_index: 当前代理索引
+            proxy_index: 起始代理索引，无效时从根索引下的所有子项开始
             supported_files: 支持的文件列表
         """
         try:
-            # 如果索引无效，获取根索引下的所有子项
-            if not proxy_index.isValid():
-                # 遍历根索引下的所有行
-                row_count = proxy_model.rowCount()
-                for row in range(row_count):
-                    child_proxy_index = proxy_model.index(row, 0)
-                    self._collect_supported_files_recursive(proxy_model, source_model, child_proxy_index, supported_files)
-                return
+            if proxy_index.isValid():
+                stack = [proxy_index]
+            else:
+                stack = [proxy_model.index(row, 0) for row in range(proxy_model.rowCount() - 1, -1, -1)]
 
-            # 将代理索引映射到源索引
-            source_index = proxy_model.mapToSource(proxy_index)
-            if not source_index.isValid():
-                return
+            while stack:
+                index = stack.pop()
 
-            # 获取文件路径
-            file_path = source_model.filePath(source_index)
+                # 将代理索引映射到源索引
+                source_index = proxy_model.mapToSource(index)
+                if not source_index.isValid():
+                    continue
 
-            # 检查是否是文件且支持预览
-            if os.path.isfile(file_path) and self.is_supported_file(file_path):
-                supported_files.append(file_path)
+                # 检查是否是文件且支持预览，文件类型使用模型已缓存的信息
+                file_path = source_model.filePath(source_index)
+                if not source_model.isDir(source_index) and _is_supported_ext(file_path):
+                    supported_files.append(file_path)
 
-            # 递归处理子项
-            rows = proxy_model.rowCount(proxy_index)
-            for row in range(rows):
-                child_index = proxy_model.index(row, 0, proxy_index)
-                self._collect_supported_files_recursive(proxy_model, source_model, child_index, supported_files)
+                # 子项逆序入栈，保证按行顺序出栈
+                for row in range(proxy_model.rowCount(index) - 1, -1, -1):
+                    stack.append(proxy_model.index(row, 0, index))
         except Exception as e:
-            logger.error(f"递归收集支持的文件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("收集支持的文件时发生异常: %s", e, exc_info=True)
 
     def get_current_file_position_info(self, file_path):
         """
@@ -3145,18 +5378,15 @@ class FileManagerPanel(QWidget):
             supported_files = self.get_supported_files_list()
 
             # 查找当前文件在列表中的位置
-            try:
-                current_position = supported_files.index(file_path) + 1  # 位置从1开始计数
-            except ValueError:
-                current_position = -1
+            pos = (self._supported_files_index or {}).get(file_path)
+            current_position = pos + 1 if pos is not None else -1  # 位置从1开始计数
 
             return {
                 'current_position': current_position,
                 'total_files': len(supported_files)
             }
         except Exception as e:
-            logger.error(f"获取当前文件位置信息时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("获取当前文件位置信息时发生异常: %s", e, exc_info=True)
             return {
                 'current_position': -1,
                 'total_files': 0
@@ -3187,13 +5417,12 @@ class FileManagerPanel(QWidget):
             file_path = self.ui.model.filePath(source_index)
 
             # 检查是否是文件且支持预览
-            if os.path.isfile(file_path) and self.is_supported_file(file_path):
+            if self.is_supported_file(file_path):
                 return file_path
 
             return None
         except Exception as e:
-            logger.error(f"获取当前选中文件时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("获取当前选中文件时发生异常: %s", e, exc_info=True)
             return None
 
     def rename_file_or_folder(self, file_path):
@@ -3219,10 +5448,9 @@ class FileManagerPanel(QWidget):
                 return
 
             # 检查是否包含非法字符
-            illegal_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-            if any(char in new_name for char in illegal_chars):
-                QMessageBox.warning(self, "警告", "名称包含非法字符!\n非法字符包括: / \\ : * ? \" < > |")
-                logger.warning(f"重命名名称包含非法字符: {new_name}")
+            if ILLEGAL_NAME_RE.search(new_name):
+                QMessageBox.warning(self, "警告", f"名称包含非法字符!\n{ILLEGAL_NAME_CHARS_TEXT}")
+                logger.warning("重命名名称包含非法字符: %s", new_name)
                 return
 
             # 检查新名称是否与旧名称相同
@@ -3234,43 +5462,43 @@ class FileManagerPanel(QWidget):
             parent_dir = os.path.dirname(file_path)
             new_path = os.path.join(parent_dir, new_name)
 
-            # 检查目标是否已存在
-            if os.path.exists(new_path):
-                QMessageBox.warning(self, "警告", f"名称 '{new_name}' 已存在!")
-                logger.warning(f"重命名目标已存在: {new_path}")
-                return
-
             try:
                 # Bug修复：检查是否重命名的是已导入的根路径
-                is_imported_root = file_path in self.imported_root_paths
-                
-                # 执行重命名操作
+                imported_root = self._normalized_roots.get(_path_parts(file_path))
+
+                # 执行重命名操作：Windows 上目标已存在时 os.rename 直接失败，不需要预先检查；
+                # POSIX 上 os.rename 会覆盖已存在的文件，仍需先检查目标
+                if os.name != 'nt' and os.path.lexists(new_path):
+                    raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), new_path)
                 os.rename(file_path, new_path)
-                logger.info(f"重命名: {file_path} -> {new_path}")
+                self._invalidate_exists(file_path, new_path)
+                logger.info("重命名: %s -> %s", file_path, new_path)
 
                 # Bug修复：如果重命名的是已导入的根路径，需要同步更新导入路径列表和持久化存储
-                if is_imported_root:
-                    # 从持久化存储中移除旧路径
-                    self.ui.remove_imported_path(file_path)
+                if imported_root is not None:
+                    # 从持久化存储中移除旧路径（使用导入时记录的原始写法）
+                    self.ui.remove_imported_path(imported_root)
                     # 从导入路径列表中移除旧路径
-                    if file_path in self.imported_root_paths:
-                        self.imported_root_paths.remove(file_path)
+                    self.imported_root_paths.remove(imported_root)
                     
                     # 添加新路径到导入列表
                     self.imported_root_paths.append(new_path)
+                    self._update_root_map()
                     # 保存新路径到持久化存储
                     self.ui.save_imported_path(new_path)
                     
-                    logger.info(f"已导入根路径重命名同步完成: {file_path} -> {new_path}")
+                    logger.info("已导入根路径重命名同步完成: %s -> %s", file_path, new_path)
 
                 # 刷新视图并保持展开状态
-                self.refresh_view_keep_expanded()
+                self._schedule_refresh()
+            except FileExistsError:
+                QMessageBox.warning(self, "警告", f"名称 '{new_name}' 已存在!")
+                logger.warning("重命名目标已存在: %s", new_path)
             except Exception as e:
                 QMessageBox.critical(self, "错误", f"重命名失败: {str(e)}")
-                logger.error(f"重命名失败: {str(e)}", exc_info=True)
+                logger.error("重命名失败: %s", e, exc_info=True)
         except Exception as e:
-            logger.error(f"重命名文件或文件夹时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("重命名文件或文件夹时发生异常: %s", e, exc_info=True)
             QMessageBox.critical(self, "错误", f"重命名文件或文件夹时发生异常: {str(e)}")
 
     def algorithm_test(self, file_path):
@@ -3293,75 +5521,82 @@ class FileManagerPanel(QWidget):
             self.algorithm_test_dialog.switch_to_next.connect(self.on_algorithm_test_next)
 
             # 显示对话框
-            self.algorithm_test_dialog.exec_()
+            self._algo_test_dir_cache = None
+            try:
+                self.algorithm_test_dialog.exec_()
+            finally:
+                # 对话框关闭后目录列表不再需要
+                self._algo_test_dir_cache = None
 
             # 问题2修复：对话框关闭后保持展开状态（只刷新不改变展开）
             # 注意：这里不需要刷新，因为算法测试只是预览，不会修改文件系统
 
-            logger.info(f"算法测试完成: {file_path}")
+            logger.info("算法测试完成: %s", file_path)
         except Exception as e:
-            logger.error(f"算法测试时发生异常: {str(e)}")
-            logger.error(f"异常详情:\n{traceback.format_exc()}")
+            logger.error("算法测试时发生异常: %s", e, exc_info=True)
             QMessageBox.critical(self, "错误", f"算法测试时发生异常: {str(e)}")
 
+    def _get_algorithm_test_files(self, current_dir):
+        """
+        获取算法测试目录下排序后的支持文件列表，同一目录只扫描一次
+
+        Args:
+            current_dir (str): 当前文件所在目录
+
+        Returns:
+            tuple: (排序后的文件路径列表, 文件路径 -> 位置的字典)
+        """
+        cache = self._algo_test_dir_cache
+        if cache is not None and cache[0] == current_dir:
+            return cache[1], cache[2]
+
+        # DirEntry.is_file() 通常可直接使用目录项类型，无需再逐个 stat
+        files = []
+        try:
+            with os.scandir(current_dir) as it:
+                for entry in it:
+                    if _is_supported_ext(entry.name) and entry.is_file():
+                        files.append(entry.path)
+        except OSError as e:
+            logger.error("读取算法测试目录失败: %s, %s", current_dir, e)
+            return [], {}
+
+        files.sort()
+        positions = {file_path: i for i, file_path in enumerate(files)}
+        self._algo_test_dir_cache = (current_dir, files, positions)
+        return files, positions
+
+    def _switch_algorithm_test_file(self, step):
+        """
+        在算法测试面板中切换到当前目录的相邻文件
+
+        Args:
+            step (int): -1 为上一个，1 为下一个
+        """
+        if not getattr(self, 'algorithm_test_dialog', None):
+            return
+
+        current_file_path = self.algorithm_test_dialog.current_file_path
+        files, positions = self._get_algorithm_test_files(os.path.dirname(current_file_path))
+        current_index = positions.get(current_file_path)
+        if current_index is None:
+            # 当前文件不在列表中
+            return
+
+        target_index = current_index + step
+        if 0 <= target_index < len(files):
+            self.algorithm_test_dialog.set_current_file(files[target_index])
+
     def on_algorithm_test_prev(self):
         """
         处理算法测试面板的上一张请求
         """
-        # 发射信号通知主窗口切换到上一张资源，但不直接操作文件管理器的选择
-        # 这样可以避免影响主预览面板
-        if hasattr(self, 'algorithm_test_dialog') and self.algorithm_test_dialog:
-            # 获取当前文件所在目录的文件列表
-            current_dir = os.path.dirname(self.algorithm_test_dialog.current_file_path)
-            if os.path.exists(current_dir):
-                # 获取支持的文件列表
-                files = []
-                for f in os.listdir(current_dir):
-                    file_path = os.path.join(current_dir, f)
-                    if os.path.isfile(file_path) and self.is_supported_file(file_path):
-                        files.append(file_path)
-
-                # 排序文件列表
-                files.sort()
-
-                # 找到当前文件的索引
-                try:
-                    current_index = files.index(self.algorithm_test_dialog.current_file_path)
-                    # 切换到上一个文件
-                    if current_index > 0:
-                        prev_file = files[current_index - 1]
-                        self.algorithm_test_dialog.set_current_file(prev_file)
-                except ValueError:
-                    # 当前文件不在列表中
-                    pass
+        # 只在算法测试面板内部切换，不操作文件管理器的选择，避免影响主预览面板
+        self._switch_algorithm_test_file(-1)
 
     def on_algorithm_test_next(self):
         """
         处理算法测试面板的下一张请求
         """
-        # 发射信号通知主窗口切换到下一张资源，但不直接操作文件管理器的选择
-        # 这样可以避免影响主预览面板
-        if hasattr(self, 'algorithm_test_dialog') and self.algorithm_test_dialog:
-            # 获取当前文件所在目录的文件列表
-            current_dir = os.path.dirname(self.algorithm_test_dialog.current_file_path)
-            if os.path.exists(current_dir):
-                # 获取支持的文件列表
-                files = []
-                for f in os.listdir(current_dir):
-                    file_path = os.path.join(current_dir, f)
-                    if os.path.isfile(file_path) and self.is_supported_file(file_path):
-                        files.append(file_path)
-
-                # 排序文件列表
-                files.sort()
-
-                # 找到当前文件的索引
-                try:
-                    current_index = files.index(self.algorithm_test_dialog.current_file_path)
-                    # 切换到下一个文件
-                    if current_index < len(files) - 1:
-                        next_file = files[current_index + 1]
-                        self.algorithm_test_dialog.set_current_file(next_file)
-                except ValueError:
-                    # 当前文件不在列表中
-                    pass
+        # 只在算法测试面板内部切换，不操作文件管理器的选择，避免影响主预览面板
+        self._switch_algorithm_test_file(1)
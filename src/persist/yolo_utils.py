@@ -1,5 +1,6 @@
 import os
 import cv2
+import numpy as np
 from PyQt5.QtCore import QRect, QPoint
 
 
@@ -42,29 +43,42 @@ def save_yolo_annotations(file_path, image_label, class_names):
     base_name = os.path.splitext(os.path.basename(file_path))[0]
     annotation_file = os.path.join(labels_dir, f"{base_name}.txt")
     
+    # 按标注顺序生成每一行，矩形的归一化坐标用数组一次算出
+    lines = []
+    rect_rows = []
+    rect_positions = []
+    for annotation in annotations:
+        if annotation['type'] == 'rectangle' and annotation.get('label'):
+            # 获取类别ID
+            class_id = _get_class_id(annotation['label'], class_names)
+            rect = annotation['rectangle']
+            rect_rows.append((class_id, rect.x(), rect.y(), rect.width(), rect.height()))
+            rect_positions.append(len(lines))
+            lines.append(None)
+        elif annotation['type'] == 'polygon' and annotation.get('label'):
+            # 获取类别ID
+            class_id = _get_class_id(annotation['label'], class_names)
+            
+            # 多边形格式: class_id 0 points_count x1 y1 x2 y2 ...
+            points = annotation['points']
+            coords = np.array([(p.x(), p.y()) for p in points], dtype=np.float64).reshape(-1, 2)
+            coords /= (img_width, img_height)
+            points_str = ' '.join(['%.6f' % value for value in coords.ravel().tolist()])
+            lines.append(f"{class_id} 0 {len(points)} {points_str}\n")
+    
+    if rect_rows:
+        # 计算YOLO格式的坐标 (中心点x, 中心点y, 宽度, 高度，都是归一化值)
+        arr = np.array(rect_rows, dtype=np.float64)
+        arr[:, 1] = (arr[:, 1] + arr[:, 3] / 2) / img_width
+        arr[:, 2] = (arr[:, 2] + arr[:, 4] / 2) / img_height
+        arr[:, 3] /= img_width
+        arr[:, 4] /= img_height
+        # YOLO格式: class_id x_center y_center width height
+        for position, row in zip(rect_positions, arr.tolist()):
+            lines[position] = '%d %.6f %.6f %.6f %.6f\n' % tuple(row)
+    
     with open(annotation_file, 'w', encoding='utf-8') as f:
-        for annotation in annotations:
-            if annotation['type'] == 'rectangle' and annotation.get('label'):
-                # 获取类别ID
-                class_id = _get_class_id(annotation['label'], class_names)
-                
-                # 计算YOLO格式的坐标 (中心点x, 中心点y, 宽度, 高度，都是归一化值)
-                rect = annotation['rectangle']
-                x_center = (rect.x() + rect.width() / 2) / img_width
-                y_center = (rect.y() + rect.height() / 2) / img_height
-                width = rect.width() / img_width
-                height = rect.height() / img_height
-                
-                # 写入YOLO格式: class_id x_center y_center width height
-                f.write(f"{class_id} {x_center:.6f} {y_center:.6f} {width:.6f} {height:.6f}\n")
-            elif annotation['type'] == 'polygon' and annotation.get('label'):
-                # 获取类别ID
-                class_id = _get_class_id(annotation['label'], class_names)
-                
-                # 写入多边形格式: class_id 0 points_count x1 y1 x2 y2 ...
-                points = annotation['points']
-                points_str = ' '.join([f"{p.x() / img_width:.6f} {p.y() / img_height:.6f}" for p in points])
-                f.write(f"{class_id} 0 {len(points)} {points_str}\n")
+        f.write(''.join(lines))
 
 
 def load_yolo_annotations(file_path, class_names, annotation_file=None):
@@ -108,7 +122,6 @@ def load_yolo_annotations(file_path, class_names, annotation_file=None):
         # 如果cv2.imread失败（通常是中文路径问题），使用cv2.imdecode
         if img is None:
             # 使用numpy和cv2.imdecode来处理中文路径
-            import numpy as np
             with open(normalized_path, 'rb') as f:
                 img_data = np.frombuffer(f.read(), np.uint8)
                 img = cv2.imdecode(img_data, cv2.IMREAD_COLOR)
@@ -166,6 +166,9 @@ class MainWindow(QMainWindow):
             
             # 连接文件管理器的文件选中信号到窗口标题更新
             self.file_manager_panel.events.file_selected.connect(self.on_file_manager_file_selected)
+
+            # 文件列表在后台重新遍历完成后更新窗口标题中的位置信息
+            self.file_manager_panel.supported_files_ready.connect(self.on_supported_files_ready)
         except Exception as e:
             logger.error(f"设置信号与槽连接时发生异常: {str(e)}")
             logger.error(f"异常详情:\n{traceback.format_exc()}")
@@ -187,6 +190,18 @@ class MainWindow(QMainWindow):
             logger.error(f"处理文件管理器文件选中事件时发生异常: {str(e)}")
             logger.error(f"异常详情:\n{traceback.format_exc()}")
 
+    def on_supported_files_ready(self):
+        """
+        文件管理器的文件列表已更新，刷新当前选中文件在窗口标题中的位置
+        """
+        try:
+            file_path = self.file_manager_panel.ui.get_selected_path()
+            if file_path and os.path.isfile(file_path):
+                self.update_window_title(file_path)
+        except Exception as e:
+            logger.error(f"更新窗口标题时发生异常: {str(e)}")
+            logger.error(f"异常详情:\n{traceback.format_exc()}")
+
     def create_menu_bar(self):
         """
         创建菜单栏